@@ -0,0 +1,229 @@
+#!/usr/bin/env python
+
+import argparse
+import concurrent.futures
+import json
+import os
+import platform
+import subprocess
+import sys
+import time
+
+import rijndael_fast
+import rijndael_slow
+import salsa20
+import sha3_fast
+import sha3_slow
+import twofish_fast
+import twofish_slow
+
+class BenchError(Exception):
+    pass
+
+def _blocks(encrypt, block_sz):
+    # Bulk encryption for implementations that only expose a single block primitive
+    def run(ctx, data):
+        f = encrypt.__get__(ctx)
+        for i in range(0, len(data), block_sz):
+            f(data[i:i+block_sz])
+    return run
+
+def _hash(ctx, data):
+    ctx.update(data)
+    ctx.finish()
+
+# Every benchmarked primitive: constructor, key size, single block size, bulk input alignment and operations.
+# "bulk" is ECB for the block ciphers, the fast ones also have a "ctr" operation.
+TARGETS = [
+        {
+            "name" : "aes", "impl" : "slow", "setup" : rijndael_slow.Rijndael, "key_sz" : 16, "block_sz" : 16, "align" : 16,
+            "block" : rijndael_slow.Rijndael.encrypt, "bulk" : _blocks(rijndael_slow.Rijndael.encrypt, 16),
+            },
+        {
+            "name" : "aes", "impl" : "fast", "setup" : rijndael_fast.Rijndael, "key_sz" : 16, "block_sz" : 16, "align" : 16,
+            "block" : rijndael_fast.Rijndael.encrypt, "bulk" : lambda ctx, data: ctx.encrypt_ecb(data, padding=False),
+            "ctr" : lambda ctx, data: ctx.encrypt_ctr(bytes(16), data),
+            },
+        {
+            "name" : "twofish", "impl" : "slow", "setup" : twofish_slow.Twofish, "key_sz" : 16, "block_sz" : 16, "align" : 16,
+            "block" : twofish_slow.Twofish.encrypt, "bulk" : _blocks(twofish_slow.Twofish.encrypt, 16),
+            },
+        {
+            "name" : "twofish", "impl" : "fast", "setup" : twofish_fast.Twofish, "key_sz" : 16, "block_sz" : 16, "align" : 16,
+            "block" : twofish_fast.Twofish.encrypt, "bulk" : lambda ctx, data: ctx.encrypt_ecb(data, padding=False),
+            "ctr" : lambda ctx, data: ctx.encrypt_ctr(bytes(16), data),
+            },
+        {
+            "name" : "salsa20", "impl" : "fast", "setup" : lambda key: salsa20.Salsa20(key, bytes(8)), "key_sz" : 32, "block_sz" : 64, "align" : 1,
+            "block" : salsa20.Salsa20.encrypt, "bulk" : salsa20.Salsa20.encrypt,
+            },
+        {
+            "name" : "sha3-256", "impl" : "slow", "setup" : lambda key: sha3_slow.SHA3(256), "key_sz" : 0, "block_sz" : 136, "align" : 1,
+            "block" : _hash, "bulk" : _hash,
+            },
+        {
+            "name" : "sha3-256", "impl" : "fast", "setup" : lambda key: sha3_fast.SHA3(256), "key_sz" : 0, "block_sz" : 136, "align" : 1,
+            "block" : _hash, "bulk" : _hash,
+            },
+        ]
+
+SIZES = [ 16, 256, 4 << 10, 64 << 10, 1 << 20, 16 << 20, 64 << 20 ]
+
+def measure(f, warmup, repeat, budget_ns):
+    # Run f warmup times untimed, then up to repeat times or until the time budget is spent
+    for i in range(warmup):
+        f()
+
+    samples = []
+    deadline = time.perf_counter_ns() + budget_ns
+
+    while (len(samples) < repeat) and ((len(samples) < 3) or (time.perf_counter_ns() < deadline)):
+        start = time.perf_counter_ns()
+        f()
+        samples.append(time.perf_counter_ns() - start)
+
+    return summarize(samples)
+
+def summarize(samples):
+    samples = sorted(samples)
+
+    def percentile(p):
+        return samples[min(len(samples) - 1, (len(samples) * p) // 100)]
+
+    return {
+            "n" : len(samples),
+            "min_ns" : samples[0],
+            "median_ns" : percentile(50),
+            "p10_ns" : percentile(10),
+            "p90_ns" : percentile(90),
+            "p99_ns" : percentile(99),
+            "mean_ns" : sum(samples) // len(samples),
+            }
+
+def run(targets, sizes, warmup, repeat, budget_ns):
+    results = []
+
+    for target in targets:
+        key = os.urandom(target["key_sz"])
+        ctx = target["setup"](key)
+
+        stats = measure(lambda: target["setup"](key), warmup, repeat, budget_ns)
+        results.append(dict(name=target["name"], impl=target["impl"], op="key_setup", size=target["key_sz"], **stats))
+
+        block = os.urandom(target["block_sz"])
+        stats = measure(lambda: target["block"](ctx, block), warmup, repeat, budget_ns)
+        results.append(dict(name=target["name"], impl=target["impl"], op="block", size=target["block_sz"], **stats))
+
+        for op in [ op for op in [ "bulk", "ctr" ] if op in target ]:
+            estimate = 0
+            for (i, size) in enumerate(sizes):
+                # Skip the sizes that would not fit a single run in the budget
+                if estimate > budget_ns:
+                    print("%-10s %-5s %-4s %10d skipped" % (target["name"], target["impl"], op, size), file=sys.stderr)
+                    continue
+
+                data = os.urandom(max(target["align"], size - (size % target["align"])))
+                stats = measure(lambda: target[op](ctx, data), 1 if size < (1 << 20) else 0, repeat, budget_ns)
+                stats["mb_s"] = (len(data) / (1 << 20)) / (stats["median_ns"] / (10 ** 9))
+                results.append(dict(name=target["name"], impl=target["impl"], op=op, size=len(data), **stats))
+
+                if i + 1 < len(sizes):
+                    estimate = stats["median_ns"] * sizes[i + 1] // len(data)
+
+    return results
+
+# Run in a fresh interpreter: cost of importing the modules given on the command line
+_STARTUP_PROBE = """
+import importlib, os, sys, time
+
+def rss():
+    with open("/proc/self/statm") as f:
+        return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+
+before = rss()
+start = time.perf_counter_ns()
+for module in sys.argv[1:]:
+    importlib.import_module(module)
+print(time.perf_counter_ns() - start, rss() - before)
+"""
+
+def startup(modules, workers):
+    # Import time and RSS growth of the modules, over a pool of fresh worker processes
+    def probe(i):
+        out = subprocess.run([ sys.executable, "-c", _STARTUP_PROBE ] + modules, check=True, capture_output=True, text=True,
+                             cwd=os.path.dirname(os.path.abspath(__file__))).stdout.split()
+        return (int(out[0]), int(out[1]))
+
+    with concurrent.futures.ThreadPoolExecutor(os.cpu_count() or 1) as pool:
+        samples = list(pool.map(probe, range(workers)))
+
+    stats = summarize([ ns for (ns, rss) in samples ])
+    stats["rss_median"] = sorted([ rss for (ns, rss) in samples ])[len(samples) // 2]
+    stats["rss_total"] = sum([ rss for (ns, rss) in samples ])
+
+    return stats
+
+def report(results, baseline=None):
+    # Index the baseline results, to print the ratio against the previous run
+    base = { }
+    for r in (baseline or { "results" : [] })["results"]:
+        base[(r["name"], r["impl"], r["op"], r["size"])] = r
+
+    for r in results:
+        line = "%-10s %-5s %-9s %10d  median %12.0f ns  p90 %12.0f ns" % (r["name"], r["impl"], r["op"], r["size"], r["median_ns"], r["p90_ns"])
+        if "mb_s" in r:
+            line += "  %9.3f MB/s" % r["mb_s"]
+
+        old = base.get((r["name"], r["impl"], r["op"], r["size"]))
+        if old is not None:
+            line += "  x%.2f" % (old["median_ns"] / r["median_ns"])
+
+        print(line)
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark key setup, block latency and bulk throughput")
+    parser.add_argument("--only", nargs="*", help="primitives to run (aes, twofish, salsa20, sha3-256)")
+    parser.add_argument("--impl", nargs="*", choices=[ "slow", "fast" ], help="implementations to run")
+    parser.add_argument("--sizes", nargs="*", type=int, default=SIZES, help="bulk sizes in bytes")
+    parser.add_argument("--warmup", type=int, default=3, help="untimed runs before measuring")
+    parser.add_argument("--repeat", type=int, default=50, help="maximum timed runs per measurement")
+    parser.add_argument("--budget", type=float, default=2.0, help="time budget per measurement in seconds")
+    parser.add_argument("--json", help="write the results to this file")
+    parser.add_argument("--compare", help="previous JSON results to compare against")
+    parser.add_argument("--startup", type=int, metavar="WORKERS", help="only measure import time and RSS over this many fresh worker processes")
+    args = parser.parse_args(argv)
+
+    if args.startup:
+        modules = [ "rijndael_fast", "twofish_fast", "sha3_fast", "salsa20" ]
+        stats = startup(modules, args.startup)
+        print("import %s: median %.3f ms  p90 %.3f ms  RSS median %d KiB  RSS total %d KiB over %d workers" % (
+            ", ".join(modules), stats["median_ns"] / (10 ** 6), stats["p90_ns"] / (10 ** 6), stats["rss_median"] // 1024, stats["rss_total"] // 1024, args.startup))
+        return 0
+
+    targets = [ t for t in TARGETS if ((not args.only) or (t["name"] in args.only)) and ((not args.impl) or (t["impl"] in args.impl)) ]
+    if not targets:
+        raise BenchError("Nothing to benchmark")
+
+    results = run(targets, sorted(args.sizes), args.warmup, args.repeat, int(args.budget * (10 ** 9)))
+
+    baseline = None
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = json.load(f)
+
+    report(results, baseline)
+
+    if args.json:
+        meta = {
+                "python" : platform.python_version(),
+                "implementation" : platform.python_implementation(),
+                "machine" : platform.machine(),
+                "timestamp" : int(time.time()),
+                }
+        with open(args.json, "w") as f:
+            json.dump({ "meta" : meta, "results" : results }, f, indent=1)
+
+    return 0
+
+if __name__ == "__main__":
+    exit(main())
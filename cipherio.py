@@ -0,0 +1,342 @@
+#!/usr/bin/env python
+
+import io
+import os
+import time
+
+import salsa20
+
+class CipherIOError(Exception):
+    pass
+
+# Bytes read from the wrapped file at once, a multiple of every block size
+CHUNK_SZ = 64 << 10
+
+class CTRStream:
+    # Counter mode over any context with _ctr_blocks() (rijndael_fast, twofish_fast), for pieces of any length
+    def __init__(self, ctx, counter):
+        # Rijndael contexts may have wider blocks
+        if getattr(ctx, "_nb", 4) != 4:
+            raise CipherIOError("Block length must be 16 bytes")
+
+        if len(counter) != 16:
+            raise CipherIOError("Counter length must be 16 bytes")
+
+        self._ctx = ctx
+        self._ctr = int.from_bytes(counter, byteorder="big")
+        self._ks = b""
+
+    def update(self, data):
+        out = bytearray(len(data))
+        self.update_into(data, out)
+        return out
+
+    def update_into(self, src, dst):
+        # dst may be src itself
+        src = memoryview(src)
+        dst = memoryview(dst)
+
+        # Use the keystream left over from the previous call first
+        used = min(len(self._ks), len(src))
+        for i in range(used):
+            dst[i] = src[i] ^ self._ks[i]
+        self._ks = self._ks[used:]
+
+        full_sz = used + ((len(src) - used) & ~0xf)
+        self._ctr = self._ctx._ctr_blocks(src[used:full_sz], dst[used:full_sz], self._ctr)
+
+        if full_sz < len(src):
+            ks = bytearray(16)
+            self._ctr = self._ctx._ctr_blocks(bytes(16), ks, self._ctr)
+            for i in range(full_sz, len(src)):
+                dst[i] = src[i] ^ ks[i - full_sz]
+            self._ks = ks[len(src) - full_sz:]
+
+    def finalize(self):
+        return bytearray()
+
+class BlockStream:
+    # ECB or CBC with PKCS#7 padding, or CTR through CTRStream, over any 128 bits block cipher context with
+    # _encrypt_blocks(), _decrypt_blocks() and _ctr_blocks() (rijndael_fast, twofish_fast). Errors are raised
+    # as Error, which a cipher module may override with its own class.
+    Error = CipherIOError
+
+    def __init__(self, ctx, mode, iv, decrypt=False, padding=True):
+        if not mode in [ "ecb", "cbc", "ctr" ]:
+            raise self.Error("Mode not supported")
+
+        if getattr(ctx, "_nb", 4) != 4:
+            raise self.Error("Block length must be 16 bytes")
+
+        if ("ecb" != mode) and (len(iv) != 16):
+            raise self.Error("IV length must be 16 bytes")
+
+        self._ctx = ctx
+        self._mode = mode
+        self._decrypt = decrypt
+        self._padding = padding and ("ctr" != mode)
+
+        self._iv = bytes(iv) if ("cbc" == mode) else None
+        self._ctr = CTRStream(ctx, iv) if ("ctr" == mode) else None
+
+        self._buffer = bytearray()
+
+    def update(self, data):
+        if self._ctr is not None:
+            return self._ctr.update(data)
+
+        self._buffer += data
+
+        # Hold back the last block while decrypting, it carries the padding
+        block_sz = len(self._buffer) & ~0xf
+        if self._decrypt and self._padding and (block_sz == len(self._buffer)):
+            block_sz -= 16
+
+        if block_sz <= 0:
+            return bytearray()
+
+        out = self._process(memoryview(self._buffer)[:block_sz])
+        del self._buffer[:block_sz]
+
+        return out
+
+    def finalize(self):
+        if self._ctr is not None:
+            return bytearray()
+
+        if self._padding and not self._decrypt:
+            pad_sz = 16 - (len(self._buffer) % 16)
+            self._buffer += bytes([ pad_sz ] * pad_sz)
+
+        if len(self._buffer) % 16:
+            raise self.Error("Data length must be a multiple of 16 bytes")
+
+        out = self._process(self._buffer)
+        self._buffer = bytearray()
+
+        if self._padding and self._decrypt:
+            pad_sz = out[-1] if out else 0
+            if (pad_sz < 1) or (pad_sz > 16) or (out[-pad_sz:] != bytes([ pad_sz ] * pad_sz)):
+                raise self.Error("Invalid padding")
+            del out[-pad_sz:]
+
+        return out
+
+    def _process(self, data):
+        out = bytearray(len(data))
+
+        if self._decrypt:
+            iv = self._ctx._decrypt_blocks(data, out, self._iv)
+        else:
+            iv = self._ctx._encrypt_blocks(data, out, self._iv)
+
+        if "cbc" == self._mode:
+            self._iv = iv
+
+        return out
+
+class Salsa20Stream:
+    def __init__(self, ctx):
+        self._ctx = ctx
+
+    def update(self, data):
+        return self._ctx.encrypt(data)
+
+    def finalize(self):
+        return bytearray()
+
+def stream(ctx, mode=None, iv=None, decrypt=False, padding=True):
+    # Incremental form of ctx in mode, with update() and finalize()
+    if isinstance(ctx, salsa20.Salsa20):
+        return Salsa20Stream(ctx)
+
+    if "ctr" == mode:
+        return CTRStream(ctx, iv)
+
+    return BlockStream(ctx, mode, iv, decrypt, padding)
+
+def _write_all(raw, data):
+    view = memoryview(data)
+    while len(view):
+        n = raw.write(view)
+        if n is None:
+            raise CipherIOError("Non blocking files are not supported")
+        view = view[n:]
+
+class EncryptingWriter(io.RawIOBase):
+    # Everything written goes through stream.update() to raw, by pieces of at most chunk_sz bytes, and
+    # close() writes what finalize() gives (e.g. the padding block)
+    def __init__(self, raw, stream, chunk_sz=CHUNK_SZ, closefd=True):
+        self._raw = raw
+        self._stream = stream
+        self._chunk_sz = chunk_sz
+        self._closefd = closefd
+
+        # Reused output buffer for the streams that can write in place
+        self._buf = bytearray(chunk_sz) if hasattr(stream, "update_into") else None
+
+    def writable(self):
+        return True
+
+    def write(self, b):
+        if self.closed:
+            raise ValueError("I/O operation on closed file")
+
+        view = memoryview(b).cast("B")
+        for off in range(0, len(view), self._chunk_sz):
+            piece = view[off:off+self._chunk_sz]
+            if self._buf is not None:
+                out = memoryview(self._buf)[:len(piece)]
+                self._stream.update_into(piece, out)
+            else:
+                out = self._stream.update(piece)
+            _write_all(self._raw, out)
+
+        return len(view)
+
+    def close(self):
+        if self.closed:
+            return
+
+        try:
+            _write_all(self._raw, self._stream.finalize())
+            if self._closefd:
+                self._raw.close()
+            else:
+                self._raw.flush()
+        finally:
+            io.RawIOBase.close(self)
+
+class DecryptingReader(io.RawIOBase):
+    # Reads raw through stream.update(). Length preserving streams (CTR) decrypt in place in the caller
+    # buffer of readinto(), the others go through an internal chunk_sz buffer.
+    def __init__(self, raw, stream, chunk_sz=CHUNK_SZ, closefd=True):
+        self._raw = raw
+        self._stream = stream
+        self._chunk_sz = chunk_sz
+        self._closefd = closefd
+
+        self._buf = bytearray(chunk_sz)
+        self._pending = memoryview(b"")
+        self._eof = False
+
+    def readable(self):
+        return True
+
+    def readinto(self, b):
+        if self.closed:
+            raise ValueError("I/O operation on closed file")
+
+        b = memoryview(b).cast("B")
+        if 0 == len(b):
+            # Not the end of raw, which would finalize the stream
+            return 0
+
+        while (not len(self._pending)) and (not self._eof):
+            if hasattr(self._stream, "update_into"):
+                n = self._raw.readinto(b[:self._chunk_sz])
+                if n:
+                    self._stream.update_into(b[:n], b[:n])
+                    return n
+            else:
+                n = self._raw.readinto(self._buf)
+                if n:
+                    self._pending = memoryview(self._stream.update(memoryview(self._buf)[:n]))
+                    continue
+
+            if n is None:
+                return None
+
+            self._eof = True
+            self._pending = memoryview(self._stream.finalize())
+
+        n = min(len(b), len(self._pending))
+        b[:n] = self._pending[:n]
+        self._pending = self._pending[n:]
+
+        return n
+
+    def close(self):
+        if self.closed:
+            return
+
+        try:
+            if self._closefd:
+                self._raw.close()
+        finally:
+            io.RawIOBase.close(self)
+
+if __name__ == "__main__":
+    import rijndael_fast
+    import twofish_fast
+
+    key = os.urandom(32)
+    iv = os.urandom(16)
+    data = os.urandom(100003)
+
+    def contexts():
+        return [
+                (rijndael_fast.Rijndael(key), "ctr"),
+                (rijndael_fast.Rijndael(key), "cbc"),
+                (twofish_fast.Twofish(key), "ctr"),
+                (twofish_fast.Twofish(key), "ecb"),
+                (salsa20.Salsa20(key, iv[:8]), None),
+                ]
+
+    start = time.time_ns()
+
+    res_test = True
+    for ((enc_ctx, mode), (dec_ctx, mode)) in zip(contexts(), contexts()):
+        # Odd sized writes, then odd sized reads through a buffered reader
+        f = io.BytesIO()
+        with EncryptingWriter(f, stream(enc_ctx, mode, iv), chunk_sz=4096, closefd=False) as w:
+            for off in range(0, len(data), 9999):
+                w.write(data[off:off+9999])
+
+        f.seek(0)
+        with io.BufferedReader(DecryptingReader(f, stream(dec_ctx, mode, iv, decrypt=True), chunk_sz=4096)) as r:
+            res_test = res_test and (r.read(777) + r.read() == data)
+
+    # Padding errors in the class of the stream: a block decrypting to zeroes
+    for (cls, ctx, error) in [ (BlockStream, rijndael_fast.Rijndael(key), CipherIOError), (twofish_fast.TwofishStream, twofish_fast.Twofish(key), twofish_fast.TwofishError) ]:
+        block = bytearray(16)
+        ctx._encrypt_blocks(bytes(16), block)
+        s = cls(ctx, "ecb", None, decrypt=True)
+        s.update(block)
+        try:
+            s.finalize()
+            res_test = False
+        except error:
+            pass
+
+    # Contexts with wider blocks are refused
+    for mode in [ "ctr", "ecb", "cbc" ]:
+        try:
+            stream(rijndael_fast.Rijndael(key, 32), mode, iv)
+            res_test = False
+        except CipherIOError:
+            pass
+
+    # In place decryption in a large caller buffer
+    f = io.BytesIO(rijndael_fast.Rijndael(key).encrypt_ctr(iv, data))
+    r = DecryptingReader(f, CTRStream(rijndael_fast.Rijndael(key), iv))
+    buf = bytearray(len(data))
+    res_test = res_test and (r.readinto(bytearray(0)) == 0)
+    n = 0
+    while n < len(buf):
+        n += r.readinto(memoryview(buf)[n:])
+    res_test = res_test and (buf == data) and (r.readinto(buf) == 0)
+
+    # Empty reads on the buffered path do not end the stream either
+    f = io.BytesIO(twofish_fast.Twofish(key).encrypt_cbc(iv, data[:100]))
+    r = DecryptingReader(f, stream(twofish_fast.Twofish(key), "cbc", iv, decrypt=True))
+    res_test = res_test and (r.readinto(bytearray(0)) == 0) and (r.readall() == data[:100])
+
+    end = time.time_ns()
+    elapsed_time = (end - start) / (10 ** 9)
+
+    # Check tests
+    print("Test: ", res_test)
+    print("Time: ", elapsed_time, "s")
+
+    exit(0)
@@ -0,0 +1,285 @@
+#!/usr/bin/env python
+
+import argparse
+import collections
+import concurrent.futures
+import hmac
+import io
+import mmap
+import os
+import shutil
+import sys
+import tempfile
+import time
+
+import gcm
+import rijndael_fast
+import salsa20
+import twofish_fast
+
+class CLIError(Exception):
+    pass
+
+# Output file layout: nonce, then the body, then the tag for GCM
+MODES = {
+        "aes-ctr" : { "nonce_sz" : 16, "tag_sz" : 0 },
+        "aes-gcm" : { "nonce_sz" : 12, "tag_sz" : 16 },
+        "twofish-ctr" : { "nonce_sz" : 16, "tag_sz" : 0 },
+        "salsa20" : { "nonce_sz" : 8, "tag_sz" : 0 },
+        }
+
+# Multiple of the Salsa20 block, so that every chunk starts on a block boundary
+CHUNK_SZ = 1 << 20
+
+# Contexts of this process, by mode and key
+_contexts = { }
+
+def _context(mode, key):
+    if not (mode, key) in _contexts:
+        if "salsa20" == mode:
+            # Only checks the key, Salsa20 contexts carry the stream position
+            ctx = salsa20.Salsa20(key, bytes(8))
+        elif "twofish-ctr" == mode:
+            ctx = twofish_fast.Twofish.from_key(key)
+        else:
+            ctx = rijndael_fast.Rijndael(key)
+
+        if "aes-gcm" == mode:
+            ctx = gcm.GCM(ctx)
+
+        _contexts[(mode, key)] = ctx
+
+    return _contexts[(mode, key)]
+
+def _process(mode, key, nonce, decrypt, off, chunk):
+    # Encrypt or decrypt the chunk found at offset off of the body, returns it with the GHASH of its
+    # ciphertext for GCM. Every chunk is independent, this runs in the worker processes.
+    if "salsa20" == mode:
+        return (salsa20.Salsa20(key, nonce, off // 64).encrypt(chunk), None)
+
+    ctx = _context(mode, key)
+
+    if "aes-gcm" == mode:
+        j0 = ctx._counter0(nonce)
+        out = bytearray(len(chunk))
+        ctx._gctr((j0 & ~0xffffffff) | ((j0 + 1 + (off // 16)) & 0xffffffff), chunk, out)
+        return (out, ctx._ghash(0, chunk if decrypt else out))
+
+    counter = (int.from_bytes(nonce, byteorder="big") + (off // 16)) & 0xffffffffffffffffffffffffffffffff
+    return (ctx.encrypt_ctr(counter.to_bytes(16, byteorder="big"), chunk), None)
+
+class _Source:
+    # Body of the input by chunks of chunk_sz bytes, without its last tail_sz bytes, which end up in tail.
+    # Regular files are mapped and sliced without copies, anything else is read in large readinto() calls.
+    def __init__(self, f, chunk_sz, tail_sz):
+        self._f = f
+        self._chunk_sz = chunk_sz
+        self._tail_sz = tail_sz
+        self.tail = b""
+
+    def __iter__(self):
+        try:
+            start = self._f.tell()
+            size = os.fstat(self._f.fileno()).st_size
+            m = mmap.mmap(self._f.fileno(), 0, access=mmap.ACCESS_READ) if size > start else None
+        except (AttributeError, OSError, ValueError, io.UnsupportedOperation):
+            m = None
+
+        if m is not None:
+            return self._mapped(m, start)
+        return self._read()
+
+    def _mapped(self, m, start):
+        view = memoryview(m)
+        end = len(view) - self._tail_sz
+        if end < start:
+            raise CLIError("Input is too short")
+
+        self.tail = bytes(view[end:])
+        for off in range(start, end, self._chunk_sz):
+            yield (off - start, view[off:min(end, off + self._chunk_sz)])
+
+    def _read(self):
+        buf = bytearray(self._chunk_sz)
+        pending = bytearray()
+        off = 0
+
+        while True:
+            n = self._f.readinto(buf)
+            if not n:
+                break
+            pending += memoryview(buf)[:n]
+
+            while len(pending) >= self._chunk_sz + self._tail_sz:
+                yield (off, bytes(pending[:self._chunk_sz]))
+                del pending[:self._chunk_sz]
+                off += self._chunk_sz
+
+        if len(pending) < self._tail_sz:
+            raise CLIError("Input is too short")
+
+        self.tail = bytes(pending[len(pending) - self._tail_sz:])
+        if len(pending) > self._tail_sz:
+            yield (off, bytes(pending[:len(pending) - self._tail_sz]))
+
+def _read_exactly(f, n):
+    data = f.read(n)
+    if len(data) != n:
+        raise CLIError("Input is too short")
+    return data
+
+def run(mode, key, f_in, f_out, decrypt=False, workers=1, chunk_sz=CHUNK_SZ):
+    # Returns the size of the body. Reading and writing happen here while up to 2 * workers chunks are
+    # encrypted in the pool; with a single worker everything runs inline.
+    if chunk_sz % 64:
+        raise CLIError("Chunk size must be a multiple of 64 bytes")
+
+    spec = MODES[mode]
+    ctx = _context(mode, key)
+
+    if decrypt:
+        nonce = _read_exactly(f_in, spec["nonce_sz"])
+    else:
+        nonce = os.urandom(spec["nonce_sz"])
+        f_out.write(nonce)
+
+    source = _Source(f_in, chunk_sz, spec["tag_sz"] if decrypt else 0)
+    pending = collections.deque()
+    (y, size) = (0, 0)
+
+    def emit(n, result):
+        nonlocal y, size
+        (out, ghash) = result
+        f_out.write(out)
+        if ghash is not None:
+            y = ctx._combine(y, ghash, (n + 15) // 16)
+        size += n
+
+    pool = concurrent.futures.ProcessPoolExecutor(workers) if (workers > 1) else None
+    try:
+        for (off, chunk) in source:
+            if pool is None:
+                emit(len(chunk), _process(mode, key, nonce, decrypt, off, chunk))
+                continue
+
+            pending.append((len(chunk), pool.submit(_process, mode, key, nonce, decrypt, off, bytes(chunk))))
+            while len(pending) >= 2 * workers:
+                (n, job) = pending.popleft()
+                emit(n, job.result())
+
+        while pending:
+            (n, job) = pending.popleft()
+            emit(n, job.result())
+    finally:
+        if pool is not None:
+            pool.shutdown(cancel_futures=True)
+
+    if "aes-gcm" == mode:
+        y = ctx._ghash(y, (8 * size).to_bytes(16, byteorder="big"))
+        tag = ctx._finish(ctx._counter0(nonce), y)
+
+        if not decrypt:
+            f_out.write(tag)
+        elif not hmac.compare_digest(tag, source.tail):
+            raise CLIError("Authentication failed")
+
+    return size
+
+# Errors of the primitives on a bad key, or of GCM on a bad nonce
+_ERRORS = (CLIError, rijndael_fast.RijndaelError, twofish_fast.TwofishError, salsa20.Salsa20Error, gcm.GCMError)
+
+def _open(path, mode, std):
+    return std.buffer if ("-" == path) else open(path, mode)
+
+def _same_file(a, b):
+    try:
+        return os.path.samefile(a, b)
+    except OSError:
+        return False
+
+def main(argv=None, decrypt=False):
+    name = "pycrypto-dec" if decrypt else "pycrypto-enc"
+    parser = argparse.ArgumentParser(prog=name, description=("Decrypt" if decrypt else "Encrypt") + " a file, the output is nonce || body (|| tag for GCM)")
+    parser.add_argument("input", nargs="?", default="-", help="input file, - for stdin")
+    parser.add_argument("-o", "--output", default="-", help="output file, - for stdout")
+    parser.add_argument("-m", "--mode", required=True, choices=list(MODES), help="cipher and mode")
+    group = parser.add_mutually_exclusive_group(required=True)
+    group.add_argument("-k", "--key", help="key in hexadecimal")
+    group.add_argument("--key-file", help="file holding the raw key")
+    parser.add_argument("-w", "--workers", type=int, default=os.cpu_count() or 1, help="worker processes, 1 to run inline")
+    parser.add_argument("--chunk-size", type=int, default=CHUNK_SZ, help="bytes per chunk, a multiple of 64")
+    parser.add_argument("-q", "--quiet", action="store_true", help="do not report the throughput")
+    args = parser.parse_args(argv)
+
+    # Everything that can be checked is checked before the output is created
+    try:
+        if args.key is not None:
+            try:
+                key = bytes.fromhex(args.key)
+            except ValueError:
+                raise CLIError("Key is not hexadecimal")
+        else:
+            with open(args.key_file, "rb") as f:
+                key = f.read()
+
+        _context(args.mode, key)
+
+        if ("-" != args.output) and ((args.output == args.input) or _same_file(args.input, args.output)):
+            raise CLIError("Output file is the input file")
+
+        f_in = _open(args.input, "rb", sys.stdin)
+    except _ERRORS + (OSError,) as e:
+        print(name + ": " + str(e), file=sys.stderr)
+        return 1
+
+    # GCM plaintext is only released once the tag has been checked: on stdout it is held in a spooled
+    # temporary file until then
+    spool = decrypt and ("aes-gcm" == args.mode) and ("-" == args.output)
+
+    try:
+        f_out = tempfile.SpooledTemporaryFile(16 * CHUNK_SZ) if spool else _open(args.output, "wb", sys.stdout)
+    except OSError as e:
+        if not f_in is sys.stdin.buffer:
+            f_in.close()
+        print(name + ": " + str(e), file=sys.stderr)
+        return 1
+
+    start = time.perf_counter_ns()
+    done = False
+    try:
+        size = run(args.mode, key, f_in, f_out, decrypt, max(1, args.workers), args.chunk_size)
+        if spool:
+            f_out.seek(0)
+            shutil.copyfileobj(f_out, sys.stdout.buffer, CHUNK_SZ)
+            sys.stdout.buffer.flush()
+        else:
+            f_out.flush()
+        done = True
+    except _ERRORS as e:
+        print(name + ": " + str(e), file=sys.stderr)
+        return 1
+    finally:
+        for f in [ f_in, f_out ]:
+            if not f in [ sys.stdin.buffer, sys.stdout.buffer ]:
+                f.close()
+        # Do not leave a partial output, or unauthenticated plaintext, behind
+        if (not done) and ("-" != args.output):
+            os.unlink(args.output)
+    elapsed = (time.perf_counter_ns() - start) / (10 ** 9)
+
+    if not args.quiet:
+        print("%s: %s %d bytes in %.3f s, %.3f MB/s (%d workers)" % (name, args.mode, size, elapsed, (size / (1 << 20)) / elapsed if elapsed else 0, max(1, args.workers)), file=sys.stderr)
+
+    return 0
+
+def enc_main():
+    return main(decrypt=False)
+
+def dec_main():
+    return main(decrypt=True)
+
+if __name__ == "__main__":
+    # python cli.py enc|dec ..., or installed as pycrypto-enc / pycrypto-dec
+    if (len(sys.argv) > 1) and (sys.argv[1] in [ "enc", "dec" ]):
+        exit(main(sys.argv[2:], "dec" == sys.argv[1]))
+    exit(main(decrypt=("dec" in os.path.basename(sys.argv[0]))))
@@ -0,0 +1,129 @@
+#!/usr/bin/env python
+
+import hmac
+import os
+import struct
+import time
+
+from rijndael_fast import Rijndael
+
+class CMACError(Exception):
+    pass
+
+class CMAC:
+    # AES-CMAC (SP 800-38B, RFC 4493) over a rijndael_fast.Rijndael context. The subkeys are derived once
+    # here, keep the object around to authenticate many messages under the same key.
+    def __init__(self, ctx, tag_sz=16):
+        if not tag_sz in range(4, 17):
+            raise CMACError("Tag length must be 4 to 16 bytes")
+
+        if ctx._nb != 4:
+            raise CMACError("Block length must be 16 bytes")
+
+        self._ctx = ctx
+        self._tag_sz = tag_sz
+
+        L = int.from_bytes(ctx.encrypt(bytes(16)), byteorder="big")
+        self._K1 = CMAC._double(L)
+        self._K2 = CMAC._double(self._K1)
+
+    def mac(self, data):
+        return self._macs([ data ])[0]
+
+    def verify(self, data, tag):
+        return hmac.compare_digest(self.mac(data), bytes(tag))
+
+    def verify_many(self, pairs):
+        # Check a list of (message, tag) pairs, returns one boolean per pair
+        tags = self._macs([ data for (data, tag) in pairs ])
+        return [ hmac.compare_digest(t, bytes(tag)) for (t, (data, tag)) in zip(tags, pairs) ]
+
+    def _macs(self, messages):
+        # CBC-MAC of every message in one frame, one Rijndael._cipher4() call per block. The last block
+        # is masked with K1 when complete, padded and masked with K2 otherwise.
+        K = self._ctx._kenc
+        nr = self._ctx._nr
+        cipher = Rijndael._cipher4
+        (K1, K2) = (self._K1, self._K2)
+        iter_unpack = struct.iter_unpack
+        tag_sz = self._tag_sz
+        out = [ ]
+
+        for data in messages:
+            data = bytes(data)
+            n = len(data)
+            last_sz = n - ((n - 1) & ~0xf) if n else 0
+
+            if 16 == last_sz:
+                last = int.from_bytes(data[-16:], byteorder="big") ^ K1
+            else:
+                last = int.from_bytes(data[n-last_sz:] + b"\x80" + bytes(15 - last_sz), byteorder="big") ^ K2
+
+            (c0, c1, c2, c3) = (0, 0, 0, 0)
+            for (m0, m1, m2, m3) in iter_unpack(">4I", data[:n-last_sz] + last.to_bytes(16, byteorder="big")):
+                (c0, c1, c2, c3) = cipher(c0 ^ m0, c1 ^ m1, c2 ^ m2, c3 ^ m3, K, nr)
+
+            out.append(struct.pack(">4I", c0, c1, c2, c3)[:tag_sz])
+
+        return out
+
+    @staticmethod
+    def _double(x):
+        return ((x << 1) & 0xffffffffffffffffffffffffffffffff) ^ (0x87 if (x >> 127) else 0)
+
+if __name__ == "__main__":
+    # RFC 4493, section 4
+    key = bytes.fromhex("2b7e151628aed2a6abf7158809cf4f3c")
+    msg = bytes.fromhex(
+            "6bc1bee22e409f96e93d7e117393172aae2d8a571e03ac9c9eb76fac45af8e51"
+            "30c81c46a35ce411e5fbc1191a0a52eff69f2445df4f9b17ad2b417be66c3710")
+    expected = [
+            (0, "bb1d6929e95937287fa37d129b756746"),
+            (16, "070a16b46b4d4144f79bdd9dd04a287c"),
+            (40, "dfa66747de9ae63030ca32611497c827"),
+            (64, "51f0bebf7e3b9d92fc49741779363cfe"),
+            ]
+
+    start = time.time_ns()
+
+    cmac = CMAC(Rijndael(key))
+    res_test = (cmac._K1 == 0xfbeed618357133667c85e08f7236a8de) and (cmac._K2 == 0xf7ddac306ae266ccf90bc11ee46d513b)
+    for (n, tag) in expected:
+        res_test = res_test and (cmac.mac(msg[:n]) == bytes.fromhex(tag)) and cmac.verify(msg[:n], bytes.fromhex(tag))
+
+    pairs = [ (msg[:n], bytes.fromhex(tag)) for (n, tag) in expected ]
+    res_test = res_test and (cmac.verify_many(pairs + [ (msg[:17], pairs[1][1]) ]) == [ True ] * 4 + [ False ])
+
+    end = time.time_ns()
+    elapsed_time = (end - start) / (10 ** 9)
+
+    # Short control messages: subkeys and one encrypt() call per block for every message, against verify_many()
+    cmac = CMAC(Rijndael(os.urandom(16)))
+    messages = [ os.urandom(8 + (i % 40)) for i in range(2000) ]
+    pairs = [ (m, cmac.mac(m)) for m in messages ]
+
+    def single_block(m):
+        ctx = cmac._ctx
+        k1 = CMAC._double(int.from_bytes(ctx.encrypt(bytes(16)), byteorder="big"))
+        k2 = CMAC._double(k1)
+        blocks = [ m[i:i+16] for i in range(0, len(m), 16) ]
+        last = int.from_bytes(blocks[-1], byteorder="big") ^ k1 if (16 == len(blocks[-1])) else int.from_bytes(blocks[-1] + b"\x80" + bytes(15 - len(blocks[-1])), byteorder="big") ^ k2
+        c = bytes(16)
+        for b in blocks[:-1] + [ last.to_bytes(16, byteorder="big") ]:
+            c = ctx.encrypt(bytes([ x ^ y for (x, y) in zip(c, b) ]))
+        return c
+
+    t = time.perf_counter_ns()
+    for m in messages:
+        single_block(m)
+    single = (time.perf_counter_ns() - t) / (10 ** 9)
+    t = time.perf_counter_ns()
+    res_test = res_test and all(cmac.verify_many(pairs))
+    batch = (time.perf_counter_ns() - t) / (10 ** 9)
+
+    # Check tests
+    print("Rates: encrypt() per block %.0f msg/s, verify_many %.0f msg/s" % (len(messages) / single, len(messages) / batch))
+    print("Test: ", res_test)
+    print("Time: ", elapsed_time, "s")
+
+    exit(0)
@@ -0,0 +1,128 @@
+#!/usr/bin/env python
+
+import argparse
+import json
+import os
+import random
+import time
+
+import rijndael_fast
+import rijndael_slow
+import sha3_fast
+import sha3_slow
+import twofish_fast
+import twofish_slow
+
+class DifferentialError(Exception):
+    pass
+
+def _cipher_case(rng, key_sizes):
+    key = rng.randbytes(rng.choice(key_sizes))
+    block = rng.randbytes(16)
+
+    def run(cls):
+        ctx = cls(key)
+        cipher = ctx.encrypt(block)
+        return (cipher, ctx.decrypt(cipher))
+
+    return run
+
+def _hash_case(rng):
+    digest_sz = rng.choice([ 224, 256, 384, 512 ])
+    data = rng.randbytes(rng.randrange(0, 600))
+
+    # Feed the message in random sized pieces to cover the buffering paths
+    cuts = sorted(rng.randrange(0, len(data) + 1) for i in range(rng.randrange(0, 4)))
+    pieces = [ data[a:b] for (a, b) in zip([ 0 ] + cuts, cuts + [ len(data) ]) ]
+
+    def run(cls):
+        ctx = cls(digest_sz)
+        for piece in pieces:
+            ctx.update(piece)
+        return ctx.finish()
+
+    return run
+
+# Reference and optimized implementation of each primitive, and a generator of random cases
+PAIRS = {
+        "aes" : (rijndael_slow.Rijndael, rijndael_fast.Rijndael, lambda rng: _cipher_case(rng, [ 16, 24, 32 ])),
+        "twofish" : (twofish_slow.Twofish, twofish_fast.Twofish, lambda rng: _cipher_case(rng, range(0, 33))),
+        "sha3" : (sha3_slow.SHA3, sha3_fast.SHA3, _hash_case),
+        }
+
+BASELINE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "differential_baseline.json")
+
+def check(name, cases, seed):
+    # Run the same random cases through both implementations, return the speedup ratio
+    (slow, fast, generator) = PAIRS[name]
+    rng = random.Random(seed)
+
+    (slow_ns, fast_ns) = (0, 0)
+
+    for i in range(cases):
+        case = generator(rng)
+
+        start = time.perf_counter_ns()
+        expected = case(slow)
+        slow_ns += time.perf_counter_ns() - start
+
+        # Best of a few runs, the fast version is cheap enough
+        best = None
+        for j in range(3):
+            start = time.perf_counter_ns()
+            result = case(fast)
+            elapsed = time.perf_counter_ns() - start
+            best = elapsed if (best is None) else min(best, elapsed)
+        fast_ns += best
+
+        if result != expected:
+            raise DifferentialError("%s: output mismatch on case %d (seed %d)" % (name, i, seed))
+
+    return slow_ns / fast_ns
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Check that the fast implementations match the slow ones and stay faster")
+    parser.add_argument("--only", nargs="*", choices=list(PAIRS), help="primitives to check")
+    parser.add_argument("--cases", type=int, default=8, help="random cases per primitive")
+    parser.add_argument("--seed", type=int, help="seed of the random cases")
+    parser.add_argument("--baseline", default=BASELINE, help="stored speedup ratios")
+    parser.add_argument("--tolerance", type=float, default=0.3, help="allowed relative drop of the speedup ratio")
+    parser.add_argument("--update", action="store_true", help="store the measured ratios as the new baseline")
+    args = parser.parse_args(argv)
+
+    seed = args.seed if (args.seed is not None) else int.from_bytes(os.urandom(4), byteorder="big")
+
+    baseline = { }
+    if os.path.exists(args.baseline):
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+
+    ratios = { }
+    failed = False
+
+    for name in (args.only or PAIRS):
+        try:
+            ratios[name] = check(name, args.cases, seed)
+        except DifferentialError as e:
+            print("FAIL ", e)
+            failed = True
+            continue
+
+        status = "ok"
+        if (name in baseline) and (ratios[name] < baseline[name] * (1 - args.tolerance)):
+            status = "REGRESSION (baseline x%.1f)" % baseline[name]
+            failed = True
+
+        print("%-8s x%8.1f  %s" % (name, ratios[name], status))
+
+    if args.update and not failed:
+        baseline.update({ name : round(ratios[name], 1) for name in ratios })
+        with open(args.baseline, "w") as f:
+            json.dump(baseline, f, indent=1, sort_keys=True)
+
+    print("Seed: ", seed)
+
+    return 1 if failed else 0
+
+if __name__ == "__main__":
+    exit(main())
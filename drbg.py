@@ -0,0 +1,297 @@
+#!/usr/bin/env python
+
+import os
+import struct
+import threading
+import time
+
+import sha3_fast
+from rijndael_fast import Rijndael
+from salsa20 import Salsa20
+from tuplehash import CSHAKE, encode_string
+
+class DRBGError(Exception):
+    pass
+
+# Bytes generated at once, small requests are then sliced out of memory
+BUFFER_SZ = 4096
+
+# Bytes of output after which fresh entropy is taken from os.urandom()
+RESEED_INTERVAL = 1 << 20
+
+# Bumped in the child after a fork, a generator seeing a new value reseeds before its next output: the
+# parent and the child would otherwise hand out the same buffered bytes
+_forks = 0
+
+def _after_fork():
+    global _forks
+    _forks += 1
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_after_fork)
+
+class _Generator:
+    # Buffering, reseeding and fork detection shared by the generators. A subclass provides _instantiate(),
+    # _reseed() and _generate(), which must not let its state give away the bytes it has returned.
+    SEED_SZ = 32
+
+    def __init__(self, personalization=b"", buffer_sz=BUFFER_SZ, reseed_interval=RESEED_INTERVAL):
+        self._buffer_sz = buffer_sz
+        self._interval = reseed_interval
+
+        self._instantiate(os.urandom(self.SEED_SZ), bytes(personalization))
+        self._start()
+
+    def read(self, n):
+        if self._forks != _forks:
+            self.reseed()
+
+        pos = self._pos
+        if pos + n <= len(self._buffer):
+            self._pos = pos + n
+            return self._buffer[pos:pos+n]
+
+        out = self._buffer[pos:]
+        n -= len(out)
+        self._buffer = b""
+        self._pos = 0
+
+        if n >= self._buffer_sz:
+            return out + self._output(n)
+
+        self._buffer = self._output(self._buffer_sz)
+        self._pos = n
+        return out + self._buffer[:n]
+
+    def reseed(self, additional=b""):
+        self._reseed(os.urandom(self.SEED_SZ), bytes(additional))
+        self._start()
+
+    def _output(self, n):
+        if self._produced >= self._interval:
+            self.reseed()
+        self._produced += n
+        return self._generate(n)
+
+    def _start(self):
+        # Buffered bytes are dropped, they came from the previous seed
+        self._buffer = b""
+        self._pos = 0
+        self._produced = 0
+        self._forks = _forks
+
+class CTRDRBG(_Generator):
+    # CTR_DRBG with AES-256 and no derivation function (SP 800-90A, section 10.2.1), the entropy input is
+    # the seed length itself
+    SEED_SZ = 48
+
+    # Bytes per generate request, 2^19 bits
+    MAX_REQUEST_SZ = 1 << 16
+
+    def _instantiate(self, entropy, personalization):
+        if len(personalization) > CTRDRBG.SEED_SZ:
+            raise DRBGError("Personalization string is too long")
+
+        self._ctx = Rijndael(bytes(32))
+        self._V = 0
+        self._update(CTRDRBG._xor(entropy, personalization))
+
+    def _reseed(self, entropy, additional):
+        if len(additional) > CTRDRBG.SEED_SZ:
+            raise DRBGError("Additional input is too long")
+
+        self._update(CTRDRBG._xor(entropy, additional))
+
+    def _generate(self, n):
+        out = [ ]
+        while n > 0:
+            m = min(n, CTRDRBG.MAX_REQUEST_SZ)
+            out.append(self._blocks(m)[:m])
+            # Backtracking resistance: new key and V after every request
+            self._update(bytes(CTRDRBG.SEED_SZ))
+            n -= m
+        return b"".join(out)
+
+    def _update(self, data):
+        temp = CTRDRBG._xor(self._blocks(CTRDRBG.SEED_SZ), data)
+        self._ctx = Rijndael(temp[:32])
+        self._V = int.from_bytes(temp[32:], byteorder="big")
+
+    def _blocks(self, n):
+        # Encryptions of V + 1, V + 2, ..., the counter is the whole block
+        buf = bytearray((n + 15) & ~0xf)
+        self._V = (self._ctx._ctr_blocks(buf, buf, (self._V + 1) & 0xffffffffffffffffffffffffffffffff) - 1) & 0xffffffffffffffffffffffffffffffff
+        return bytes(buf)
+
+    @staticmethod
+    def _xor(a, b):
+        b = b + bytes(len(a) - len(b))
+        return (int.from_bytes(a, byteorder="big") ^ int.from_bytes(b, byteorder="big")).to_bytes(len(a), byteorder="big")
+
+class Salsa20DRBG(_Generator):
+    # Fast key erasure: every request runs Salsa20 under the current key with a zero nonce, the first 32 bytes
+    # of keystream replace the key and the rest is the output
+    def _instantiate(self, entropy, personalization):
+        self._key = entropy
+        if personalization:
+            self._reseed(b"", personalization)
+
+    def _reseed(self, entropy, additional):
+        ctx = sha3_fast.SHA3(256)
+        ctx.update(encode_string(self._key) + encode_string(entropy) + encode_string(additional))
+        self._key = ctx.finish()
+
+    def _generate(self, n):
+        ks = Salsa20(self._key, bytes(8))._keystream((n + 32 + 63) // 64)
+        self._key = ks[:32]
+        return ks[32:32+n]
+
+class SHAKEDRBG(_Generator):
+    # cSHAKE256 keyed with a 64 bytes state, each request squeezes the next state then the output
+    SEED_SZ = 64
+    CUSTOMIZATION = b"drbg"
+
+    def _instantiate(self, entropy, personalization):
+        self._key = bytes(SHAKEDRBG.SEED_SZ)
+        self._reseed(entropy, personalization)
+
+    def _reseed(self, entropy, additional):
+        ctx = CSHAKE(256, b"", SHAKEDRBG.CUSTOMIZATION)
+        for s in [ self._key, entropy, additional ]:
+            ctx.update(encode_string(s))
+        self._key = ctx.read(SHAKEDRBG.SEED_SZ)
+
+    def _generate(self, n):
+        ctx = CSHAKE(256, b"", SHAKEDRBG.CUSTOMIZATION)
+        ctx.update(self._key)
+        self._key = ctx.read(SHAKEDRBG.SEED_SZ)
+        return ctx.read(n)
+
+GENERATORS = { "ctr" : CTRDRBG, "salsa20" : Salsa20DRBG, "shake" : SHAKEDRBG }
+
+# Generators of the current thread, by name: none of them is locked
+_local = threading.local()
+
+def get(name="salsa20"):
+    if not name in GENERATORS:
+        raise DRBGError("Unknown generator: " + name)
+
+    generators = getattr(_local, "generators", None)
+    if generators is None:
+        generators = _local.generators = { }
+
+    if not name in generators:
+        generators[name] = GENERATORS[name]()
+    return generators[name]
+
+def random_bytes(n, name="salsa20"):
+    # Drop-in for os.urandom(n), from the generator of this thread
+    return get(name).read(n)
+
+if __name__ == "__main__":
+    start = time.time_ns()
+
+    res_test = True
+
+    # CTR_DRBG against SP 800-90A written out block by block with Rijndael.encrypt()
+    def reference(entropy, personalization, reseed, sizes):
+        def update(key, V, data):
+            temp = b""
+            for i in range(3):
+                V = (V + 1) % (1 << 128)
+                temp += Rijndael(key).encrypt(V.to_bytes(16, byteorder="big"))
+            temp = bytes([ a ^ b for (a, b) in zip(temp, data + bytes(48 - len(data))) ])
+            return (temp[:32], int.from_bytes(temp[32:], byteorder="big"))
+
+        (key, V) = update(bytes(32), 0, bytes([ a ^ b for (a, b) in zip(entropy, personalization + bytes(48 - len(personalization))) ]))
+        (key, V) = update(key, V, reseed)
+        out = [ ]
+        for n in sizes:
+            block = b""
+            while len(block) < n:
+                V = (V + 1) % (1 << 128)
+                block += Rijndael(key).encrypt(V.to_bytes(16, byteorder="big"))
+            out.append(block[:n])
+            (key, V) = update(key, V, bytes(48))
+        return out
+
+    (entropy, personalization, reseed) = (os.urandom(48), os.urandom(20), os.urandom(48))
+    g = CTRDRBG.__new__(CTRDRBG)
+    g._instantiate(entropy, personalization)
+    g._reseed(reseed, b"")
+    res_test = res_test and ([ g._generate(n) for n in [ 64, 17, 100 ] ] == reference(entropy, personalization, reseed, [ 64, 17, 100 ]))
+
+    # Salsa20 fast key erasure: output is the keystream past the next key
+    g = Salsa20DRBG.__new__(Salsa20DRBG)
+    g._instantiate(bytes(range(32)), b"")
+    ks = Salsa20(bytes(range(32)), bytes(8)).encrypt(bytes(132))
+    res_test = res_test and (g._generate(100) == ks[32:]) and (g._key == ks[:32])
+
+    for name in GENERATORS:
+        # Small reads across buffer refills, a large read, then reseeding after the interval
+        g = GENERATORS[name](buffer_sz=256, reseed_interval=1024)
+        out = b"".join([ g.read(n) for n in [ 16, 100, 200, 0, 1, 3000, 16 ] ])
+        res_test = res_test and (len(out) == 3333) and (len(set([ out[i:i+16] for i in range(0, 3328, 16) ])) == 208)
+
+        reseeds = [ ]
+        g.reseed = lambda additional=b"", reseed=g.reseed: reseeds.append(reseed(additional))
+        for i in range(10):
+            g.read(200)
+        res_test = res_test and (len(reseeds) >= 1) and (g._produced <= 1024 + 256)
+
+        # A forked child must not repeat the bytes its parent is about to return
+        if hasattr(os, "fork"):
+            g.read(1)
+            (r, w) = os.pipe()
+            pid = os.fork()
+            if 0 == pid:
+                os.write(w, g.read(32))
+                os._exit(0)
+            os.close(w)
+            child = os.read(r, 32)
+            os.close(r)
+            os.waitpid(pid, 0)
+            res_test = res_test and (len(child) == 32) and (child != g.read(32))
+
+    # One generator per thread
+    seen = [ ]
+    threads = [ threading.Thread(target=lambda: seen.append((get(), get().read(32)))) for i in range(2) ]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    res_test = res_test and (seen[0][0] is not seen[1][0]) and (seen[0][1] != seen[1][1]) and (get() is get()) and (get() is not seen[0][0])
+
+    end = time.time_ns()
+    elapsed_time = (end - start) / (10 ** 9)
+
+    # 16 bytes requests: os.urandom() against each generator, buffer refills included
+    count = 20000
+    rates = [ ]
+    t = time.perf_counter_ns()
+    for i in range(count):
+        os.urandom(16)
+    rates.append("os.urandom %.0f req/s" % (count / ((time.perf_counter_ns() - t) / (10 ** 9))))
+
+    for name in GENERATORS:
+        g = GENERATORS[name]()
+        t = time.perf_counter_ns()
+        for i in range(count):
+            g.read(16)
+        rates.append("%s %.0f req/s" % (name, count / ((time.perf_counter_ns() - t) / (10 ** 9))))
+
+    # Served from the buffer only
+    g = Salsa20DRBG(buffer_sz=16 * count)
+    g.read(0)
+    g._buffer = g._output(16 * count)
+    t = time.perf_counter_ns()
+    for i in range(count):
+        g.read(16)
+    rates.append("buffered %.0f req/s" % (count / ((time.perf_counter_ns() - t) / (10 ** 9))))
+
+    # Check tests
+    print("Rates: ", ", ".join(rates))
+    print("Test: ", res_test)
+    print("Time: ", elapsed_time, "s")
+
+    exit(0)
@@ -0,0 +1,224 @@
+#!/usr/bin/env python
+
+import hmac
+import os
+import struct
+import time
+
+import sha3_fast
+
+class DuplexError(Exception):
+    pass
+
+class Duplex:
+    # Keccak duplex construction on the permutation of sha3_fast, capacity twice the security strength. Each
+    # duplexing() call absorbs less than one rate block with the multi-rate padding (pad10*1), applies the
+    # permutation, and returns up to one rate block of output.
+    def __init__(self, bits=128):
+        if not bits in [ 128, 256 ]:
+            raise DuplexError("Security strength should be 128 or 256 bits")
+
+        self._r = 200 - (bits // 4)
+        self._fmt = "<%dQ" % (self._r // 8)
+        self._S = [ 0 ] * 25
+
+    def copy(self):
+        ctx = Duplex.__new__(Duplex)
+        ctx.__dict__.update(self.__dict__)
+        ctx._S = list(self._S)
+        return ctx
+
+    def duplexing(self, data, out_len=0):
+        n = len(data)
+        if n >= self._r:
+            raise DuplexError("Input length must be below the rate")
+        if out_len > self._r:
+            raise DuplexError("Output length must not exceed the rate")
+
+        block = bytearray(self._r)
+        block[:n] = data
+        block[n] = 0x01
+        block[-1] |= 0x80
+
+        S = self._S
+        S[:self._r // 8] = [ s ^ m for (s, m) in zip(S, struct.unpack(self._fmt, block)) ]
+        sha3_fast.SHA3._keccakf(S)
+
+        if 0 == out_len:
+            return b""
+        return struct.pack(self._fmt, *S[:self._r // 8])[:out_len]
+
+class SpongeWrap:
+    # Authenticated encryption of Bertoni et al., "Duplexing the sponge", on Duplex. Key, header and body are
+    # cut in blocks of rate - 2 bytes, each absorbed with a frame byte then the padding. The keystream of a
+    # body block is the output of the call that absorbed the previous plaintext block, so every block costs
+    # one permutation for both encryption and authentication. The key is absorbed once here, a message then
+    # starts from a copy of that state with nonce || associated data as its header.
+    NONCE_SZ = 16
+
+    def __init__(self, key, bits=128, tag_sz=16):
+        if len(key) < bits // 8:
+            raise DuplexError("Key length should be at least %d bytes" % (bits // 8))
+        if not tag_sz in range(8, 65):
+            raise DuplexError("Tag length must be 8 to 64 bytes")
+
+        self._base = Duplex(bits)
+        self._rho = self._base._r - 2
+        self._tag_sz = tag_sz
+
+        # Frame byte 1 on every key block but the last one
+        blocks = SpongeWrap._blocks(key, self._rho)
+        for block in blocks[:-1]:
+            self._base.duplexing(block + b"\x01")
+        self._base.duplexing(blocks[-1] + b"\x00")
+
+    def encrypt(self, nonce, data, ad=b""):
+        ctx = self.encryptor(nonce, ad)
+        out = ctx.update(data)
+        return (out, ctx.finish())
+
+    def decrypt(self, nonce, data, tag, ad=b""):
+        # Nothing is returned before the tag has been checked
+        ctx = self.decryptor(nonce, ad)
+        out = ctx.update(data)
+        ctx.finish(tag)
+        return out
+
+    def encryptor(self, nonce, ad=b""):
+        return _Stream(self, nonce, ad, False)
+
+    def decryptor(self, nonce, ad=b""):
+        # The plaintext of update() is not authenticated until finish() has returned
+        return _Stream(self, nonce, ad, True)
+
+    @staticmethod
+    def _blocks(data, rho):
+        # At least one block, possibly empty
+        data = bytes(data)
+        return [ data[i:i+rho] for i in range(0, len(data), rho) ] or [ b"" ]
+
+class _Stream:
+    def __init__(self, wrap, nonce, ad, decrypt):
+        if len(nonce) != SpongeWrap.NONCE_SZ:
+            raise DuplexError("Nonce should be %d bytes" % SpongeWrap.NONCE_SZ)
+
+        self._duplex = wrap._base.copy()
+        self._rho = wrap._rho
+        self._tag_sz = wrap._tag_sz
+        self._decrypt = decrypt
+
+        # Frame byte 0 on every header block but the last one, which gives the keystream of the first body block
+        blocks = SpongeWrap._blocks(bytes(nonce) + bytes(ad), self._rho)
+        for block in blocks[:-1]:
+            self._duplex.duplexing(block + b"\x00")
+        self._ks = self._duplex.duplexing(blocks[-1] + b"\x01", self._rho)
+
+        # Plaintext of the current body block, it is absorbed once the next one starts
+        self._pending = bytearray()
+
+    def update(self, data):
+        view = memoryview(data).cast("B")
+        out = bytearray(len(view))
+        (rho, duplexing) = (self._rho, self._duplex.duplexing)
+
+        i = 0
+        while i < len(view):
+            if len(self._pending) == rho:
+                # Not the last body block: frame byte 1
+                self._pending.append(0x01)
+                self._ks = duplexing(self._pending, rho)
+                self._pending = bytearray()
+
+            pos = len(self._pending)
+            n = min(rho - pos, len(view) - i)
+            x = (int.from_bytes(view[i:i+n], byteorder="little") ^ int.from_bytes(self._ks[pos:pos+n], byteorder="little")).to_bytes(n, byteorder="little")
+
+            out[i:i+n] = x
+            self._pending += x if self._decrypt else view[i:i+n]
+            i += n
+
+        return bytes(out)
+
+    def finish(self, tag=None):
+        # Encryption returns the tag, decryption checks the given one
+        self._pending.append(0x00)
+        z = self._duplex.duplexing(self._pending, self._rho)
+        while len(z) < self._tag_sz:
+            z += self._duplex.duplexing(b"", self._rho)
+        z = z[:self._tag_sz]
+
+        self._pending = None
+
+        if not self._decrypt:
+            return z
+        if (tag is None) or not hmac.compare_digest(z, bytes(tag)):
+            raise DuplexError("Authentication failed")
+
+if __name__ == "__main__":
+    from cipherio import CTRStream
+    from kdf import HMAC
+    from rijndael_fast import Rijndael
+
+    start = time.time_ns()
+
+    res_test = True
+
+    # Duplex: an empty input is padded to 0x01 || 0 ... || 0x80, inputs of a whole rate are refused
+    for bits in [ 128, 256 ]:
+        d = Duplex(bits)
+        S = list(struct.unpack(d._fmt, b"\x01" + bytes(d._r - 2) + b"\x80")) + [ 0 ] * (25 - (d._r // 8))
+        res_test = res_test and (d.duplexing(b"", d._r) == struct.pack(d._fmt, *sha3_fast.SHA3._keccakf(S)[:d._r // 8]))
+        try:
+            d.duplexing(bytes(d._r))
+            res_test = False
+        except DuplexError:
+            pass
+
+    # Round trips around the block length, streamed by pieces, then tampering
+    for bits in [ 128, 256 ]:
+        key = os.urandom(32)
+        sw = SpongeWrap(key, bits)
+        rho = sw._rho
+        for n in [ 0, 1, rho - 1, rho, rho + 1, 2 * rho, 1000 ]:
+            nonce = os.urandom(16)
+            (ad, data) = (os.urandom(n % 50), os.urandom(n))
+            (cipher, tag) = sw.encrypt(nonce, data, ad)
+
+            ctx = sw.encryptor(nonce, ad)
+            pieces = [ ctx.update(data[i:i+7]) for i in range(0, n, 7) ]
+            res_test = res_test and (b"".join(pieces) == cipher) and (ctx.finish() == tag)
+            res_test = res_test and (sw.decrypt(nonce, cipher, tag, ad) == data)
+
+            for (c, t, a, iv) in [ (cipher, bytes([ tag[0] ^ 1 ]) + tag[1:], ad, nonce), (cipher, tag, ad + b"\x00", nonce), (cipher, tag, ad, bytes(16)), (cipher + b"\x00", tag, ad, nonce) ]:
+                try:
+                    sw.decrypt(iv, c, t, a)
+                    res_test = False
+                except DuplexError:
+                    pass
+
+        # Keystream of two messages differs under distinct nonces
+        res_test = res_test and (sw.encrypt(bytes(16), bytes(64))[0] != sw.encrypt(b"\x01" + bytes(15), bytes(64))[0])
+
+    end = time.time_ns()
+    elapsed_time = (end - start) / (10 ** 9)
+
+    # One pass against AES-128-CTR then HMAC-SHA3-256 of the ciphertext, both from this repository
+    data = os.urandom(64 << 10)
+    key = os.urandom(16)
+    nonce = os.urandom(16)
+
+    t = time.perf_counter_ns()
+    SpongeWrap(key).encrypt(nonce, data)
+    single = (time.perf_counter_ns() - t) / (10 ** 9)
+
+    t = time.perf_counter_ns()
+    cipher = CTRStream(Rijndael(key), nonce).update(data)
+    HMAC.mac(key, cipher)
+    composed = (time.perf_counter_ns() - t) / (10 ** 9)
+
+    # Check tests
+    print("Rates: SpongeWrap %.3f MB/s, AES-CTR + HMAC-SHA3 %.3f MB/s" % ((len(data) / (1 << 20)) / single, (len(data) / (1 << 20)) / composed))
+    print("Test: ", res_test)
+    print("Time: ", elapsed_time, "s")
+
+    exit(0)
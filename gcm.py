@@ -0,0 +1,202 @@
+#!/usr/bin/env python
+
+import hmac
+import os
+import struct
+import time
+
+class GCMError(Exception):
+    pass
+
+class GCM:
+    # Galois/Counter Mode (SP 800-38D) over any 128 bits block cipher context exposing encrypt() and
+    # _ctr_blocks(), e.g. rijndael_fast.Rijndael or twofish_fast.Twofish
+    _R = 0xe1 << 120
+
+    def __init__(self, ctx, tag_sz=16):
+        if not tag_sz in range(12, 17):
+            raise GCMError("Tag length must be 12 to 16 bytes")
+
+        # Rijndael contexts may have wider blocks
+        if getattr(ctx, "_nb", 4) != 4:
+            raise GCMError("Block length must be 16 bytes")
+
+        self._ctx = ctx
+        self._tag_sz = tag_sz
+        self._H = int.from_bytes(ctx.encrypt(bytes(16)), byteorder="big")
+
+        # Multiplication by H, one table per byte of the block: _M[j][b] = (b at byte j) * H. Bit 0 of a block
+        # is the most significant bit of its integer, multiplying by x shifts right.
+        powers = [ self._H ]
+        for i in range(127):
+            v = powers[-1]
+            powers.append((v >> 1) ^ (GCM._R if (v & 1) else 0))
+
+        self._M = [ ]
+        for j in range(16):
+            table = [ 0 ] * 256
+            for b in range(1, 256):
+                low = b & -b
+                table[b] = table[b ^ low] ^ powers[(8 * j) + 7 - (low.bit_length() - 1)]
+            self._M.append(table)
+
+        self._powers = { 1 : self._H }
+
+    def encrypt(self, iv, data, aad=b""):
+        j0 = self._counter0(iv)
+
+        out = bytearray(len(data))
+        self._gctr(GCM._inc32(j0), data, out)
+
+        return (out, self._tag(j0, aad, out))
+
+    def decrypt(self, iv, data, tag, aad=b""):
+        j0 = self._counter0(iv)
+
+        if not hmac.compare_digest(self._tag(j0, aad, data), bytes(tag)):
+            raise GCMError("Authentication failed")
+
+        out = bytearray(len(data))
+        self._gctr(GCM._inc32(j0), data, out)
+
+        return out
+
+    def _counter0(self, iv):
+        if 0 == len(iv):
+            raise GCMError("IV must not be empty")
+
+        if 12 == len(iv):
+            return (int.from_bytes(iv, byteorder="big") << 32) | 1
+
+        y = self._ghash(0, iv)
+        return self._ghash(y, (8 * len(iv)).to_bytes(16, byteorder="big"))
+
+    def _tag(self, j0, aad, data):
+        y = self._ghash(0, aad)
+        y = self._ghash(y, data)
+        y = self._ghash(y, struct.pack(">QQ", 8 * len(aad), 8 * len(data)))
+
+        return self._finish(j0, y)
+
+    def _finish(self, j0, y):
+        mask = bytearray(16)
+        self._ctx._ctr_blocks(bytes(16), mask, j0)
+
+        return (int.from_bytes(mask, byteorder="big") ^ y).to_bytes(16, byteorder="big")[:self._tag_sz]
+
+    def _gctr(self, ctr, src, dst):
+        # CTR with the 32 bits increment of GCM: split where the low word wraps around
+        src = memoryview(src)
+        dst = memoryview(dst)
+        off = 0
+
+        while off < len(src):
+            n = min(len(src) - off, (0x100000000 - (ctr & 0xffffffff)) * 16)
+            full_sz = n & ~0xf
+            self._ctx._ctr_blocks(src[off:off+full_sz], dst[off:off+full_sz], ctr)
+
+            if full_sz < n:
+                ks = bytearray(16)
+                self._ctx._ctr_blocks(bytes(16), ks, ctr + (full_sz // 16))
+                for i in range(full_sz, n):
+                    dst[off + i] = src[off + i] ^ ks[i - full_sz]
+
+            ctr = (ctr & ~0xffffffff) | ((ctr + (n + 15) // 16) & 0xffffffff)
+            off += n
+
+    def _ghash(self, y, data):
+        # Absorb data into the GHASH accumulator y, the last partial block is padded with zeroes
+        (M0, M1, M2, M3, M4, M5, M6, M7, M8, M9, M10, M11, M12, M13, M14, M15) = self._M
+        full_sz = len(data) & ~0xf
+
+        for (x,) in struct.iter_unpack("16s", data[:full_sz]):
+            y ^= int.from_bytes(x, byteorder="big")
+            y = (
+                    M0[y >> 120] ^ M1[(y >> 112) & 0xff] ^ M2[(y >> 104) & 0xff] ^ M3[(y >> 96) & 0xff]
+                    ^ M4[(y >> 88) & 0xff] ^ M5[(y >> 80) & 0xff] ^ M6[(y >> 72) & 0xff] ^ M7[(y >> 64) & 0xff]
+                    ^ M8[(y >> 56) & 0xff] ^ M9[(y >> 48) & 0xff] ^ M10[(y >> 40) & 0xff] ^ M11[(y >> 32) & 0xff]
+                    ^ M12[(y >> 24) & 0xff] ^ M13[(y >> 16) & 0xff] ^ M14[(y >> 8) & 0xff] ^ M15[y & 0xff])
+
+        if full_sz < len(data):
+            y = self._ghash(y, bytes(data[full_sz:]) + bytes(16 - (len(data) - full_sz)))
+
+        return y
+
+    def _combine(self, y, partial, blocks):
+        # GHASH of two consecutive pieces: y covers the first one, partial is the GHASH of the next one
+        # (started from 0) and blocks its number of blocks
+        return GCM._mult(y, self._power(blocks)) ^ partial
+
+    def _power(self, n):
+        if not n in self._powers:
+            half = self._power(n // 2)
+            p = GCM._mult(half, half)
+            if n % 2:
+                p = GCM._mult(p, self._H)
+            self._powers[n] = p
+
+        return self._powers[n]
+
+    @staticmethod
+    def _mult(x, y):
+        # Generic GF(2^128) product, only used a few times per message
+        z = 0
+        for i in range(127, -1, -1):
+            if (x >> i) & 1:
+                z ^= y
+            y = (y >> 1) ^ (GCM._R if (y & 1) else 0)
+        return z
+
+    @staticmethod
+    def _inc32(ctr):
+        return (ctr & ~0xffffffff) | ((ctr + 1) & 0xffffffff)
+
+if __name__ == "__main__":
+    import rijndael_fast
+    import twofish_fast
+
+    # Test vectors from the GCM specification, test cases 1 to 4
+    key = bytes.fromhex("feffe9928665731c6d6a8f9467308308")
+    iv = bytes.fromhex("cafebabefacedbaddecaf888")
+    plain = bytes.fromhex(
+            "d9313225f88406e5a55909c5aff5269a86a7a9531534f7da2e4c303d8a318a72"
+            "1c3c0c95956809532fcf0e2449a6b525b16aedf5aa0de657ba637b391aafd255")
+    expected = bytes.fromhex(
+            "42831ec2217774244b7221b784d0d49ce3aa212f2c02a4e035c17e2329aca12e"
+            "21d514b25466931c7d8f6a5aac84aa051ba30b396a0aac973d58e091473f5985")
+    aad = bytes.fromhex("feedfacedeadbeeffeedfacedeadbeefabaddad2")
+
+    start = time.time_ns()
+
+    gcm = GCM(rijndael_fast.Rijndael(bytes(16)))
+    res_test = (gcm.encrypt(bytes(12), b"") == (bytearray(), bytes.fromhex("58e2fccefa7e3061367f1d57a4e7455a")))
+    res_test = res_test and (gcm.encrypt(bytes(12), bytes(16)) == (bytearray.fromhex("0388dace60b6a392f328c2b971b2fe78"), bytes.fromhex("ab6e47d42cec13bdf53a67b21257bddf")))
+
+    gcm = GCM(rijndael_fast.Rijndael(key))
+    res_test = res_test and (gcm.encrypt(iv, plain) == (expected, bytes.fromhex("4d5c2af327cd64a62cf35abd2ba6fab4")))
+    (cipher, tag) = gcm.encrypt(iv, plain[:60], aad)
+    res_test = res_test and (cipher == expected[:60]) and (tag == bytes.fromhex("5bc94fbc3221a5db94fae95ae7121a47"))
+    res_test = res_test and (gcm.decrypt(iv, cipher, tag, aad) == plain[:60])
+
+    # Tampering is detected
+    try:
+        gcm.decrypt(iv, cipher, tag, aad[1:])
+        res_test = False
+    except GCMError:
+        pass
+
+    # Other IV lengths, other ciphers, and GHASH computed by pieces then combined
+    data = os.urandom(1000)
+    gcm = GCM(twofish_fast.Twofish(os.urandom(32)))
+    (cipher, tag) = gcm.encrypt(iv * 3, data)
+    res_test = res_test and (gcm.decrypt(iv * 3, cipher, tag) == data)
+    res_test = res_test and (gcm._combine(gcm._ghash(0, cipher[:320]), gcm._ghash(0, cipher[320:]), 43) == gcm._ghash(0, cipher))
+
+    end = time.time_ns()
+    elapsed_time = (end - start) / (10 ** 9)
+
+    # Check tests
+    print("Test: ", res_test)
+    print("Time: ", elapsed_time, "s")
+
+    exit(0)
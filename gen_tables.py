@@ -0,0 +1,122 @@
+#!/usr/bin/env python
+
+import os
+import sys
+
+from rijndael_slow import Rijndael
+from twofish_slow import Twofish
+
+# Output module, loaded by rijndael_fast and twofish_fast
+OUTPUT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "tables.py")
+
+def _word(b0, b1, b2, b3):
+    return (b0 << 24) | (b1 << 16) | (b2 << 8) | b3
+
+def _ror8(w, n):
+    return ((w >> (8 * n)) | (w << (32 - 8 * n))) & 0xffffffff
+
+def rijndael_tables():
+    mul = Rijndael._MultGF8
+
+    sbox = [ Rijndael._SBox(x) for x in range(256) ]
+    inv_sbox = [ Rijndael._InvSBox(x) for x in range(256) ]
+
+    # Round tables: SubBytes (or InvSubBytes) followed by a (Inv)MixColumns column, and its rotations
+    mc0 = [ _word(mul(s, 2), s, s, mul(s, 3)) for s in sbox ]
+    inv_mc0 = [ _word(mul(s, 0x0e), mul(s, 0x09), mul(s, 0x0d), mul(s, 0x0b)) for s in inv_sbox ]
+    ut0 = [ _word(mul(x, 0x0e), mul(x, 0x09), mul(x, 0x0d), mul(x, 0x0b)) for x in range(256) ]
+
+    return {
+            "RIJNDAEL_SBOX" : bytes(sbox),
+            "RIJNDAEL_INV_SBOX" : bytes(inv_sbox),
+            "RIJNDAEL_MC" : [ [ _ror8(w, i) for w in mc0 ] for i in range(4) ],
+            "RIJNDAEL_INV_MC" : [ [ _ror8(w, i) for w in inv_mc0 ] for i in range(4) ],
+            "RIJNDAEL_UT" : [ [ _ror8(w, i) for w in ut0 ] for i in range(4) ],
+            }
+
+def twofish_tables():
+    q = Twofish._Q()
+
+    # MDS columns, composed with the last q permutation of h
+    mds = [
+            [ 0x01, 0xef, 0x5b, 0x5b ],
+            [ 0x5b, 0xef, 0xef, 0x01 ],
+            [ 0xef, 0x5b, 0x01, 0xef ],
+            [ 0xef, 0x01, 0xef, 0x5b ]
+            ]
+    last_q = [ 1, 0, 1, 0 ]
+
+    columns = [ ]
+    for j in range(4):
+        column = [ ]
+        for x in range(256):
+            y = q[last_q[j]][x]
+            column.append(sum([ Twofish._MultGF8(mds[i][j], y, 0b01101001) << (8 * i) for i in range(4) ]))
+        columns.append(column)
+
+    return {
+            "TWOFISH_Q" : [ bytes(q[0]), bytes(q[1]) ],
+            "TWOFISH_MDS" : columns,
+            }
+
+def _bytes_literal(blob, indent):
+    lines = [ ]
+    for i in range(0, len(blob), 32):
+        lines.append(indent + "b\"" + "".join([ "\\x%02x" % b for b in blob[i:i+32] ]) + "\"")
+    return "(\n" + "\n".join(lines) + "\n" + indent[:-4] + ")"
+
+def _words_literal(words, indent):
+    blob = b"".join([ w.to_bytes(4, byteorder="little") for w in words ])
+    return "_u32(" + _bytes_literal(blob, indent) + ")"
+
+def render(tables):
+    out = [ ]
+    out.append("# Generated by gen_tables.py, do not edit.")
+    out.append("#")
+    out.append("# 8 bits tables are bytes objects, 32 bits tables are array(\"I\") of little endian words.")
+    out.append("")
+    out.append("import array")
+    out.append("import sys")
+    out.append("")
+    out.append("def _u32(blob):")
+    out.append("    a = array.array(\"I\" if array.array(\"I\").itemsize == 4 else \"L\")")
+    out.append("    a.frombytes(blob)")
+    out.append("    if \"big\" == sys.byteorder:")
+    out.append("        a.byteswap()")
+    out.append("    return a")
+
+    for name in sorted(tables):
+        table = tables[name]
+        out.append("")
+        if isinstance(table, bytes):
+            out.append(name + " = " + _bytes_literal(table, "        "))
+        elif isinstance(table[0], bytes):
+            out.append(name + " = [")
+            out.extend([ "        " + _bytes_literal(t, "            ") + "," for t in table ])
+            out.append("        ]")
+        else:
+            out.append(name + " = [")
+            out.extend([ "        " + _words_literal(t, "            ") + "," for t in table ])
+            out.append("        ]")
+
+    return "\n".join(out) + "\n"
+
+if __name__ == "__main__":
+    tables = { }
+    tables.update(rijndael_tables())
+    tables.update(twofish_tables())
+
+    # --check only tells whether the committed module is up to date
+    if (len(sys.argv) > 1) and ("--check" == sys.argv[1]):
+        with open(OUTPUT) as f:
+            res_test = (f.read() == render(tables))
+        print("Up to date: ", res_test)
+        exit(0 if res_test else 1)
+
+    path = sys.argv[1] if len(sys.argv) > 1 else OUTPUT
+    with open(path, "w") as f:
+        f.write(render(tables))
+
+    print("Wrote", path)
+
+    exit(0)
@@ -0,0 +1,366 @@
+#!/usr/bin/env python
+
+import argparse
+import os
+import re
+import sys
+import time
+
+import rijndael_fast
+import salsa20
+import sha3_fast
+
+class KATError(Exception):
+    pass
+
+def parse_rsp(path):
+    # Lazily yield the records of a NIST CAVP response file, each tagged with its [section]
+    section = { }
+    record = { }
+
+    with open(path) as f:
+        for line in f:
+            line = line.strip()
+
+            if (not line) or line.startswith("#"):
+                if record:
+                    yield dict(record, **section)
+                    record = { }
+                continue
+
+            if line.startswith("["):
+                if record:
+                    yield dict(record, **section)
+                    record = { }
+
+                # Either [ENCRYPT] / [DECRYPT] or [L = 256]
+                line = line.strip("[]")
+                if "=" in line:
+                    (name, value) = [ x.strip() for x in line.split("=", 1) ]
+                    section = dict(section, **{ "[" + name + "]" : value })
+                else:
+                    section = dict(section, **{ "[mode]" : line })
+                continue
+
+            if "=" in line:
+                (name, value) = [ x.strip() for x in line.split("=", 1) ]
+                record[name] = value
+
+    if record:
+        yield dict(record, **section)
+
+def parse_estream(path):
+    # Lazily yield the vectors of an eSTREAM verified.test-vectors file
+    vector = None
+    field = None
+    stream_sz = None
+
+    with open(path) as f:
+        for line in f:
+            m = re.match(r"\s*\(stream is generated by encrypting (\d+) zero bytes\)", line)
+            if m:
+                stream_sz = int(m.group(1))
+                continue
+
+            m = re.match(r"\s*Set (\d+), vector#\s*(\d+):", line)
+            if m:
+                if vector is not None:
+                    yield vector
+                vector = { "set" : int(m.group(1)), "vector" : int(m.group(2)), "stream_sz" : stream_sz }
+                field = None
+                continue
+
+            if vector is None:
+                continue
+
+            if "=" in line:
+                (field, value) = [ x.strip() for x in line.split("=", 1) ]
+                vector[field] = value
+            elif line.strip() and (field is not None) and re.match(r"^[0-9A-Fa-f]+$", line.strip()):
+                # Continuation of a long hexadecimal value
+                vector[field] += line.strip()
+            else:
+                field = None
+
+    if vector is not None:
+        yield vector
+
+def _batches(records, batch_sz):
+    batch = []
+    for record in records:
+        batch.append(record)
+        if len(batch) == batch_sz:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+def verify_aes(records, batch_sz=1024):
+    # ECB known answer tests (ECBVarTxt, ECBVarKey, ECBGFSbox, ECBKeySbox), one context per key and batch
+    (passed, failed, skipped, ops) = (0, 0, 0, 0)
+
+    for batch in _batches(records, batch_sz):
+        contexts = { }
+
+        for record in batch:
+            key = bytes.fromhex(record["KEY"])
+            if not key in contexts:
+                contexts[key] = rijndael_fast.Rijndael(key)
+            ctx = contexts[key]
+
+            (plain, cipher) = (bytes.fromhex(record["PLAINTEXT"]), bytes.fromhex(record["CIPHERTEXT"]))
+            if "DECRYPT" == record.get("[mode]"):
+                ok = ctx.decrypt(cipher) == plain
+            else:
+                ok = ctx.encrypt(plain) == cipher
+
+            (passed, failed, ops) = (passed + ok, failed + (not ok), ops + 1)
+
+    return (passed, failed, skipped, ops)
+
+def verify_aes_mct(records):
+    # ECBMCT, each record is checked on its own: 1000 chained operations from its KEY and input
+    (passed, failed, skipped, ops) = (0, 0, 0, 0)
+
+    for record in records:
+        ctx = rijndael_fast.Rijndael(bytes.fromhex(record["KEY"]))
+
+        if "DECRYPT" == record.get("[mode]"):
+            (text, expected, f) = (bytes.fromhex(record["CIPHERTEXT"]), bytes.fromhex(record["PLAINTEXT"]), ctx.decrypt)
+        else:
+            (text, expected, f) = (bytes.fromhex(record["PLAINTEXT"]), bytes.fromhex(record["CIPHERTEXT"]), ctx.encrypt)
+
+        for j in range(1000):
+            text = f(text)
+
+        ok = text == expected
+        (passed, failed, ops) = (passed + ok, failed + (not ok), ops + 1000)
+
+    return (passed, failed, skipped, ops)
+
+def verify_sha3(records):
+    # ShortMsg and LongMsg, Len is in bits and Msg = 00 stands for the empty message
+    (passed, failed, skipped, ops) = (0, 0, 0, 0)
+    contexts = { }
+
+    for record in records:
+        digest_sz = int(record["[L]"])
+        if not digest_sz in contexts:
+            contexts[digest_sz] = sha3_fast.SHA3(digest_sz)
+        ctx = contexts[digest_sz]
+
+        # Bit oriented messages are counted apart, SHA3.update() takes whole bytes
+        length = int(record["Len"])
+        if length % 8:
+            skipped += 1
+            continue
+
+        ctx.update(bytes.fromhex(record["Msg"])[:length // 8])
+        ok = ctx.finish() == bytes.fromhex(record["MD"])
+        (passed, failed, ops) = (passed + ok, failed + (not ok), ops + 1)
+
+    return (passed, failed, skipped, ops)
+
+def verify_sha3_monte(records):
+    # SHA3VS Monte Carlo: MD_i = SHA3(MD_i-1) 1000 times per checkpoint, chained from Seed
+    (passed, failed, skipped, ops) = (0, 0, 0, 0)
+    md = None
+
+    for record in records:
+        if "Seed" in record:
+            md = bytes.fromhex(record["Seed"])
+            continue
+
+        ctx = sha3_fast.SHA3(int(record["[L]"]))
+        for i in range(1000):
+            ctx.update(md)
+            md = ctx.finish()
+
+        ok = md == bytes.fromhex(record["MD"])
+        (passed, failed, ops) = (passed + ok, failed + (not ok), ops + 1000)
+
+        # Keep going from the expected value so that one failure does not cascade
+        md = bytes.fromhex(record["MD"])
+
+    return (passed, failed, skipped, ops)
+
+def verify_salsa20(vectors):
+    (passed, failed, skipped, ops) = (0, 0, 0, 0)
+
+    for vector in vectors:
+        key = bytes.fromhex(vector["key"])
+        iv = bytes.fromhex(vector["IV"])
+
+        ranges = []
+        for field in vector:
+            m = re.match(r"stream\[(\d+)\.\.(\d+)\]", field)
+            if m:
+                ranges.append((int(m.group(1)), int(m.group(2)), vector[field]))
+        stream_sz = vector["stream_sz"] or (max([ b for (a, b, v) in ranges ]) + 1)
+
+        stream = salsa20.Salsa20(key, iv).encrypt(bytes(stream_sz))
+
+        ok = all([ stream[a:b+1] == bytes.fromhex(v) for (a, b, v) in ranges ])
+
+        if "xor-digest" in vector:
+            digest = bytearray(64)
+            for i in range(0, len(stream), 64):
+                for j in range(64):
+                    digest[j] ^= stream[i + j]
+            ok = ok and (digest == bytes.fromhex(vector["xor-digest"]))
+
+        (passed, failed, ops) = (passed + ok, failed + (not ok), ops + (stream_sz // 64))
+
+    return (passed, failed, skipped, ops)
+
+def verify_file(path):
+    # Pick the parser and the verifier from the usual file names
+    name = os.path.basename(path)
+
+    if ("salsa" in name.lower()) or name.endswith(".test-vectors"):
+        return verify_salsa20(parse_estream(path))
+    if name.startswith("SHA3") and ("Monte" in name):
+        return verify_sha3_monte(parse_rsp(path))
+    if name.startswith("SHA3"):
+        return verify_sha3(parse_rsp(path))
+    if name.startswith("ECB") and ("MCT" in name):
+        return verify_aes_mct(parse_rsp(path))
+    if name.startswith("ECB"):
+        return verify_aes(parse_rsp(path))
+
+    raise KATError("Unknown test vector file: " + name)
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Verify NIST CAVP and eSTREAM known answer test files")
+    parser.add_argument("files", nargs="+", help="ECB*.rsp, SHA3_*ShortMsg/LongMsg/Monte.rsp or Salsa20 verified.test-vectors")
+    args = parser.parse_args(argv)
+
+    failed = 0
+
+    for path in args.files:
+        start = time.perf_counter_ns()
+        (ok, ko, skip, ops) = verify_file(path)
+        elapsed = (time.perf_counter_ns() - start) / (10 ** 9)
+
+        print("%-40s passed %6d  failed %6d  skipped %6d  %10d ops  %8.3f s  %10.0f ops/s" % (os.path.basename(path), ok, ko, skip, ops, elapsed, ops / elapsed if elapsed else 0))
+        failed += ko
+
+    return 1 if failed else 0
+
+if __name__ == "__main__":
+    # python kat.py FILE ... verifies the files, without arguments the self-test
+    if len(sys.argv) > 1:
+        exit(main())
+
+    import shutil
+    import tempfile
+
+    # Excerpts in the layout of the published files. SHA3: records of SHA3_256ShortMsg.rsp, and the 5 bits
+    # sample of FIPS 202 (11001) as a bit oriented record.
+    samples = {
+            "SHA3_256ShortMsg.rsp" : (3, 0, 1, """\
+#  CAVS 19.0
+#  "SHA3-256 ShortMsg" information for "SHA3AllBytes1-28-16"
+
+[L = 256]
+
+Len = 0
+Msg = 00
+MD = a7ffc6f8bf1ed76651c14756a061d662f580ff4de43b49fa82d80a4b80f8434a
+
+Len = 5
+Msg = 13
+MD = 7b0047cf5a456882363cbf0fb05322cf65f4b7059a46365e830132e3b5d957af
+
+Len = 8
+Msg = e9
+MD = f0d04dd1e6cfc29a4460d521796852f25d9ef8d28b44ee91ff5b759d72c1e6d6
+
+Len = 16
+Msg = d477
+MD = 94279e8f5ccdf6e17f292b59698ab4e614dfe696a46c46da78305fc6a3146ab7
+"""),
+            "ECBGFSbox128.rsp" : (2, 0, 0, """\
+# CAVS 11.1
+# Config info for aes_values
+# AESVS GFSbox test data for ECB
+
+[ENCRYPT]
+
+COUNT = 0
+KEY = 00000000000000000000000000000000
+PLAINTEXT = f34481ec3cc627bacd5dc3fb08f273e6
+CIPHERTEXT = 0336763e966d92595a567cc9ce537f5e
+
+[DECRYPT]
+
+COUNT = 0
+KEY = 00000000000000000000000000000000
+CIPHERTEXT = 0336763e966d92595a567cc9ce537f5e
+PLAINTEXT = f34481ec3cc627bacd5dc3fb08f273e6
+"""),
+            "verified.test-vectors" : (1, 0, 0, """\
+Primitive Name: Salsa20
+=======================
+Profile: SW & HW
+Key size: 128 bits
+IV size: 64 bits
+
+Test vectors -- set 1
+=====================
+
+(stream is generated by encrypting 512 zero bytes)
+
+Set 1, vector#  0:
+                         key = 80000000000000000000000000000000
+                          IV = 0000000000000000
+               stream[0..63] = 4DFA5E481DA23EA09A31022050859936
+                               DA52FCEE218005164F267CB65F5CFD7F
+                               2B4F97E0FF16924A52DF269515110A07
+                               F9E460BC65EF95DA58F740B7D1DBB0AA
+            stream[192..255] = DA9C1581F429E0A00F7D67E23B730676
+                               783B262E8EB43A25F55FB90B3E753AEF
+                               8C6713EC66C51881111593CCB3E8CB8F
+                               8DE124080501EEEB389C4BCB6977CF95
+            stream[256..319] = 7D5789631EB4554400E1E025935DFA7B
+                               3E9039D61BDC58A8697D36815BF1985C
+                               EFDF7AE112E5BB81E37ECF0616CE7147
+                               FC08A93A367E08631F23C03B00A8DA2F
+            stream[448..511] = B375703739DACED4DD4059FD71C3C47F
+                               C2F9939670FAD4A46066ADCC6A564578
+                               3308B90FFB72BE04A6B147CBE38CC0C3
+                               B9267C296A92A7C69873F9F263BE9703
+                  xor-digest = F7A274D268316790A67EC058F45C0F2A
+                               067A99FCDE6236C0CEF8E056349FE54C
+                               5F13AC74D2539570FD34FEAB06C57205
+                               3949B59585742181A5A760223AFA22D4
+
+"""),
+            }
+
+    tmp = tempfile.mkdtemp()
+    try:
+        start = time.time_ns()
+
+        res_test = True
+        for (name, (passed, failed, skipped, text)) in samples.items():
+            path = os.path.join(tmp, name)
+            with open(path, "w") as f:
+                f.write(text)
+            res_test = res_test and (verify_file(path)[:3] == (passed, failed, skipped))
+
+            # One altered digit must be caught
+            with open(path, "w") as f:
+                f.write(text.replace("0336763e", "0336763f", 1).replace("f0d04dd1", "f0d04dd0", 1).replace("4DFA5E48", "4DFA5E49", 1))
+            res_test = res_test and (verify_file(path)[1] == 1)
+
+        end = time.time_ns()
+        elapsed_time = (end - start) / (10 ** 9)
+    finally:
+        shutil.rmtree(tmp)
+
+    # Check tests
+    print("Test: ", res_test)
+    print("Time: ", elapsed_time, "s")
+
+    exit(0)
@@ -0,0 +1,151 @@
+#!/usr/bin/env python
+
+import os
+import struct
+import time
+import weakref
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+from rijndael_fast import Rijndael
+
+class MultiBufferError(Exception):
+    pass
+
+# Number of jobs from which one NumPy batch beats the interleaved loop
+NUMPY_THRESHOLD = 32
+
+def encrypt_many(jobs, use_numpy=None):
+    # Encrypt a list of (Rijndael context, 16 bytes block) jobs, the contexts may all differ. Returns the
+    # list of encrypted blocks in the order of the jobs.
+    if _numpy(jobs, use_numpy):
+        return _many_numpy(jobs, False)
+    return _many(jobs, False)
+
+def decrypt_many(jobs, use_numpy=None):
+    if _numpy(jobs, use_numpy):
+        return _many_numpy(jobs, True)
+    return _many(jobs, True)
+
+def _numpy(jobs, use_numpy):
+    if use_numpy is None:
+        use_numpy = len(jobs) >= NUMPY_THRESHOLD
+    return use_numpy and (numpy is not None)
+
+def _many(jobs, decrypt):
+    # One loop over every job, the rounds of each block are those of the block modes of rijndael_fast
+    unpack = struct.unpack
+    pack = struct.pack
+    cipher = Rijndael._inv_cipher4 if decrypt else Rijndael._cipher4
+    out = []
+
+    for (ctx, block) in jobs:
+        if (len(block) != 16) or (ctx._nb != 4):
+            raise MultiBufferError("Block length must be 16 bytes")
+
+        (s0, s1, s2, s3) = unpack(">4I", block)
+        out.append(pack(">4I", *cipher(s0, s1, s2, s3, ctx._kdec if decrypt else ctx._kenc, ctx._nr)))
+
+    return out
+
+# Key schedules of the contexts as (nr + 1, 4) arrays, computed once per context
+_schedules = weakref.WeakKeyDictionary()
+
+def _schedule(ctx, decrypt):
+    if not ctx in _schedules:
+        _schedules[ctx] = (numpy.array(ctx._kenc, dtype=numpy.uint32), numpy.array(ctx._kdec, dtype=numpy.uint32))
+    return _schedules[ctx][1 if decrypt else 0]
+
+_tables = { }
+
+def _numpy_tables(decrypt):
+    if not decrypt in _tables:
+        if decrypt:
+            _tables[decrypt] = (numpy.array(Rijndael._InvMC, dtype=numpy.uint32), numpy.frombuffer(Rijndael._InvSBox, dtype=numpy.uint8).astype(numpy.uint32))
+        else:
+            _tables[decrypt] = (numpy.array(Rijndael._MC, dtype=numpy.uint32), numpy.frombuffer(Rijndael._SBox, dtype=numpy.uint8).astype(numpy.uint32))
+    return _tables[decrypt]
+
+def _many_numpy(jobs, decrypt):
+    # One row per job. The schedules of the distinct contexts are stacked, each row gathers its own round
+    # key from the stack at every round. Jobs are grouped by number of rounds (key size).
+    # The same ShiftRows columns as Rijndael, on whole columns of the batch
+    (T, S) = _numpy_tables(decrypt)
+    cols = Rijndael._INV_COLS[4] if decrypt else Rijndael._COLS[4]
+
+    blocks = b"".join([ block for (ctx, block) in jobs ])
+    if len(blocks) != 16 * len(jobs):
+        raise MultiBufferError("Block length must be 16 bytes")
+
+    state = numpy.frombuffer(blocks, dtype=">u4").reshape(-1, 4).astype(numpy.uint32)
+    result = numpy.empty_like(state)
+
+    groups = { }
+    for (i, (ctx, block)) in enumerate(jobs):
+        if ctx._nb != 4:
+            raise MultiBufferError("Block length must be 16 bytes")
+
+        (rows, stack, index) = groups.setdefault(ctx._nr, ([], [], { }))
+        if not ctx in index:
+            index[ctx] = len(stack)
+            stack.append(_schedule(ctx, decrypt))
+        rows.append((i, index[ctx]))
+
+    for (nr, (rows, stack, index)) in groups.items():
+        jobs_idx = numpy.array([ i for (i, k) in rows ])
+        K = numpy.stack(stack)
+        kidx = numpy.array([ k for (i, k) in rows ])
+
+        s = state[jobs_idx] ^ K[kidx, 0]
+        for r in range(1, nr):
+            k = K[kidx, r]
+            s = numpy.stack([
+                    k[:, i] ^ T[0][s[:, i] >> 24] ^ T[1][(s[:, a] >> 16) & 0xff] ^ T[2][(s[:, b] >> 8) & 0xff] ^ T[3][s[:, c] & 0xff]
+                    for (i, a, b, c) in cols ], axis=1)
+
+        k = K[kidx, nr]
+        result[jobs_idx] = numpy.stack([
+                k[:, i] ^ (S[s[:, i] >> 24] << 24) ^ (S[(s[:, a] >> 16) & 0xff] << 16) ^ (S[(s[:, b] >> 8) & 0xff] << 8) ^ S[s[:, c] & 0xff]
+                for (i, a, b, c) in cols ], axis=1)
+
+    out = result.astype(">u4").tobytes()
+    return [ out[i:i+16] for i in range(0, len(out), 16) ]
+
+if __name__ == "__main__":
+    # Many independent records: one block each, under different keys of every size
+    contexts = [ Rijndael(os.urandom(16 + 8 * (i % 3))) for i in range(200) ]
+    jobs = [ (contexts[i % len(contexts)], os.urandom(16)) for i in range(1000) ]
+
+    expected = [ ctx.encrypt(block) for (ctx, block) in jobs ]
+
+    start = time.time_ns()
+
+    res_test = (encrypt_many(jobs, use_numpy=False) == expected)
+    res_test = res_test and (decrypt_many([ (ctx, c) for ((ctx, p), c) in zip(jobs, expected) ], use_numpy=False) == [ p for (ctx, p) in jobs ])
+
+    if numpy is not None:
+        res_test = res_test and (encrypt_many(jobs, use_numpy=True) == expected)
+        res_test = res_test and (decrypt_many([ (ctx, c) for ((ctx, p), c) in zip(jobs, expected) ], use_numpy=True) == [ p for (ctx, p) in jobs ])
+
+    end = time.time_ns()
+    elapsed_time = (end - start) / (10 ** 9)
+
+    # Throughput against one encrypt() call per job
+    rates = [ ]
+    for (label, f) in [ ("encrypt()", lambda: [ ctx.encrypt(block) for (ctx, block) in jobs ]), ("interleaved", lambda: encrypt_many(jobs, False)), ("numpy", lambda: encrypt_many(jobs, True)) ]:
+        if ("numpy" == label) and (numpy is None):
+            continue
+        f()
+        t = time.perf_counter_ns()
+        f()
+        rates.append("%s %.0f blocks/s" % (label, len(jobs) / ((time.perf_counter_ns() - t) / (10 ** 9))))
+
+    # Check tests
+    print("Rates: ", ", ".join(rates))
+    print("Test: ", res_test)
+    print("Time: ", elapsed_time, "s")
+
+    exit(0)
@@ -0,0 +1,109 @@
+#!/usr/bin/env python
+
+import hmac
+import os
+import time
+
+class Poly1305Error(Exception):
+    pass
+
+# Blocks absorbed per step: h = (h + m1) * r^n + m2 * r^(n-1) + ... + mn * r, with a single reduction
+BLOCKS = 8
+
+class Poly1305:
+    _P = (1 << 130) - 5
+
+    def __init__(self, key):
+        if len(key) != 32:
+            raise Poly1305Error("Key length should be 32 bytes")
+
+        r = int.from_bytes(key[:16], byteorder="little") & 0x0ffffffc0ffffffc0ffffffc0fffffff
+        self._s = int.from_bytes(key[16:], byteorder="little")
+
+        # r^BLOCKS down to r, in the order of the blocks of a step
+        powers = [ r ]
+        for i in range(BLOCKS - 1):
+            powers.append((powers[-1] * r) % Poly1305._P)
+        self._r = powers[::-1]
+
+        self._h = 0
+        self._buffer = b""
+
+    def update(self, data):
+        # Every full block is absorbed right away, only a partial one is kept for the next call
+        data = self._buffer + bytes(data)
+        full_sz = len(data) & ~0xf
+        step_sz = 16 * BLOCKS
+
+        P = Poly1305._P
+        r = self._r
+        h = self._h
+
+        steps_sz = full_sz - (full_sz % step_sz)
+        for off in range(0, steps_sz, step_sz):
+            acc = h * r[0]
+            for (i, p) in enumerate(r):
+                acc += (int.from_bytes(data[off+16*i:off+16*i+16], byteorder="little") | (1 << 128)) * p
+            h = acc % P
+
+        for off in range(steps_sz, full_sz, 16):
+            h = ((h + (int.from_bytes(data[off:off+16], byteorder="little") | (1 << 128))) * r[-1]) % P
+
+        self._h = h
+        self._buffer = data[full_sz:]
+
+    def finish(self):
+        h = self._h
+
+        # The last partial block is padded with a single 1 byte
+        if len(self._buffer):
+            m = int.from_bytes(self._buffer, byteorder="little") | (1 << (8 * len(self._buffer)))
+            h = ((h + m) * self._r[-1]) % Poly1305._P
+
+        return ((h + self._s) & 0xffffffffffffffffffffffffffffffff).to_bytes(16, byteorder="little")
+
+    @staticmethod
+    def mac(key, data):
+        ctx = Poly1305(key)
+        ctx.update(data)
+        return ctx.finish()
+
+    @staticmethod
+    def verify(key, data, tag):
+        return hmac.compare_digest(Poly1305.mac(key, data), bytes(tag))
+
+if __name__ == "__main__":
+    # RFC 8439, section 2.5.2
+    key = bytes.fromhex("85d6be7857556d337f4452fe42d506a80103808afb0db2fd4abff6af4149f51b")
+    msg = b"Cryptographic Forum Research Group"
+    expected = bytes.fromhex("a8061dc1305136c6c22b8baf0c0127a9")
+
+    start = time.time_ns()
+
+    res_test = (Poly1305.mac(key, msg) == expected)
+    res_test = res_test and Poly1305.verify(key, msg, expected) and (not Poly1305.verify(key, msg[1:], expected))
+
+    # Steps of several blocks against one block at a time, around the step boundaries and by pieces
+    key = os.urandom(32)
+    data = os.urandom(1000)
+    r = int.from_bytes(key[:16], byteorder="little") & 0x0ffffffc0ffffffc0ffffffc0fffffff
+    for n in [ 0, 1, 15, 16, 17, 16 * BLOCKS - 1, 16 * BLOCKS, 16 * BLOCKS + 1, 1000 ]:
+        h = 0
+        for off in range(0, n, 16):
+            block = data[off:min(n, off+16)]
+            h = ((h + int.from_bytes(block + b"\x01", byteorder="little")) * r) % Poly1305._P
+        tag = ((h + int.from_bytes(key[16:], byteorder="little")) & ((1 << 128) - 1)).to_bytes(16, byteorder="little")
+
+        ctx = Poly1305(key)
+        for off in range(0, n, 37):
+            ctx.update(data[off:min(n, off+37)])
+        res_test = res_test and (Poly1305.mac(key, data[:n]) == tag) and (ctx.finish() == tag)
+
+    end = time.time_ns()
+    elapsed_time = (end - start) / (10 ** 9)
+
+    # Check tests
+    print("Test: ", res_test)
+    print("Time: ", elapsed_time, "s")
+
+    exit(0)
@@ -0,0 +1,212 @@
+#!/usr/bin/env python
+
+import importlib
+import os
+import sys
+import threading
+import time
+
+class ProfilingError(Exception):
+    pass
+
+def _arg_len(i):
+    return lambda args: len(args[i])
+
+def _const(n):
+    return lambda args: n
+
+# Instrumented primitives: (module, class, attribute, phase, bytes processed by one call)
+HOOKS = [
+        ("rijndael_fast", "Rijndael", "_KeyExpansion", "aes.key_setup", _arg_len(0)),
+        ("rijndael_fast", "Rijndael", "encrypt", "aes.encrypt", _arg_len(1)),
+        ("rijndael_fast", "Rijndael", "decrypt", "aes.decrypt", _arg_len(1)),
+        ("rijndael_fast", "Rijndael", "_encrypt_blocks", "aes.encrypt_blocks", _arg_len(1)),
+        ("rijndael_fast", "Rijndael", "_decrypt_blocks", "aes.decrypt_blocks", _arg_len(1)),
+        ("rijndael_fast", "Rijndael", "_ctr_blocks", "aes.ctr_blocks", _arg_len(1)),
+        ("twofish_fast", "Twofish", "__init__", "twofish.key_setup", _arg_len(1)),
+        ("twofish_fast", "Twofish", "encrypt", "twofish.encrypt", _arg_len(1)),
+        ("twofish_fast", "Twofish", "decrypt", "twofish.decrypt", _arg_len(1)),
+        ("twofish_fast", "Twofish", "_encrypt_blocks", "twofish.encrypt_blocks", _arg_len(1)),
+        ("twofish_fast", "Twofish", "_decrypt_blocks", "twofish.decrypt_blocks", _arg_len(1)),
+        ("twofish_fast", "Twofish", "_ctr_blocks", "twofish.ctr_blocks", _arg_len(1)),
+        ("twofish_numpy", "TwofishNumpy", "_encrypt_words", "twofish_numpy.encrypt_words", lambda args: args[1].nbytes),
+        ("twofish_numpy", "TwofishNumpy", "_decrypt_words", "twofish_numpy.decrypt_words", lambda args: args[1].nbytes),
+        ("sha3_fast", "SHA3", "_absorb", "sha3.absorb", _arg_len(1)),
+        ("sha3_fast", "SHA3", "_keccakf", "sha3.keccakf", _const(200)),
+        ("salsa20", "Salsa20", "_keystream", "salsa20.keystream", lambda args: 64 * args[1]),
+        ("salsa20", "Salsa20", "encrypt", "salsa20.encrypt", _arg_len(1)),
+        ("poly1305", "Poly1305", "update", "poly1305.update", _arg_len(1)),
+        ]
+
+# Modules only instrumented when the caller already imported them
+_OPTIONAL = [ "twofish_numpy" ]
+
+_lock = threading.Lock()
+_counters = { }
+_originals = { }
+_depth = 0
+
+def _wrap(f, phase, size):
+    counter = _counters.setdefault(phase, [ 0, 0, 0 ])
+    perf_counter_ns = time.perf_counter_ns
+
+    def wrapper(*args, **kwargs):
+        start = perf_counter_ns()
+        try:
+            return f(*args, **kwargs)
+        finally:
+            elapsed = perf_counter_ns() - start
+            with _lock:
+                counter[0] += 1
+                counter[1] += size(args)
+                counter[2] += elapsed
+
+    wrapper.__wrapped__ = f
+    wrapper.__name__ = f.__name__
+    return wrapper
+
+def enable():
+    # Swap the hooked attributes for counting wrappers, nothing is left behind by disable(). If any hook
+    # fails, the ones already swapped are put back and profiling stays off.
+    global _depth
+
+    with _lock:
+        _depth += 1
+        if _depth > 1:
+            return
+
+        try:
+            for (module, cls, attr, phase, size) in HOOKS:
+                if (module in _OPTIONAL) and not (module in sys.modules):
+                    continue
+
+                owner = getattr(importlib.import_module(module), cls)
+                original = owner.__dict__[attr]
+
+                if isinstance(original, staticmethod):
+                    wrapper = staticmethod(_wrap(original.__func__, phase, size))
+                else:
+                    wrapper = _wrap(original, phase, size)
+
+                # Recorded first, so a failing setattr() is rolled back as well
+                _originals[(module, cls, attr)] = original
+                setattr(owner, attr, wrapper)
+        except BaseException:
+            _restore()
+            _depth = 0
+            raise
+
+def disable():
+    global _depth
+
+    with _lock:
+        if 0 == _depth:
+            raise ProfilingError("Profiling is not enabled")
+
+        _depth -= 1
+        if _depth > 0:
+            return
+
+        _restore()
+
+def _restore():
+    # Put back every recorded original, the ones that cannot be are reported once all others are restored
+    failed = [ ]
+    for ((module, cls, attr), original) in _originals.items():
+        try:
+            setattr(getattr(sys.modules[module], cls), attr, original)
+        except Exception:
+            failed.append("%s.%s.%s" % (module, cls, attr))
+    _originals.clear()
+
+    if failed:
+        raise ProfilingError("Could not restore " + ", ".join(failed))
+
+def enabled():
+    return _depth > 0
+
+def stats():
+    # Snapshot of the counters: { phase : { "calls", "bytes", "ns" } }
+    with _lock:
+        return { phase : { "calls" : c[0], "bytes" : c[1], "ns" : c[2] } for (phase, c) in _counters.items() if c[0] }
+
+def reset():
+    with _lock:
+        for c in _counters.values():
+            c[0] = c[1] = c[2] = 0
+
+class profile:
+    # Context manager: instrumentation is on inside the block, self.stats holds what happened there
+    def __enter__(self):
+        self._before = stats()
+        self.stats = { }
+        enable()
+        return self
+
+    def __exit__(self, *exc):
+        disable()
+
+        for (phase, after) in stats().items():
+            before = self._before.get(phase, { "calls" : 0, "bytes" : 0, "ns" : 0 })
+            delta = { k : after[k] - before[k] for k in after }
+            if delta["calls"]:
+                self.stats[phase] = delta
+
+        return False
+
+def report(snapshot):
+    lines = []
+    for phase in sorted(snapshot):
+        s = snapshot[phase]
+        lines.append("%-28s %10d calls %14d bytes %12.3f ms" % (phase, s["calls"], s["bytes"], s["ns"] / (10 ** 6)))
+    return "\n".join(lines)
+
+if __name__ == "__main__":
+    import rijndael_fast
+    import sha3_fast
+    import twofish_fast
+
+    key = os.urandom(16)
+    data = os.urandom(4096)
+
+    with profile() as p:
+        rijndael_ctx = rijndael_fast.Rijndael(key)
+        for i in range(0, len(data), 16):
+            rijndael_ctx.encrypt(data[i:i+16])
+
+        rijndael_ctx.encrypt_ctr(key, data)
+        rijndael_ctx.decrypt_cbc(key, rijndael_ctx.encrypt_cbc(key, data))
+
+        twofish_ctx = twofish_fast.Twofish(key)
+        twofish_ctx.encrypt_ctr(key, data)
+
+        sha3_ctx = sha3_fast.SHA3(256)
+        sha3_ctx.update(data)
+        sha3_ctx.finish()
+
+    # Check tests
+    res_test = (p.stats["aes.key_setup"]["calls"] == 1) and (p.stats["aes.encrypt"]["bytes"] == len(data))
+    res_test = res_test and (p.stats["aes.ctr_blocks"]["bytes"] == len(data)) and (p.stats["aes.encrypt_blocks"]["bytes"] == len(data) + 16)
+    res_test = res_test and (p.stats["aes.decrypt_blocks"]["calls"] == 1)
+    res_test = res_test and (p.stats["twofish.ctr_blocks"]["bytes"] == len(data))
+    res_test = res_test and (p.stats["sha3.keccakf"]["calls"] == (len(data) // 136) + 1)
+    res_test = res_test and (not enabled()) and (rijndael_fast.Rijndael.encrypt.__name__ == "encrypt") and not hasattr(rijndael_fast.Rijndael.encrypt, "__wrapped__")
+
+    # A hook failing halfway: the attributes patched before it are rolled back, profiling stays off
+    originals = dict(rijndael_fast.Rijndael.__dict__)
+    HOOKS.insert(3, ("rijndael_fast", "Rijndael", "missing", "aes.missing", _const(0)))
+    try:
+        enable()
+        res_test = False
+    except KeyError:
+        pass
+    del HOOKS[3]
+    res_test = res_test and (not enabled()) and (not _originals) and all([ rijndael_fast.Rijndael.__dict__[k] is originals[k] for k in originals ])
+    with profile() as q:
+        rijndael_fast.Rijndael(key)
+    res_test = res_test and (q.stats["aes.key_setup"]["calls"] == 1) and (not enabled())
+
+    print(report(p.stats))
+    print("Test: ", res_test)
+
+    exit(0)
@@ -0,0 +1,62 @@
+#!/usr/bin/env python
+
+import sys
+
+# Public names and the (module, attribute) they come from, nothing is imported before first use
+_EXPORTS = {
+        "Rijndael" : ("rijndael_fast", "Rijndael"),
+        "RijndaelError" : ("rijndael_fast", "RijndaelError"),
+        "Twofish" : ("twofish_fast", "Twofish"),
+        "TwofishError" : ("twofish_fast", "TwofishError"),
+        "TwofishStream" : ("twofish_fast", "TwofishStream"),
+        "TwofishNumpy" : ("twofish_numpy", "TwofishNumpy"),
+        "SHA3" : ("sha3_fast", "SHA3"),
+        "SHA3Error" : ("sha3_fast", "SHA3Error"),
+        "Salsa20" : ("salsa20", "Salsa20"),
+        "Salsa20Error" : ("salsa20", "Salsa20Error"),
+        "get_cipher" : ("registry", "get_cipher"),
+        "get_hash" : ("registry", "get_hash"),
+        "Cipher" : ("registry", "Cipher"),
+        "ParallelCipher" : ("registry", "ParallelCipher"),
+        "RegistryError" : ("registry", "RegistryError"),
+        "BACKENDS" : ("registry", "BACKENDS"),
+        }
+
+__all__ = sorted(_EXPORTS)
+
+def __getattr__(name):
+    # PEP 562: only called when name is not a global yet, i.e. once per name
+    if not name in _EXPORTS:
+        raise AttributeError("module " + repr(__name__) + " has no attribute " + repr(name))
+
+    import importlib
+
+    (module, attr) = _EXPORTS[name]
+    value = getattr(importlib.import_module(module), attr)
+    globals()[name] = value
+
+    return value
+
+def __dir__():
+    return sorted(set(globals()) | set(_EXPORTS))
+
+if __name__ == "__main__":
+    import importlib
+    import subprocess
+
+    # Importing the facade and hashing must not load the cipher tables nor NumPy
+    probe = "import sys, pycrypto; pycrypto.SHA3(256).finish(); print(' '.join(sorted(sys.modules)))"
+    loaded = subprocess.run([ sys.executable, "-c", probe ], check=True, capture_output=True, text=True).stdout.split()
+
+    res_test = ("sha3_fast" in loaded)
+    res_test = res_test and not any([ m in loaded for m in [ "tables", "rijndael_fast", "twofish_fast", "twofish_numpy", "numpy", "registry" ] ])
+
+    # Every export resolves, and is the object of its module
+    this = sys.modules[__name__]
+    for name in __all__:
+        (module, attr) = _EXPORTS[name]
+        res_test = res_test and (getattr(this, name) is getattr(importlib.import_module(module), attr))
+
+    print("Test: ", res_test)
+
+    exit(0)
@@ -0,0 +1,298 @@
+#!/usr/bin/env python
+
+import functools
+import importlib
+import importlib.util
+import os
+import time
+
+class RegistryError(Exception):
+    pass
+
+# Implementations of each primitive per backend, as (module, class) names
+_CIPHERS = {
+        "aes" : {
+            "slow" : ("rijndael_slow", "Rijndael"),
+            "fast" : ("rijndael_fast", "Rijndael"),
+            },
+        "twofish" : {
+            "slow" : ("twofish_slow", "Twofish"),
+            "fast" : ("twofish_fast", "Twofish"),
+            "numpy" : ("twofish_numpy", "TwofishNumpy"),
+            "process" : ("twofish_fast", "Twofish"),
+            },
+        "salsa20" : {
+            "fast" : ("salsa20", "Salsa20"),
+            },
+        }
+
+_HASHES = {
+        "sha3-224" : { "slow" : ("sha3_slow", "SHA3", 224), "fast" : ("sha3_fast", "SHA3", 224) },
+        "sha3-256" : { "slow" : ("sha3_slow", "SHA3", 256), "fast" : ("sha3_fast", "SHA3", 256) },
+        "sha3-384" : { "slow" : ("sha3_slow", "SHA3", 384), "fast" : ("sha3_fast", "SHA3", 384) },
+        "sha3-512" : { "slow" : ("sha3_slow", "SHA3", 512), "fast" : ("sha3_fast", "SHA3", 512) },
+        }
+
+_ALIASES = { "rijndael" : "aes", "sha3" : "sha3-256" }
+
+# Input size (log2 of bytes) from which a bulk backend beats the pure Python one
+_THRESHOLDS = { "numpy" : 9, "process" : 24 }
+
+def _available(module):
+    try:
+        return importlib.util.find_spec(module) is not None
+    except (ImportError, ValueError):
+        return False
+
+def _probe():
+    # Only look the optional modules up, importing NumPy alone costs more than all the primitives
+    return {
+            "slow" : True,
+            "fast" : True,
+            "numpy" : _available("numpy"),
+            "process" : ((os.cpu_count() or 1) > 1) and _available("_multiprocessing") and _available("concurrent.futures"),
+            }
+
+# Probed once at import
+BACKENDS = _probe()
+
+def get_cipher(name, backend="auto", size=0):
+    # Returns a constructor taking the key, then whatever else the cipher takes (the nonce of salsa20). The
+    # "auto", "numpy" and "process" backends give a Cipher, with the methods of the fast implementation
+    # whatever the backend behind each call. size is not needed anymore, auto picks the backend from the
+    # length of every input.
+    name = _ALIASES.get(name.lower(), name.lower())
+    if not name in _CIPHERS:
+        raise RegistryError("Unknown cipher: " + name)
+
+    if "auto" == backend:
+        # Raises when no backend can run it
+        _select(name, 0, True)
+    elif not backend in _CIPHERS[name]:
+        raise RegistryError("Backend " + backend + " not available for " + name)
+    elif not BACKENDS[backend]:
+        raise RegistryError("Backend " + backend + " not supported on this system")
+
+    if backend in [ "auto", "numpy", "process" ]:
+        return lambda key, *args: Cipher(name, key, backend, *args)
+
+    (module, cls) = _CIPHERS[name][backend]
+    return getattr(importlib.import_module(module), cls)
+
+def get_hash(name, backend="auto"):
+    name = _ALIASES.get(name.lower(), name.lower())
+    if not name in _HASHES:
+        raise RegistryError("Unknown hash: " + name)
+
+    if "auto" == backend:
+        backend = "fast"
+    elif not backend in _HASHES[name]:
+        raise RegistryError("Backend " + backend + " not available for " + name)
+
+    (module, cls, digest_sz) = _HASHES[name][backend]
+    cls = getattr(importlib.import_module(module), cls)
+
+    return lambda: cls(digest_sz)
+
+@functools.lru_cache(maxsize=None)
+def _select(name, size_class, allow_process):
+    # Pick the fastest available backend for inputs of about 2**size_class bytes
+    candidates = [ "numpy", "fast", "slow" ]
+    if allow_process:
+        candidates = [ "process" ] + candidates
+
+    for backend in candidates:
+        if (not backend in _CIPHERS[name]) or (not BACKENDS[backend]):
+            continue
+        if size_class > _THRESHOLDS.get(backend, -1):
+            return backend
+
+    raise RegistryError("No backend available for " + name)
+
+def _from_key(cls, key, *args):
+    if hasattr(cls, "from_key") and not args:
+        return cls.from_key(key)
+    return cls(key, *args)
+
+class Cipher:
+    # One API for every backend: the bulk methods run on the backend (fixed, or picked per call from the
+    # input length with "auto") when it has them, everything else on the fast implementation
+    def __init__(self, name, key, backend="auto", *args):
+        self._name = name
+        self._key = bytes(key)
+        self._args = args
+        self._backend = backend
+
+        self._fast = _from_key(getattr(importlib.import_module(_CIPHERS[name]["fast"][0]), _CIPHERS[name]["fast"][1]), key, *args)
+        self._contexts = { "fast" : self._fast }
+
+    def encrypt_ecb(self, data, padding=True):
+        return self._context(len(data), "encrypt_ecb").encrypt_ecb(data, padding)
+
+    def decrypt_ecb(self, data, padding=True):
+        return self._context(len(data), "decrypt_ecb").decrypt_ecb(data, padding)
+
+    def encrypt_cbc(self, iv, data, padding=True):
+        return self._context(len(data), "encrypt_cbc").encrypt_cbc(iv, data, padding)
+
+    def decrypt_cbc(self, iv, data, padding=True):
+        return self._context(len(data), "decrypt_cbc").decrypt_cbc(iv, data, padding)
+
+    def encrypt_ctr(self, counter, data):
+        return self._context(len(data), "encrypt_ctr").encrypt_ctr(counter, data)
+
+    def decrypt_ctr(self, counter, data):
+        return self.encrypt_ctr(counter, data)
+
+    def __getattr__(self, attr):
+        # encrypt(), decrypt() and the rest of the fast implementation
+        if attr.startswith("_"):
+            raise AttributeError(attr)
+        return getattr(self._fast, attr)
+
+    def _context(self, size, method):
+        backend = _select(self._name, size.bit_length(), True) if ("auto" == self._backend) else self._backend
+
+        if not backend in self._contexts:
+            if "process" == backend:
+                self._contexts[backend] = ParallelCipher(self._name, self._key)
+            elif "numpy" == backend:
+                (module, cls) = _CIPHERS[self._name][backend]
+                self._contexts[backend] = getattr(importlib.import_module(module), cls)(self._fast)
+            else:
+                self._contexts[backend] = get_cipher(self._name, backend)(self._key, *self._args)
+
+        ctx = self._contexts[backend]
+        if not hasattr(ctx, method):
+            # Fast implementation for what the backend does not have, e.g. CBC
+            ctx = self._fast
+        if not hasattr(ctx, method):
+            raise RegistryError(self._name + " has no " + method)
+        return ctx
+
+class ParallelCipher:
+    # Shared by every ParallelCipher, created on first use
+    _executor = None
+
+    def __init__(self, name, key, workers=None):
+        self._name = name
+        self._key = bytes(key)
+        self._workers = workers or os.cpu_count() or 1
+
+        # Padding is done here, the workers only see whole blocks
+        self._cls = getattr(importlib.import_module(_CIPHERS[name]["fast"][0]), _CIPHERS[name]["fast"][1])
+
+    def encrypt_ecb(self, data, padding=True):
+        if padding:
+            data = self._cls._pad(data)
+        return self._map("encrypt_ecb", data, None)
+
+    def decrypt_ecb(self, data, padding=True):
+        out = self._map("decrypt_ecb", data, None)
+        if padding:
+            self._cls._unpad(out)
+        return out
+
+    def encrypt_ctr(self, counter, data):
+        return self._map("encrypt_ctr", data, int.from_bytes(counter, byteorder="big"))
+
+    decrypt_ctr = encrypt_ctr
+
+    def _map(self, method, data, ctr):
+        if len(data) % 16 and (ctr is None):
+            raise RegistryError("Data length must be a multiple of 16 bytes")
+
+        # Block aligned chunks, one per worker
+        chunk_sz = max(16, ((len(data) // self._workers) + 15) & ~0xf)
+        chunks = [ (off, bytes(data[off:off+chunk_sz])) for off in range(0, len(data), chunk_sz) ]
+
+        if ParallelCipher._executor is None:
+            import concurrent.futures
+            ParallelCipher._executor = concurrent.futures.ProcessPoolExecutor(self._workers)
+
+        jobs = []
+        for (off, chunk) in chunks:
+            if ctr is None:
+                args = (chunk, False)
+            else:
+                args = (((ctr + (off // 16)) & 0xffffffffffffffffffffffffffffffff).to_bytes(16, byteorder="big"), chunk)
+            jobs.append(ParallelCipher._executor.submit(_worker, self._name, self._key, len(chunk), method, args))
+
+        out = bytearray(len(data))
+        for ((off, chunk), job) in zip(chunks, jobs):
+            out[off:off+len(chunk)] = job.result()
+
+        return out
+
+def _worker(name, key, size, method, args):
+    # Runs in a pool process, with the best backend of that process. The fast contexts come from the
+    # from_key() cache of the worker, a key is only expanded once per process.
+    ctx = Cipher(name, key, _select(name, size.bit_length(), False))
+    return getattr(ctx, method)(*args)
+
+if __name__ == "__main__":
+    # Test vectors
+    key = b"\x2b\x7e\x15\x16\x28\xae\xd2\xa6\xab\xf7\x15\x88\x09\xcf\x4f\x3c"
+    plain = b"\x32\x43\xf6\xa8\x88\x5a\x30\x8d\x31\x31\x98\xa2\xe0\x37\x07\x34"
+    expected = b"\x39\x25\x84\x1d\x02\xdc\x09\xfb\xdc\x11\x85\x97\x19\x6a\x0b\x32"
+
+    data = os.urandom(1 << 16)
+    counter = os.urandom(16)
+
+    start = time.time_ns()
+
+    res_test = (get_cipher("aes")(key).encrypt(plain) == expected)
+    res_test = res_test and (get_hash("sha3-256")().finish() == get_hash("sha3-256", "slow")().finish())
+
+    ref = get_cipher("twofish", "fast")(key).encrypt_ctr(counter, data)
+    for backend in [ b for b in _CIPHERS["twofish"] if BACKENDS[b] and (b != "slow") ]:
+        res_test = res_test and (get_cipher("twofish", backend)(key).encrypt_ctr(counter, data) == ref)
+
+    # Same methods on both sides of the NumPy and process thresholds
+    ctx = get_cipher("twofish")(key)
+    for size in [ 16, 1 << 12 ]:
+        iv = data[:16]
+        res_test = res_test and (ctx.decrypt(ctx.encrypt(plain)) == plain)
+        res_test = res_test and (ctx.decrypt_cbc(iv, ctx.encrypt_cbc(iv, data[:size])) == data[:size])
+        res_test = res_test and (ctx.decrypt_ecb(ctx.encrypt_ecb(data[:size])) == data[:size])
+        res_test = res_test and (ctx.decrypt_ctr(counter, ctx.encrypt_ctr(counter, data[:size])) == data[:size])
+    res_test = res_test and (ctx.encrypt_ctr(counter, data) == ref)
+
+    # Every cipher through every backend: construction, then ECB and CBC round trips for the block ciphers
+    nonce = os.urandom(8)
+    for name in _CIPHERS:
+        for backend in [ "auto" ] + [ b for b in _CIPHERS[name] if BACKENDS[b] ]:
+            if "salsa20" == name:
+                ctx = get_cipher(name, backend)(key, nonce)
+                res_test = res_test and (get_cipher(name, backend)(key, nonce).encrypt(ctx.encrypt(data[:100])) == data[:100])
+                continue
+
+            ctx = get_cipher(name, backend)(key)
+            res_test = res_test and (ctx.decrypt(ctx.encrypt(plain)) == plain)
+            if "slow" == backend:
+                # The reference implementations are single block only
+                continue
+
+            for size in [ 5, 16, 1 << 12 ]:
+                iv = data[:16]
+                res_test = res_test and (ctx.decrypt_ecb(ctx.encrypt_ecb(data[:size])) == data[:size])
+                res_test = res_test and (ctx.decrypt_cbc(iv, ctx.encrypt_cbc(iv, data[:size])) == data[:size])
+
+    # The process pool directly, it is only picked on machines with several CPUs
+    if _available("_multiprocessing") and _available("concurrent.futures"):
+        for name in [ "aes", "twofish" ]:
+            ctx = ParallelCipher(name, key, 2)
+            for size in [ 5, 1 << 12 ]:
+                res_test = res_test and (ctx.encrypt_ecb(data[:size]) == get_cipher(name, "fast")(key).encrypt_ecb(data[:size]))
+                res_test = res_test and (ctx.decrypt_ecb(ctx.encrypt_ecb(data[:size])) == data[:size])
+
+    end = time.time_ns()
+    elapsed_time = (end - start) / (10 ** 9)
+
+    # Check tests
+    print("Backends: ", ", ".join([ b for b in BACKENDS if BACKENDS[b] ]))
+    print("Auto: ", ", ".join([ str(1 << i) + " -> " + _select("twofish", i + 1, True) for i in range(0, 28, 4) ]))
+    print("Test: ", res_test)
+    print("Time: ", elapsed_time, "s")
+
+    exit(0)
@@ -57,7 +57,7 @@ class Rijndael:
 
     @staticmethod
     def _KeyExpansion(key):
-        (nk, nr) = (len(key) // 4, [ 10, 12, 14 ][(len(key) // 16) - 1])
+        (nk, nr) = (len(key) // 4, (len(key) // 4) + 6)
 
         Rcon = [ 0  for i in range(nr + 1) ]
         Rcon[1] = 1
@@ -73,7 +73,7 @@ class Rijndael:
                 temp = [ Rijndael._SBox(temp[i]) for i in range(4) ]
                 temp[0] = temp[0] ^ Rcon[i // nk]
             elif (nk > 6) and ((i % nk) == 4):
-                temp = temp[1 : 4] + [ temp[0] ]
+                temp = [ Rijndael._SBox(temp[i]) for i in range(4) ]
             w[4 * i : 4 * (i+1)] = [ w[4 * (i-nk) + j] ^ temp[j] for j in range(4) ]
 
         return [ w[i * 16 : (i+1) * 16] for i in range(nr + 1) ]
@@ -237,6 +237,17 @@ if __name__ == "__main__":
     decipher = rijndael_ctx.decrypt(cipher)
     res_test = (cipher == expected) and (plain == decipher)
 
+    # FIPS-197 C.2 and C.3, 192 and 256 bits keys
+    plain_c = b"\x00\x11\x22\x33\x44\x55\x66\x77\x88\x99\xaa\xbb\xcc\xdd\xee\xff"
+    expected_c = {
+            24 : b"\xdd\xa9\x7c\xa4\x86\x4c\xdf\xe0\x6e\xaf\x70\xa0\xec\x0d\x71\x91",
+            32 : b"\x8e\xa2\xb7\xca\x51\x67\x45\xbf\xea\xfc\x49\x90\x4b\x49\x60\x89",
+            }
+    for key_sz in expected_c:
+        ctx = Rijndael(bytes(range(key_sz)))
+        cipher_c = ctx.encrypt(plain_c)
+        res_test = res_test and (cipher_c == expected_c[key_sz]) and (ctx.decrypt(cipher_c) == plain_c)
+
     for test in tests:
         cipher = rijndael_ctx.encrypt(test)
         decipher = rijndael_ctx.decrypt(cipher)
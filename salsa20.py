@@ -1,42 +1,122 @@
 #!/usr/bin/env python
 
+import os
+import struct
+import time
+
+class Salsa20Error(Exception):
+    pass
+
 class Salsa20:
-    def __init__(self, key, nonce):
+    _SIGMA = struct.unpack("<4I", b"expand 32-byte k")
+    _TAU = struct.unpack("<4I", b"expand 16-byte k")
+
+    def __init__(self, key, nonce, counter=0):
         if not len(key) in [ 16, 32 ]:
             raise Salsa20Error("Key length should be 16 or 32 bytes")
 
         if not len(nonce) in [ 8 ]:
             raise Salsa20Error("Nonce should be 8 bytes")
 
-        self._k = [ k for k in key ]
-        self._v = [ n for n in nonce] + [ 0 for i in range(8) ]
+        # Input words of the core, the block counter (words 8 and 9) may start anywhere, e.g. to process a
+        # stream in independent chunks
+        self._x = Salsa20._input(key, struct.unpack("<2I", nonce) + (0, 0))
+        self._ctr = counter
 
         self._msg_sz = 0
 
-        self._buffer = Salsa20._expand(self._k, self._v)
-        self._buffer_sz = 0
+        # Keystream left over from the previous call
+        self._ks = b""
 
     def encrypt(self, plaintext):
-        ciphertext = [ p for p in plaintext ]
+        # Whole keystream blocks at once, XORed with the message as one little endian integer
+        n = len(plaintext)
 
-        self._msg_sz += len(plaintext)
+        self._msg_sz += n
         if self._msg_sz > 2**70:
             raise Salsa20Error("Maximum message length has been reached")
 
-        for i in range(len(ciphertext)):
-            ciphertext[i] ^= self._buffer[self._buffer_sz]
-            self._buffer_sz += 1
+        if len(self._ks) < n:
+            self._ks += self._keystream((n - len(self._ks) + 63) // 64)
+
+        ks = self._ks[:n]
+        self._ks = self._ks[n:]
+
+        return (int.from_bytes(plaintext, byteorder="little") ^ int.from_bytes(ks, byteorder="little")).to_bytes(n, byteorder="little")
+
+    def _keystream(self, blocks):
+        x = self._x
+        core = Salsa20._core
+        pack = struct.pack
+        out = [ ]
+
+        for i in range(blocks):
+            ctr = (self._ctr + i) & 0xffffffffffffffff
+            x[8] = ctr & 0xffffffff
+            x[9] = ctr >> 32
+            out.append(pack("<16I", *[ (z + y) & 0xffffffff for (z, y) in zip(core(x), x) ]))
+
+        self._ctr = (self._ctr + blocks) & 0xffffffffffffffff
+
+        return b"".join(out)
+
+    @staticmethod
+    def _input(key, n):
+        # Constants on the diagonal, 16 bytes keys are used twice, then 4 words of nonce and counter
+        (c, k) = (Salsa20._SIGMA, struct.unpack("<8I", key)) if (32 == len(key)) else (Salsa20._TAU, struct.unpack("<4I", key) * 2)
+        return [ c[0], k[0], k[1], k[2], k[3], c[1], n[0], n[1], n[2], n[3], c[2], k[4], k[5], k[6], k[7], c[3] ]
+
+    @staticmethod
+    def _core(x):
+        # 20 rounds on the 16 words, without the final addition (which HSalsa20 leaves out)
+        (x0, x1, x2, x3, x4, x5, x6, x7, x8, x9, x10, x11, x12, x13, x14, x15) = x
 
-            if 64 == self._buffer_sz:
-                for i in range(8, 16):
-                    self._v[i] = (self._v[i] + 1) % 256
-                    if self._v[i] != 0:
-                        break
+        for i in range(10):
+            # Column round
+            t = (x0 + x12) & 0xffffffff;  x4 ^= ((t << 7) & 0xffffffff) | (t >> 25)
+            t = (x4 + x0) & 0xffffffff;   x8 ^= ((t << 9) & 0xffffffff) | (t >> 23)
+            t = (x8 + x4) & 0xffffffff;   x12 ^= ((t << 13) & 0xffffffff) | (t >> 19)
+            t = (x12 + x8) & 0xffffffff;  x0 ^= ((t << 18) & 0xffffffff) | (t >> 14)
+            t = (x5 + x1) & 0xffffffff;   x9 ^= ((t << 7) & 0xffffffff) | (t >> 25)
+            t = (x9 + x5) & 0xffffffff;   x13 ^= ((t << 9) & 0xffffffff) | (t >> 23)
+            t = (x13 + x9) & 0xffffffff;  x1 ^= ((t << 13) & 0xffffffff) | (t >> 19)
+            t = (x1 + x13) & 0xffffffff;  x5 ^= ((t << 18) & 0xffffffff) | (t >> 14)
+            t = (x10 + x6) & 0xffffffff;  x14 ^= ((t << 7) & 0xffffffff) | (t >> 25)
+            t = (x14 + x10) & 0xffffffff; x2 ^= ((t << 9) & 0xffffffff) | (t >> 23)
+            t = (x2 + x14) & 0xffffffff;  x6 ^= ((t << 13) & 0xffffffff) | (t >> 19)
+            t = (x6 + x2) & 0xffffffff;   x10 ^= ((t << 18) & 0xffffffff) | (t >> 14)
+            t = (x15 + x11) & 0xffffffff; x3 ^= ((t << 7) & 0xffffffff) | (t >> 25)
+            t = (x3 + x15) & 0xffffffff;  x7 ^= ((t << 9) & 0xffffffff) | (t >> 23)
+            t = (x7 + x3) & 0xffffffff;   x11 ^= ((t << 13) & 0xffffffff) | (t >> 19)
+            t = (x11 + x7) & 0xffffffff;  x15 ^= ((t << 18) & 0xffffffff) | (t >> 14)
+
+            # Row round
+            t = (x0 + x3) & 0xffffffff;   x1 ^= ((t << 7) & 0xffffffff) | (t >> 25)
+            t = (x1 + x0) & 0xffffffff;   x2 ^= ((t << 9) & 0xffffffff) | (t >> 23)
+            t = (x2 + x1) & 0xffffffff;   x3 ^= ((t << 13) & 0xffffffff) | (t >> 19)
+            t = (x3 + x2) & 0xffffffff;   x0 ^= ((t << 18) & 0xffffffff) | (t >> 14)
+            t = (x5 + x4) & 0xffffffff;   x6 ^= ((t << 7) & 0xffffffff) | (t >> 25)
+            t = (x6 + x5) & 0xffffffff;   x7 ^= ((t << 9) & 0xffffffff) | (t >> 23)
+            t = (x7 + x6) & 0xffffffff;   x4 ^= ((t << 13) & 0xffffffff) | (t >> 19)
+            t = (x4 + x7) & 0xffffffff;   x5 ^= ((t << 18) & 0xffffffff) | (t >> 14)
+            t = (x10 + x9) & 0xffffffff;  x11 ^= ((t << 7) & 0xffffffff) | (t >> 25)
+            t = (x11 + x10) & 0xffffffff; x8 ^= ((t << 9) & 0xffffffff) | (t >> 23)
+            t = (x8 + x11) & 0xffffffff;  x9 ^= ((t << 13) & 0xffffffff) | (t >> 19)
+            t = (x9 + x8) & 0xffffffff;   x10 ^= ((t << 18) & 0xffffffff) | (t >> 14)
+            t = (x15 + x14) & 0xffffffff; x12 ^= ((t << 7) & 0xffffffff) | (t >> 25)
+            t = (x12 + x15) & 0xffffffff; x13 ^= ((t << 9) & 0xffffffff) | (t >> 23)
+            t = (x13 + x12) & 0xffffffff; x14 ^= ((t << 13) & 0xffffffff) | (t >> 19)
+            t = (x14 + x13) & 0xffffffff; x15 ^= ((t << 18) & 0xffffffff) | (t >> 14)
+
+        return (x0, x1, x2, x3, x4, x5, x6, x7, x8, x9, x10, x11, x12, x13, x14, x15)
 
-                self._buffer = Salsa20._expand(self._k, self._v)
-                self._buffer_sz = 0
+    @staticmethod
+    def _hsalsa20(key, nonce):
+        # Subkey of XSalsa20 from a 32 bytes key and the first 16 bytes of the nonce
+        z = Salsa20._core(Salsa20._input(key, struct.unpack("<4I", nonce)))
+        return struct.pack("<8I", z[0], z[5], z[10], z[15], z[6], z[7], z[8], z[9])
 
-        return bytes(ciphertext)
+    # Reference implementation of the specification, kept to check the core against
 
     @staticmethod
     def _quaterround(y):
@@ -111,6 +191,17 @@ class Salsa20:
 
         return Salsa20._hash(o[0:4] + k[0:16] + o[4:8] + n + o[8:12] + k[16:32] + o[12:16])
 
+class XSalsa20(Salsa20):
+    # Salsa20 with a 24 bytes nonce: the key is first mixed with 16 bytes of it by HSalsa20
+    def __init__(self, key, nonce, counter=0):
+        if len(key) != 32:
+            raise Salsa20Error("Key length should be 32 bytes")
+
+        if len(nonce) != 24:
+            raise Salsa20Error("Nonce should be 24 bytes")
+
+        Salsa20.__init__(self, Salsa20._hsalsa20(key, nonce[:16]), nonce[16:], counter)
+
 if __name__ == "__main__":
     key = b"\x80" + b"\x00" * 15
     iv = b"\x00" * 8
@@ -122,14 +213,32 @@ if __name__ == "__main__":
             + b"\x8c\x67\x13\xec\x66\xc5\x18\x81\x11\x15\x93\xcc\xb3\xe8\xcb\x8f\x8d\xe1\x24\x08\x05\x01\xee\xeb\x38\x9c\x4b\xcb\x69\x77\xcf\x95"
             ]
 
+    start = time.time_ns()
+
     # Perform encryption
     salsa20_ctx = Salsa20(key, iv)
     ciphertext = salsa20_ctx.encrypt(plaintext)
-    print(ciphertext == expected[0])
+    res_test = (ciphertext == expected[0])
 
     ciphertext = salsa20_ctx.encrypt(plaintext)
     ciphertext = salsa20_ctx.encrypt(plaintext)
     ciphertext = salsa20_ctx.encrypt(plaintext)
-    print(ciphertext == expected[1])
+    res_test = res_test and (ciphertext == expected[1])
+
+    # Unrolled core against the reference one, odd sized pieces against one call
+    (key, iv, counter) = (os.urandom(32), os.urandom(8), 0xffffffff)
+    ks = Salsa20(key, iv, counter).encrypt(bytes(128))
+    res_test = res_test and (ks == bytes(Salsa20._expand(list(key), list(iv + counter.to_bytes(8, byteorder="little")))) + bytes(Salsa20._expand(list(key), list(iv + (counter + 1).to_bytes(8, byteorder="little")))))
+
+    data = os.urandom(1000)
+    salsa20_ctx = Salsa20(key, iv)
+    res_test = res_test and (b"".join([ salsa20_ctx.encrypt(data[i:i+37]) for i in range(0, len(data), 37) ]) == Salsa20(key, iv).encrypt(data))
+
+    end = time.time_ns()
+    elapsed_time = (end - start) / (10 ** 9)
+
+    # Check tests
+    print("Test: ", res_test)
+    print("Time: ", elapsed_time, "s")
 
     exit(0)
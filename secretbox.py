@@ -0,0 +1,104 @@
+#!/usr/bin/env python
+
+import os
+import time
+
+from poly1305 import Poly1305
+from salsa20 import XSalsa20
+
+class SecretBoxError(Exception):
+    pass
+
+class SecretBox:
+    # XSalsa20-Poly1305 as NaCl crypto_secretbox: the first 32 bytes of the keystream are the Poly1305 key,
+    # the message is encrypted with the keystream that follows. Boxes are tag || ciphertext.
+    TAG_SZ = 16
+    NONCE_SZ = 24
+
+    def __init__(self, key):
+        if len(key) != 32:
+            raise SecretBoxError("Key length should be 32 bytes")
+
+        self._key = bytes(key)
+
+    def encrypt(self, nonce, message):
+        ctx = self._stream(nonce)
+        mac_key = ctx.encrypt(bytes(32))
+
+        ciphertext = ctx.encrypt(message)
+
+        return Poly1305.mac(mac_key, ciphertext) + ciphertext
+
+    def decrypt(self, nonce, box):
+        if len(box) < SecretBox.TAG_SZ:
+            raise SecretBoxError("Box is too short")
+
+        ctx = self._stream(nonce)
+        mac_key = ctx.encrypt(bytes(32))
+
+        # Nothing is decrypted before the tag has been checked
+        ciphertext = bytes(box[SecretBox.TAG_SZ:])
+        if not Poly1305.verify(mac_key, ciphertext, box[:SecretBox.TAG_SZ]):
+            raise SecretBoxError("Authentication failed")
+
+        return ctx.encrypt(ciphertext)
+
+    def _stream(self, nonce):
+        if len(nonce) != SecretBox.NONCE_SZ:
+            raise SecretBoxError("Nonce should be 24 bytes")
+
+        return XSalsa20(self._key, nonce)
+
+if __name__ == "__main__":
+    from salsa20 import Salsa20
+
+    # Test vector of NaCl (tests/secretbox.c)
+    key = bytes.fromhex("1b27556473e985d462cd51197a9a46c76009549eac6474f206c4ee0844f68389")
+    nonce = bytes.fromhex("69696ee955b62b73cd62bda875fc73d68219e0036b7a0b37")
+    message = bytes.fromhex(
+            "be075fc53c81f2d5cf141316ebeb0c7b5228c52a4c62cbd44b66849b64244ffc"
+            "e5ecbaaf33bd751a1ac728d45e6c61296cdc3c01233561f41db66cce314adb31"
+            "0e3be8250c46f06dceea3a7fa1348057e2f6556ad6b1318a024a838f21af1fde"
+            "048977eb48f59ffd4924ca1c60902e52f0a089bc76897040e082f93776384864"
+            "5e0705")
+    expected = bytes.fromhex(
+            "f3ffc7703f9400e52a7dfb4b3d3305d98e993b9f48681273c29650ba32fc76ce"
+            "48332ea7164d96a4476fb8c531a1186ac0dfc17c98dce87b4da7f011ec48c972"
+            "71d2c20f9b928fe2270d6fb863d51738b48eeee314a7cc8ab932164548e526ae"
+            "90224368517acfeabd6bb3732bc0e9da99832b61ca01b6de56244a9e88d5f9b3"
+            "7973f622a43d14a6599b1f654cb45a74e355a5")
+
+    start = time.time_ns()
+
+    box = SecretBox(key)
+    res_test = (box.encrypt(nonce, message) == expected)
+    res_test = res_test and (box.decrypt(nonce, expected) == message)
+
+    # Tampering is detected
+    try:
+        box.decrypt(nonce, expected[:-1] + bytes([ expected[-1] ^ 1 ]))
+        res_test = False
+    except SecretBoxError:
+        pass
+
+    end = time.time_ns()
+    elapsed_time = (end - start) / (10 ** 9)
+
+    # Throughput against plain Salsa20
+    data = os.urandom(256 << 10)
+    rates = [ ]
+    for (label, f) in [
+            ("salsa20", lambda: Salsa20(key, nonce[:8]).encrypt(data)),
+            ("poly1305", lambda: Poly1305.mac(key, data)),
+            ("secretbox", lambda: box.encrypt(nonce, data)),
+            ]:
+        t = time.perf_counter_ns()
+        f()
+        rates.append("%s %.2f MB/s" % (label, (len(data) / (1 << 20)) / ((time.perf_counter_ns() - t) / (10 ** 9))))
+
+    # Check tests
+    print("Rates: ", ", ".join(rates))
+    print("Test: ", res_test)
+    print("Time: ", elapsed_time, "s")
+
+    exit(0)
@@ -34,7 +34,6 @@ class SHA3:
 
         if len(data) > 0:
             self._absorb(data[:])
-            self._buffer_sz = len(data)
 
     def finish(self):
         pad_sz = self._r - self._buffer_sz
@@ -0,0 +1,614 @@
+# Generated by gen_tables.py, do not edit.
+#
+# 8 bits tables are bytes objects, 32 bits tables are array("I") of little endian words.
+
+import array
+import sys
+
+def _u32(blob):
+    a = array.array("I" if array.array("I").itemsize == 4 else "L")
+    a.frombytes(blob)
+    if "big" == sys.byteorder:
+        a.byteswap()
+    return a
+
+RIJNDAEL_INV_MC = [
+        _u32((
+            b"\x50\xa7\xf4\x51\x53\x65\x41\x7e\xc3\xa4\x17\x1a\x96\x5e\x27\x3a\xcb\x6b\xab\x3b\xf1\x45\x9d\x1f\xab\x58\xfa\xac\x93\x03\xe3\x4b"
+            b"\x55\xfa\x30\x20\xf6\x6d\x76\xad\x91\x76\xcc\x88\x25\x4c\x02\xf5\xfc\xd7\xe5\x4f\xd7\xcb\x2a\xc5\x80\x44\x35\x26\x8f\xa3\x62\xb5"
+            b"\x49\x5a\xb1\xde\x67\x1b\xba\x25\x98\x0e\xea\x45\xe1\xc0\xfe\x5d\x02\x75\x2f\xc3\x12\xf0\x4c\x81\xa3\x97\x46\x8d\xc6\xf9\xd3\x6b"
+            b"\xe7\x5f\x8f\x03\x95\x9c\x92\x15\xeb\x7a\x6d\xbf\xda\x59\x52\x95\x2d\x83\xbe\xd4\xd3\x21\x74\x58\x29\x69\xe0\x49\x44\xc8\xc9\x8e"
+            b"\x6a\x89\xc2\x75\x78\x79\x8e\xf4\x6b\x3e\x58\x99\xdd\x71\xb9\x27\xb6\x4f\xe1\xbe\x17\xad\x88\xf0\x66\xac\x20\xc9\xb4\x3a\xce\x7d"
+            b"\x18\x4a\xdf\x63\x82\x31\x1a\xe5\x60\x33\x51\x97\x45\x7f\x53\x62\xe0\x77\x64\xb1\x84\xae\x6b\xbb\x1c\xa0\x81\xfe\x94\x2b\x08\xf9"
+            b"\x58\x68\x48\x70\x19\xfd\x45\x8f\x87\x6c\xde\x94\xb7\xf8\x7b\x52\x23\xd3\x73\xab\xe2\x02\x4b\x72\x57\x8f\x1f\xe3\x2a\xab\x55\x66"
+            b"\x07\x28\xeb\xb2\x03\xc2\xb5\x2f\x9a\x7b\xc5\x86\xa5\x08\x37\xd3\xf2\x87\x28\x30\xb2\xa5\xbf\x23\xba\x6a\x03\x02\x5c\x82\x16\xed"
+            b"\x2b\x1c\xcf\x8a\x92\xb4\x79\xa7\xf0\xf2\x07\xf3\xa1\xe2\x69\x4e\xcd\xf4\xda\x65\xd5\xbe\x05\x06\x1f\x62\x34\xd1\x8a\xfe\xa6\xc4"
+            b"\x9d\x53\x2e\x34\xa0\x55\xf3\xa2\x32\xe1\x8a\x05\x75\xeb\xf6\xa4\x39\xec\x83\x0b\xaa\xef\x60\x40\x06\x9f\x71\x5e\x51\x10\x6e\xbd"
+            b"\xf9\x8a\x21\x3e\x3d\x06\xdd\x96\xae\x05\x3e\xdd\x46\xbd\xe6\x4d\xb5\x8d\x54\x91\x05\x5d\xc4\x71\x6f\xd4\x06\x04\xff\x15\x50\x60"
+            b"\x24\xfb\x98\x19\x97\xe9\xbd\xd6\xcc\x43\x40\x89\x77\x9e\xd9\x67\xbd\x42\xe8\xb0\x88\x8b\x89\x07\x38\x5b\x19\xe7\xdb\xee\xc8\x79"
+            b"\x47\x0a\x7c\xa1\xe9\x0f\x42\x7c\xc9\x1e\x84\xf8\x00\x00\x00\x00\x83\x86\x80\x09\x48\xed\x2b\x32\xac\x70\x11\x1e\x4e\x72\x5a\x6c"
+            b"\xfb\xff\x0e\xfd\x56\x38\x85\x0f\x1e\xd5\xae\x3d\x27\x39\x2d\x36\x64\xd9\x0f\x0a\x21\xa6\x5c\x68\xd1\x54\x5b\x9b\x3a\x2e\x36\x24"
+            b"\xb1\x67\x0a\x0c\x0f\xe7\x57\x93\xd2\x96\xee\xb4\x9e\x91\x9b\x1b\x4f\xc5\xc0\x80\xa2\x20\xdc\x61\x69\x4b\x77\x5a\x16\x1a\x12\x1c"
+            b"\x0a\xba\x93\xe2\xe5\x2a\xa0\xc0\x43\xe0\x22\x3c\x1d\x17\x1b\x12\x0b\x0d\x09\x0e\xad\xc7\x8b\xf2\xb9\xa8\xb6\x2d\xc8\xa9\x1e\x14"
+            b"\x85\x19\xf1\x57\x4c\x07\x75\xaf\xbb\xdd\x99\xee\xfd\x60\x7f\xa3\x9f\x26\x01\xf7\xbc\xf5\x72\x5c\xc5\x3b\x66\x44\x34\x7e\xfb\x5b"
+            b"\x76\x29\x43\x8b\xdc\xc6\x23\xcb\x68\xfc\xed\xb6\x63\xf1\xe4\xb8\xca\xdc\x31\xd7\x10\x85\x63\x42\x40\x22\x97\x13\x20\x11\xc6\x84"
+            b"\x7d\x24\x4a\x85\xf8\x3d\xbb\xd2\x11\x32\xf9\xae\x6d\xa1\x29\xc7\x4b\x2f\x9e\x1d\xf3\x30\xb2\xdc\xec\x52\x86\x0d\xd0\xe3\xc1\x77"
+            b"\x6c\x16\xb3\x2b\x99\xb9\x70\xa9\xfa\x48\x94\x11\x22\x64\xe9\x47\xc4\x8c\xfc\xa8\x1a\x3f\xf0\xa0\xd8\x2c\x7d\x56\xef\x90\x33\x22"
+            b"\xc7\x4e\x49\x87\xc1\xd1\x38\xd9\xfe\xa2\xca\x8c\x36\x0b\xd4\x98\xcf\x81\xf5\xa6\x28\xde\x7a\xa5\x26\x8e\xb7\xda\xa4\xbf\xad\x3f"
+            b"\xe4\x9d\x3a\x2c\x0d\x92\x78\x50\x9b\xcc\x5f\x6a\x62\x46\x7e\x54\xc2\x13\x8d\xf6\xe8\xb8\xd8\x90\x5e\xf7\x39\x2e\xf5\xaf\xc3\x82"
+            b"\xbe\x80\x5d\x9f\x7c\x93\xd0\x69\xa9\x2d\xd5\x6f\xb3\x12\x25\xcf\x3b\x99\xac\xc8\xa7\x7d\x18\x10\x6e\x63\x9c\xe8\x7b\xbb\x3b\xdb"
+            b"\x09\x78\x26\xcd\xf4\x18\x59\x6e\x01\xb7\x9a\xec\xa8\x9a\x4f\x83\x65\x6e\x95\xe6\x7e\xe6\xff\xaa\x08\xcf\xbc\x21\xe6\xe8\x15\xef"
+            b"\xd9\x9b\xe7\xba\xce\x36\x6f\x4a\xd4\x09\x9f\xea\xd6\x7c\xb0\x29\xaf\xb2\xa4\x31\x31\x23\x3f\x2a\x30\x94\xa5\xc6\xc0\x66\xa2\x35"
+            b"\x37\xbc\x4e\x74\xa6\xca\x82\xfc\xb0\xd0\x90\xe0\x15\xd8\xa7\x33\x4a\x98\x04\xf1\xf7\xda\xec\x41\x0e\x50\xcd\x7f\x2f\xf6\x91\x17"
+            b"\x8d\xd6\x4d\x76\x4d\xb0\xef\x43\x54\x4d\xaa\xcc\xdf\x04\x96\xe4\xe3\xb5\xd1\x9e\x1b\x88\x6a\x4c\xb8\x1f\x2c\xc1\x7f\x51\x65\x46"
+            b"\x04\xea\x5e\x9d\x5d\x35\x8c\x01\x73\x74\x87\xfa\x2e\x41\x0b\xfb\x5a\x1d\x67\xb3\x52\xd2\xdb\x92\x33\x56\x10\xe9\x13\x47\xd6\x6d"
+            b"\x8c\x61\xd7\x9a\x7a\x0c\xa1\x37\x8e\x14\xf8\x59\x89\x3c\x13\xeb\xee\x27\xa9\xce\x35\xc9\x61\xb7\xed\xe5\x1c\xe1\x3c\xb1\x47\x7a"
+            b"\x59\xdf\xd2\x9c\x3f\x73\xf2\x55\x79\xce\x14\x18\xbf\x37\xc7\x73\xea\xcd\xf7\x53\x5b\xaa\xfd\x5f\x14\x6f\x3d\xdf\x86\xdb\x44\x78"
+            b"\x81\xf3\xaf\xca\x3e\xc4\x68\xb9\x2c\x34\x24\x38\x5f\x40\xa3\xc2\x72\xc3\x1d\x16\x0c\x25\xe2\xbc\x8b\x49\x3c\x28\x41\x95\x0d\xff"
+            b"\x71\x01\xa8\x39\xde\xb3\x0c\x08\x9c\xe4\xb4\xd8\x90\xc1\x56\x64\x61\x84\xcb\x7b\x70\xb6\x32\xd5\x74\x5c\x6c\x48\x42\x57\xb8\xd0"
+        )),
+        _u32((
+            b"\xa7\xf4\x51\x50\x65\x41\x7e\x53\xa4\x17\x1a\xc3\x5e\x27\x3a\x96\x6b\xab\x3b\xcb\x45\x9d\x1f\xf1\x58\xfa\xac\xab\x03\xe3\x4b\x93"
+            b"\xfa\x30\x20\x55\x6d\x76\xad\xf6\x76\xcc\x88\x91\x4c\x02\xf5\x25\xd7\xe5\x4f\xfc\xcb\x2a\xc5\xd7\x44\x35\x26\x80\xa3\x62\xb5\x8f"
+            b"\x5a\xb1\xde\x49\x1b\xba\x25\x67\x0e\xea\x45\x98\xc0\xfe\x5d\xe1\x75\x2f\xc3\x02\xf0\x4c\x81\x12\x97\x46\x8d\xa3\xf9\xd3\x6b\xc6"
+            b"\x5f\x8f\x03\xe7\x9c\x92\x15\x95\x7a\x6d\xbf\xeb\x59\x52\x95\xda\x83\xbe\xd4\x2d\x21\x74\x58\xd3\x69\xe0\x49\x29\xc8\xc9\x8e\x44"
+            b"\x89\xc2\x75\x6a\x79\x8e\xf4\x78\x3e\x58\x99\x6b\x71\xb9\x27\xdd\x4f\xe1\xbe\xb6\xad\x88\xf0\x17\xac\x20\xc9\x66\x3a\xce\x7d\xb4"
+            b"\x4a\xdf\x63\x18\x31\x1a\xe5\x82\x33\x51\x97\x60\x7f\x53\x62\x45\x77\x64\xb1\xe0\xae\x6b\xbb\x84\xa0\x81\xfe\x1c\x2b\x08\xf9\x94"
+            b"\x68\x48\x70\x58\xfd\x45\x8f\x19\x6c\xde\x94\x87\xf8\x7b\x52\xb7\xd3\x73\xab\x23\x02\x4b\x72\xe2\x8f\x1f\xe3\x57\xab\x55\x66\x2a"
+            b"\x28\xeb\xb2\x07\xc2\xb5\x2f\x03\x7b\xc5\x86\x9a\x08\x37\xd3\xa5\x87\x28\x30\xf2\xa5\xbf\x23\xb2\x6a\x03\x02\xba\x82\x16\xed\x5c"
+            b"\x1c\xcf\x8a\x2b\xb4\x79\xa7\x92\xf2\x07\xf3\xf0\xe2\x69\x4e\xa1\xf4\xda\x65\xcd\xbe\x05\x06\xd5\x62\x34\xd1\x1f\xfe\xa6\xc4\x8a"
+            b"\x53\x2e\x34\x9d\x55\xf3\xa2\xa0\xe1\x8a\x05\x32\xeb\xf6\xa4\x75\xec\x83\x0b\x39\xef\x60\x40\xaa\x9f\x71\x5e\x06\x10\x6e\xbd\x51"
+            b"\x8a\x21\x3e\xf9\x06\xdd\x96\x3d\x05\x3e\xdd\xae\xbd\xe6\x4d\x46\x8d\x54\x91\xb5\x5d\xc4\x71\x05\xd4\x06\x04\x6f\x15\x50\x60\xff"
+            b"\xfb\x98\x19\x24\xe9\xbd\xd6\x97\x43\x40\x89\xcc\x9e\xd9\x67\x77\x42\xe8\xb0\xbd\x8b\x89\x07\x88\x5b\x19\xe7\x38\xee\xc8\x79\xdb"
+            b"\x0a\x7c\xa1\x47\x0f\x42\x7c\xe9\x1e\x84\xf8\xc9\x00\x00\x00\x00\x86\x80\x09\x83\xed\x2b\x32\x48\x70\x11\x1e\xac\x72\x5a\x6c\x4e"
+            b"\xff\x0e\xfd\xfb\x38\x85\x0f\x56\xd5\xae\x3d\x1e\x39\x2d\x36\x27\xd9\x0f\x0a\x64\xa6\x5c\x68\x21\x54\x5b\x9b\xd1\x2e\x36\x24\x3a"
+            b"\x67\x0a\x0c\xb1\xe7\x57\x93\x0f\x96\xee\xb4\xd2\x91\x9b\x1b\x9e\xc5\xc0\x80\x4f\x20\xdc\x61\xa2\x4b\x77\x5a\x69\x1a\x12\x1c\x16"
+            b"\xba\x93\xe2\x0a\x2a\xa0\xc0\xe5\xe0\x22\x3c\x43\x17\x1b\x12\x1d\x0d\x09\x0e\x0b\xc7\x8b\xf2\xad\xa8\xb6\x2d\xb9\xa9\x1e\x14\xc8"
+            b"\x19\xf1\x57\x85\x07\x75\xaf\x4c\xdd\x99\xee\xbb\x60\x7f\xa3\xfd\x26\x01\xf7\x9f\xf5\x72\x5c\xbc\x3b\x66\x44\xc5\x7e\xfb\x5b\x34"
+            b"\x29\x43\x8b\x76\xc6\x23\xcb\xdc\xfc\xed\xb6\x68\xf1\xe4\xb8\x63\xdc\x31\xd7\xca\x85\x63\x42\x10\x22\x97\x13\x40\x11\xc6\x84\x20"
+            b"\x24\x4a\x85\x7d\x3d\xbb\xd2\xf8\x32\xf9\xae\x11\xa1\x29\xc7\x6d\x2f\x9e\x1d\x4b\x30\xb2\xdc\xf3\x52\x86\x0d\xec\xe3\xc1\x77\xd0"
+            b"\x16\xb3\x2b\x6c\xb9\x70\xa9\x99\x48\x94\x11\xfa\x64\xe9\x47\x22\x8c\xfc\xa8\xc4\x3f\xf0\xa0\x1a\x2c\x7d\x56\xd8\x90\x33\x22\xef"
+            b"\x4e\x49\x87\xc7\xd1\x38\xd9\xc1\xa2\xca\x8c\xfe\x0b\xd4\x98\x36\x81\xf5\xa6\xcf\xde\x7a\xa5\x28\x8e\xb7\xda\x26\xbf\xad\x3f\xa4"
+            b"\x9d\x3a\x2c\xe4\x92\x78\x50\x0d\xcc\x5f\x6a\x9b\x46\x7e\x54\x62\x13\x8d\xf6\xc2\xb8\xd8\x90\xe8\xf7\x39\x2e\x5e\xaf\xc3\x82\xf5"
+            b"\x80\x5d\x9f\xbe\x93\xd0\x69\x7c\x2d\xd5\x6f\xa9\x12\x25\xcf\xb3\x99\xac\xc8\x3b\x7d\x18\x10\xa7\x63\x9c\xe8\x6e\xbb\x3b\xdb\x7b"
+            b"\x78\x26\xcd\x09\x18\x59\x6e\xf4\xb7\x9a\xec\x01\x9a\x4f\x83\xa8\x6e\x95\xe6\x65\xe6\xff\xaa\x7e\xcf\xbc\x21\x08\xe8\x15\xef\xe6"
+            b"\x9b\xe7\xba\xd9\x36\x6f\x4a\xce\x09\x9f\xea\xd4\x7c\xb0\x29\xd6\xb2\xa4\x31\xaf\x23\x3f\x2a\x31\x94\xa5\xc6\x30\x66\xa2\x35\xc0"
+            b"\xbc\x4e\x74\x37\xca\x82\xfc\xa6\xd0\x90\xe0\xb0\xd8\xa7\x33\x15\x98\x04\xf1\x4a\xda\xec\x41\xf7\x50\xcd\x7f\x0e\xf6\x91\x17\x2f"
+            b"\xd6\x4d\x76\x8d\xb0\xef\x43\x4d\x4d\xaa\xcc\x54\x04\x96\xe4\xdf\xb5\xd1\x9e\xe3\x88\x6a\x4c\x1b\x1f\x2c\xc1\xb8\x51\x65\x46\x7f"
+            b"\xea\x5e\x9d\x04\x35\x8c\x01\x5d\x74\x87\xfa\x73\x41\x0b\xfb\x2e\x1d\x67\xb3\x5a\xd2\xdb\x92\x52\x56\x10\xe9\x33\x47\xd6\x6d\x13"
+            b"\x61\xd7\x9a\x8c\x0c\xa1\x37\x7a\x14\xf8\x59\x8e\x3c\x13\xeb\x89\x27\xa9\xce\xee\xc9\x61\xb7\x35\xe5\x1c\xe1\xed\xb1\x47\x7a\x3c"
+            b"\xdf\xd2\x9c\x59\x73\xf2\x55\x3f\xce\x14\x18\x79\x37\xc7\x73\xbf\xcd\xf7\x53\xea\xaa\xfd\x5f\x5b\x6f\x3d\xdf\x14\xdb\x44\x78\x86"
+            b"\xf3\xaf\xca\x81\xc4\x68\xb9\x3e\x34\x24\x38\x2c\x40\xa3\xc2\x5f\xc3\x1d\x16\x72\x25\xe2\xbc\x0c\x49\x3c\x28\x8b\x95\x0d\xff\x41"
+            b"\x01\xa8\x39\x71\xb3\x0c\x08\xde\xe4\xb4\xd8\x9c\xc1\x56\x64\x90\x84\xcb\x7b\x61\xb6\x32\xd5\x70\x5c\x6c\x48\x74\x57\xb8\xd0\x42"
+        )),
+        _u32((
+            b"\xf4\x51\x50\xa7\x41\x7e\x53\x65\x17\x1a\xc3\xa4\x27\x3a\x96\x5e\xab\x3b\xcb\x6b\x9d\x1f\xf1\x45\xfa\xac\xab\x58\xe3\x4b\x93\x03"
+            b"\x30\x20\x55\xfa\x76\xad\xf6\x6d\xcc\x88\x91\x76\x02\xf5\x25\x4c\xe5\x4f\xfc\xd7\x2a\xc5\xd7\xcb\x35\x26\x80\x44\x62\xb5\x8f\xa3"
+            b"\xb1\xde\x49\x5a\xba\x25\x67\x1b\xea\x45\x98\x0e\xfe\x5d\xe1\xc0\x2f\xc3\x02\x75\x4c\x81\x12\xf0\x46\x8d\xa3\x97\xd3\x6b\xc6\xf9"
+            b"\x8f\x03\xe7\x5f\x92\x15\x95\x9c\x6d\xbf\xeb\x7a\x52\x95\xda\x59\xbe\xd4\x2d\x83\x74\x58\xd3\x21\xe0\x49\x29\x69\xc9\x8e\x44\xc8"
+            b"\xc2\x75\x6a\x89\x8e\xf4\x78\x79\x58\x99\x6b\x3e\xb9\x27\xdd\x71\xe1\xbe\xb6\x4f\x88\xf0\x17\xad\x20\xc9\x66\xac\xce\x7d\xb4\x3a"
+            b"\xdf\x63\x18\x4a\x1a\xe5\x82\x31\x51\x97\x60\x33\x53\x62\x45\x7f\x64\xb1\xe0\x77\x6b\xbb\x84\xae\x81\xfe\x1c\xa0\x08\xf9\x94\x2b"
+            b"\x48\x70\x58\x68\x45\x8f\x19\xfd\xde\x94\x87\x6c\x7b\x52\xb7\xf8\x73\xab\x23\xd3\x4b\x72\xe2\x02\x1f\xe3\x57\x8f\x55\x66\x2a\xab"
+            b"\xeb\xb2\x07\x28\xb5\x2f\x03\xc2\xc5\x86\x9a\x7b\x37\xd3\xa5\x08\x28\x30\xf2\x87\xbf\x23\xb2\xa5\x03\x02\xba\x6a\x16\xed\x5c\x82"
+            b"\xcf\x8a\x2b\x1c\x79\xa7\x92\xb4\x07\xf3\xf0\xf2\x69\x4e\xa1\xe2\xda\x65\xcd\xf4\x05\x06\xd5\xbe\x34\xd1\x1f\x62\xa6\xc4\x8a\xfe"
+            b"\x2e\x34\x9d\x53\xf3\xa2\xa0\x55\x8a\x05\x32\xe1\xf6\xa4\x75\xeb\x83\x0b\x39\xec\x60\x40\xaa\xef\x71\x5e\x06\x9f\x6e\xbd\x51\x10"
+            b"\x21\x3e\xf9\x8a\xdd\x96\x3d\x06\x3e\xdd\xae\x05\xe6\x4d\x46\xbd\x54\x91\xb5\x8d\xc4\x71\x05\x5d\x06\x04\x6f\xd4\x50\x60\xff\x15"
+            b"\x98\x19\x24\xfb\xbd\xd6\x97\xe9\x40\x89\xcc\x43\xd9\x67\x77\x9e\xe8\xb0\xbd\x42\x89\x07\x88\x8b\x19\xe7\x38\x5b\xc8\x79\xdb\xee"
+            b"\x7c\xa1\x47\x0a\x42\x7c\xe9\x0f\x84\xf8\xc9\x1e\x00\x00\x00\x00\x80\x09\x83\x86\x2b\x32\x48\xed\x11\x1e\xac\x70\x5a\x6c\x4e\x72"
+            b"\x0e\xfd\xfb\xff\x85\x0f\x56\x38\xae\x3d\x1e\xd5\x2d\x36\x27\x39\x0f\x0a\x64\xd9\x5c\x68\x21\xa6\x5b\x9b\xd1\x54\x36\x24\x3a\x2e"
+            b"\x0a\x0c\xb1\x67\x57\x93\x0f\xe7\xee\xb4\xd2\x96\x9b\x1b\x9e\x91\xc0\x80\x4f\xc5\xdc\x61\xa2\x20\x77\x5a\x69\x4b\x12\x1c\x16\x1a"
+            b"\x93\xe2\x0a\xba\xa0\xc0\xe5\x2a\x22\x3c\x43\xe0\x1b\x12\x1d\x17\x09\x0e\x0b\x0d\x8b\xf2\xad\xc7\xb6\x2d\xb9\xa8\x1e\x14\xc8\xa9"
+            b"\xf1\x57\x85\x19\x75\xaf\x4c\x07\x99\xee\xbb\xdd\x7f\xa3\xfd\x60\x01\xf7\x9f\x26\x72\x5c\xbc\xf5\x66\x44\xc5\x3b\xfb\x5b\x34\x7e"
+            b"\x43\x8b\x76\x29\x23\xcb\xdc\xc6\xed\xb6\x68\xfc\xe4\xb8\x63\xf1\x31\xd7\xca\xdc\x63\x42\x10\x85\x97\x13\x40\x22\xc6\x84\x20\x11"
+            b"\x4a\x85\x7d\x24\xbb\xd2\xf8\x3d\xf9\xae\x11\x32\x29\xc7\x6d\xa1\x9e\x1d\x4b\x2f\xb2\xdc\xf3\x30\x86\x0d\xec\x52\xc1\x77\xd0\xe3"
+            b"\xb3\x2b\x6c\x16\x70\xa9\x99\xb9\x94\x11\xfa\x48\xe9\x47\x22\x64\xfc\xa8\xc4\x8c\xf0\xa0\x1a\x3f\x7d\x56\xd8\x2c\x33\x22\xef\x90"
+            b"\x49\x87\xc7\x4e\x38\xd9\xc1\xd1\xca\x8c\xfe\xa2\xd4\x98\x36\x0b\xf5\xa6\xcf\x81\x7a\xa5\x28\xde\xb7\xda\x26\x8e\xad\x3f\xa4\xbf"
+            b"\x3a\x2c\xe4\x9d\x78\x50\x0d\x92\x5f\x6a\x9b\xcc\x7e\x54\x62\x46\x8d\xf6\xc2\x13\xd8\x90\xe8\xb8\x39\x2e\x5e\xf7\xc3\x82\xf5\xaf"
+            b"\x5d\x9f\xbe\x80\xd0\x69\x7c\x93\xd5\x6f\xa9\x2d\x25\xcf\xb3\x12\xac\xc8\x3b\x99\x18\x10\xa7\x7d\x9c\xe8\x6e\x63\x3b\xdb\x7b\xbb"
+            b"\x26\xcd\x09\x78\x59\x6e\xf4\x18\x9a\xec\x01\xb7\x4f\x83\xa8\x9a\x95\xe6\x65\x6e\xff\xaa\x7e\xe6\xbc\x21\x08\xcf\x15\xef\xe6\xe8"
+            b"\xe7\xba\xd9\x9b\x6f\x4a\xce\x36\x9f\xea\xd4\x09\xb0\x29\xd6\x7c\xa4\x31\xaf\xb2\x3f\x2a\x31\x23\xa5\xc6\x30\x94\xa2\x35\xc0\x66"
+            b"\x4e\x74\x37\xbc\x82\xfc\xa6\xca\x90\xe0\xb0\xd0\xa7\x33\x15\xd8\x04\xf1\x4a\x98\xec\x41\xf7\xda\xcd\x7f\x0e\x50\x91\x17\x2f\xf6"
+            b"\x4d\x76\x8d\xd6\xef\x43\x4d\xb0\xaa\xcc\x54\x4d\x96\xe4\xdf\x04\xd1\x9e\xe3\xb5\x6a\x4c\x1b\x88\x2c\xc1\xb8\x1f\x65\x46\x7f\x51"
+            b"\x5e\x9d\x04\xea\x8c\x01\x5d\x35\x87\xfa\x73\x74\x0b\xfb\x2e\x41\x67\xb3\x5a\x1d\xdb\x92\x52\xd2\x10\xe9\x33\x56\xd6\x6d\x13\x47"
+            b"\xd7\x9a\x8c\x61\xa1\x37\x7a\x0c\xf8\x59\x8e\x14\x13\xeb\x89\x3c\xa9\xce\xee\x27\x61\xb7\x35\xc9\x1c\xe1\xed\xe5\x47\x7a\x3c\xb1"
+            b"\xd2\x9c\x59\xdf\xf2\x55\x3f\x73\x14\x18\x79\xce\xc7\x73\xbf\x37\xf7\x53\xea\xcd\xfd\x5f\x5b\xaa\x3d\xdf\x14\x6f\x44\x78\x86\xdb"
+            b"\xaf\xca\x81\xf3\x68\xb9\x3e\xc4\x24\x38\x2c\x34\xa3\xc2\x5f\x40\x1d\x16\x72\xc3\xe2\xbc\x0c\x25\x3c\x28\x8b\x49\x0d\xff\x41\x95"
+            b"\xa8\x39\x71\x01\x0c\x08\xde\xb3\xb4\xd8\x9c\xe4\x56\x64\x90\xc1\xcb\x7b\x61\x84\x32\xd5\x70\xb6\x6c\x48\x74\x5c\xb8\xd0\x42\x57"
+        )),
+        _u32((
+            b"\x51\x50\xa7\xf4\x7e\x53\x65\x41\x1a\xc3\xa4\x17\x3a\x96\x5e\x27\x3b\xcb\x6b\xab\x1f\xf1\x45\x9d\xac\xab\x58\xfa\x4b\x93\x03\xe3"
+            b"\x20\x55\xfa\x30\xad\xf6\x6d\x76\x88\x91\x76\xcc\xf5\x25\x4c\x02\x4f\xfc\xd7\xe5\xc5\xd7\xcb\x2a\x26\x80\x44\x35\xb5\x8f\xa3\x62"
+            b"\xde\x49\x5a\xb1\x25\x67\x1b\xba\x45\x98\x0e\xea\x5d\xe1\xc0\xfe\xc3\x02\x75\x2f\x81\x12\xf0\x4c\x8d\xa3\x97\x46\x6b\xc6\xf9\xd3"
+            b"\x03\xe7\x5f\x8f\x15\x95\x9c\x92\xbf\xeb\x7a\x6d\x95\xda\x59\x52\xd4\x2d\x83\xbe\x58\xd3\x21\x74\x49\x29\x69\xe0\x8e\x44\xc8\xc9"
+            b"\x75\x6a\x89\xc2\xf4\x78\x79\x8e\x99\x6b\x3e\x58\x27\xdd\x71\xb9\xbe\xb6\x4f\xe1\xf0\x17\xad\x88\xc9\x66\xac\x20\x7d\xb4\x3a\xce"
+            b"\x63\x18\x4a\xdf\xe5\x82\x31\x1a\x97\x60\x33\x51\x62\x45\x7f\x53\xb1\xe0\x77\x64\xbb\x84\xae\x6b\xfe\x1c\xa0\x81\xf9\x94\x2b\x08"
+            b"\x70\x58\x68\x48\x8f\x19\xfd\x45\x94\x87\x6c\xde\x52\xb7\xf8\x7b\xab\x23\xd3\x73\x72\xe2\x02\x4b\xe3\x57\x8f\x1f\x66\x2a\xab\x55"
+            b"\xb2\x07\x28\xeb\x2f\x03\xc2\xb5\x86\x9a\x7b\xc5\xd3\xa5\x08\x37\x30\xf2\x87\x28\x23\xb2\xa5\xbf\x02\xba\x6a\x03\xed\x5c\x82\x16"
+            b"\x8a\x2b\x1c\xcf\xa7\x92\xb4\x79\xf3\xf0\xf2\x07\x4e\xa1\xe2\x69\x65\xcd\xf4\xda\x06\xd5\xbe\x05\xd1\x1f\x62\x34\xc4\x8a\xfe\xa6"
+            b"\x34\x9d\x53\x2e\xa2\xa0\x55\xf3\x05\x32\xe1\x8a\xa4\x75\xeb\xf6\x0b\x39\xec\x83\x40\xaa\xef\x60\x5e\x06\x9f\x71\xbd\x51\x10\x6e"
+            b"\x3e\xf9\x8a\x21\x96\x3d\x06\xdd\xdd\xae\x05\x3e\x4d\x46\xbd\xe6\x91\xb5\x8d\x54\x71\x05\x5d\xc4\x04\x6f\xd4\x06\x60\xff\x15\x50"
+            b"\x19\x24\xfb\x98\xd6\x97\xe9\xbd\x89\xcc\x43\x40\x67\x77\x9e\xd9\xb0\xbd\x42\xe8\x07\x88\x8b\x89\xe7\x38\x5b\x19\x79\xdb\xee\xc8"
+            b"\xa1\x47\x0a\x7c\x7c\xe9\x0f\x42\xf8\xc9\x1e\x84\x00\x00\x00\x00\x09\x83\x86\x80\x32\x48\xed\x2b\x1e\xac\x70\x11\x6c\x4e\x72\x5a"
+            b"\xfd\xfb\xff\x0e\x0f\x56\x38\x85\x3d\x1e\xd5\xae\x36\x27\x39\x2d\x0a\x64\xd9\x0f\x68\x21\xa6\x5c\x9b\xd1\x54\x5b\x24\x3a\x2e\x36"
+            b"\x0c\xb1\x67\x0a\x93\x0f\xe7\x57\xb4\xd2\x96\xee\x1b\x9e\x91\x9b\x80\x4f\xc5\xc0\x61\xa2\x20\xdc\x5a\x69\x4b\x77\x1c\x16\x1a\x12"
+            b"\xe2\x0a\xba\x93\xc0\xe5\x2a\xa0\x3c\x43\xe0\x22\x12\x1d\x17\x1b\x0e\x0b\x0d\x09\xf2\xad\xc7\x8b\x2d\xb9\xa8\xb6\x14\xc8\xa9\x1e"
+            b"\x57\x85\x19\xf1\xaf\x4c\x07\x75\xee\xbb\xdd\x99\xa3\xfd\x60\x7f\xf7\x9f\x26\x01\x5c\xbc\xf5\x72\x44\xc5\x3b\x66\x5b\x34\x7e\xfb"
+            b"\x8b\x76\x29\x43\xcb\xdc\xc6\x23\xb6\x68\xfc\xed\xb8\x63\xf1\xe4\xd7\xca\xdc\x31\x42\x10\x85\x63\x13\x40\x22\x97\x84\x20\x11\xc6"
+            b"\x85\x7d\x24\x4a\xd2\xf8\x3d\xbb\xae\x11\x32\xf9\xc7\x6d\xa1\x29\x1d\x4b\x2f\x9e\xdc\xf3\x30\xb2\x0d\xec\x52\x86\x77\xd0\xe3\xc1"
+            b"\x2b\x6c\x16\xb3\xa9\x99\xb9\x70\x11\xfa\x48\x94\x47\x22\x64\xe9\xa8\xc4\x8c\xfc\xa0\x1a\x3f\xf0\x56\xd8\x2c\x7d\x22\xef\x90\x33"
+            b"\x87\xc7\x4e\x49\xd9\xc1\xd1\x38\x8c\xfe\xa2\xca\x98\x36\x0b\xd4\xa6\xcf\x81\xf5\xa5\x28\xde\x7a\xda\x26\x8e\xb7\x3f\xa4\xbf\xad"
+            b"\x2c\xe4\x9d\x3a\x50\x0d\x92\x78\x6a\x9b\xcc\x5f\x54\x62\x46\x7e\xf6\xc2\x13\x8d\x90\xe8\xb8\xd8\x2e\x5e\xf7\x39\x82\xf5\xaf\xc3"
+            b"\x9f\xbe\x80\x5d\x69\x7c\x93\xd0\x6f\xa9\x2d\xd5\xcf\xb3\x12\x25\xc8\x3b\x99\xac\x10\xa7\x7d\x18\xe8\x6e\x63\x9c\xdb\x7b\xbb\x3b"
+            b"\xcd\x09\x78\x26\x6e\xf4\x18\x59\xec\x01\xb7\x9a\x83\xa8\x9a\x4f\xe6\x65\x6e\x95\xaa\x7e\xe6\xff\x21\x08\xcf\xbc\xef\xe6\xe8\x15"
+            b"\xba\xd9\x9b\xe7\x4a\xce\x36\x6f\xea\xd4\x09\x9f\x29\xd6\x7c\xb0\x31\xaf\xb2\xa4\x2a\x31\x23\x3f\xc6\x30\x94\xa5\x35\xc0\x66\xa2"
+            b"\x74\x37\xbc\x4e\xfc\xa6\xca\x82\xe0\xb0\xd0\x90\x33\x15\xd8\xa7\xf1\x4a\x98\x04\x41\xf7\xda\xec\x7f\x0e\x50\xcd\x17\x2f\xf6\x91"
+            b"\x76\x8d\xd6\x4d\x43\x4d\xb0\xef\xcc\x54\x4d\xaa\xe4\xdf\x04\x96\x9e\xe3\xb5\xd1\x4c\x1b\x88\x6a\xc1\xb8\x1f\x2c\x46\x7f\x51\x65"
+            b"\x9d\x04\xea\x5e\x01\x5d\x35\x8c\xfa\x73\x74\x87\xfb\x2e\x41\x0b\xb3\x5a\x1d\x67\x92\x52\xd2\xdb\xe9\x33\x56\x10\x6d\x13\x47\xd6"
+            b"\x9a\x8c\x61\xd7\x37\x7a\x0c\xa1\x59\x8e\x14\xf8\xeb\x89\x3c\x13\xce\xee\x27\xa9\xb7\x35\xc9\x61\xe1\xed\xe5\x1c\x7a\x3c\xb1\x47"
+            b"\x9c\x59\xdf\xd2\x55\x3f\x73\xf2\x18\x79\xce\x14\x73\xbf\x37\xc7\x53\xea\xcd\xf7\x5f\x5b\xaa\xfd\xdf\x14\x6f\x3d\x78\x86\xdb\x44"
+            b"\xca\x81\xf3\xaf\xb9\x3e\xc4\x68\x38\x2c\x34\x24\xc2\x5f\x40\xa3\x16\x72\xc3\x1d\xbc\x0c\x25\xe2\x28\x8b\x49\x3c\xff\x41\x95\x0d"
+            b"\x39\x71\x01\xa8\x08\xde\xb3\x0c\xd8\x9c\xe4\xb4\x64\x90\xc1\x56\x7b\x61\x84\xcb\xd5\x70\xb6\x32\x48\x74\x5c\x6c\xd0\x42\x57\xb8"
+        )),
+        ]
+
+RIJNDAEL_INV_SBOX = (
+        b"\x52\x09\x6a\xd5\x30\x36\xa5\x38\xbf\x40\xa3\x9e\x81\xf3\xd7\xfb\x7c\xe3\x39\x82\x9b\x2f\xff\x87\x34\x8e\x43\x44\xc4\xde\xe9\xcb"
+        b"\x54\x7b\x94\x32\xa6\xc2\x23\x3d\xee\x4c\x95\x0b\x42\xfa\xc3\x4e\x08\x2e\xa1\x66\x28\xd9\x24\xb2\x76\x5b\xa2\x49\x6d\x8b\xd1\x25"
+        b"\x72\xf8\xf6\x64\x86\x68\x98\x16\xd4\xa4\x5c\xcc\x5d\x65\xb6\x92\x6c\x70\x48\x50\xfd\xed\xb9\xda\x5e\x15\x46\x57\xa7\x8d\x9d\x84"
+        b"\x90\xd8\xab\x00\x8c\xbc\xd3\x0a\xf7\xe4\x58\x05\xb8\xb3\x45\x06\xd0\x2c\x1e\x8f\xca\x3f\x0f\x02\xc1\xaf\xbd\x03\x01\x13\x8a\x6b"
+        b"\x3a\x91\x11\x41\x4f\x67\xdc\xea\x97\xf2\xcf\xce\xf0\xb4\xe6\x73\x96\xac\x74\x22\xe7\xad\x35\x85\xe2\xf9\x37\xe8\x1c\x75\xdf\x6e"
+        b"\x47\xf1\x1a\x71\x1d\x29\xc5\x89\x6f\xb7\x62\x0e\xaa\x18\xbe\x1b\xfc\x56\x3e\x4b\xc6\xd2\x79\x20\x9a\xdb\xc0\xfe\x78\xcd\x5a\xf4"
+        b"\x1f\xdd\xa8\x33\x88\x07\xc7\x31\xb1\x12\x10\x59\x27\x80\xec\x5f\x60\x51\x7f\xa9\x19\xb5\x4a\x0d\x2d\xe5\x7a\x9f\x93\xc9\x9c\xef"
+        b"\xa0\xe0\x3b\x4d\xae\x2a\xf5\xb0\xc8\xeb\xbb\x3c\x83\x53\x99\x61\x17\x2b\x04\x7e\xba\x77\xd6\x26\xe1\x69\x14\x63\x55\x21\x0c\x7d"
+    )
+
+RIJNDAEL_MC = [
+        _u32((
+            b"\xa5\x63\x63\xc6\x84\x7c\x7c\xf8\x99\x77\x77\xee\x8d\x7b\x7b\xf6\x0d\xf2\xf2\xff\xbd\x6b\x6b\xd6\xb1\x6f\x6f\xde\x54\xc5\xc5\x91"
+            b"\x50\x30\x30\x60\x03\x01\x01\x02\xa9\x67\x67\xce\x7d\x2b\x2b\x56\x19\xfe\xfe\xe7\x62\xd7\xd7\xb5\xe6\xab\xab\x4d\x9a\x76\x76\xec"
+            b"\x45\xca\xca\x8f\x9d\x82\x82\x1f\x40\xc9\xc9\x89\x87\x7d\x7d\xfa\x15\xfa\xfa\xef\xeb\x59\x59\xb2\xc9\x47\x47\x8e\x0b\xf0\xf0\xfb"
+            b"\xec\xad\xad\x41\x67\xd4\xd4\xb3\xfd\xa2\xa2\x5f\xea\xaf\xaf\x45\xbf\x9c\x9c\x23\xf7\xa4\xa4\x53\x96\x72\x72\xe4\x5b\xc0\xc0\x9b"
+            b"\xc2\xb7\xb7\x75\x1c\xfd\xfd\xe1\xae\x93\x93\x3d\x6a\x26\x26\x4c\x5a\x36\x36\x6c\x41\x3f\x3f\x7e\x02\xf7\xf7\xf5\x4f\xcc\xcc\x83"
+            b"\x5c\x34\x34\x68\xf4\xa5\xa5\x51\x34\xe5\xe5\xd1\x08\xf1\xf1\xf9\x93\x71\x71\xe2\x73\xd8\xd8\xab\x53\x31\x31\x62\x3f\x15\x15\x2a"
+            b"\x0c\x04\x04\x08\x52\xc7\xc7\x95\x65\x23\x23\x46\x5e\xc3\xc3\x9d\x28\x18\x18\x30\xa1\x96\x96\x37\x0f\x05\x05\x0a\xb5\x9a\x9a\x2f"
+            b"\x09\x07\x07\x0e\x36\x12\x12\x24\x9b\x80\x80\x1b\x3d\xe2\xe2\xdf\x26\xeb\xeb\xcd\x69\x27\x27\x4e\xcd\xb2\xb2\x7f\x9f\x75\x75\xea"
+            b"\x1b\x09\x09\x12\x9e\x83\x83\x1d\x74\x2c\x2c\x58\x2e\x1a\x1a\x34\x2d\x1b\x1b\x36\xb2\x6e\x6e\xdc\xee\x5a\x5a\xb4\xfb\xa0\xa0\x5b"
+            b"\xf6\x52\x52\xa4\x4d\x3b\x3b\x76\x61\xd6\xd6\xb7\xce\xb3\xb3\x7d\x7b\x29\x29\x52\x3e\xe3\xe3\xdd\x71\x2f\x2f\x5e\x97\x84\x84\x13"
+            b"\xf5\x53\x53\xa6\x68\xd1\xd1\xb9\x00\x00\x00\x00\x2c\xed\xed\xc1\x60\x20\x20\x40\x1f\xfc\xfc\xe3\xc8\xb1\xb1\x79\xed\x5b\x5b\xb6"
+            b"\xbe\x6a\x6a\xd4\x46\xcb\xcb\x8d\xd9\xbe\xbe\x67\x4b\x39\x39\x72\xde\x4a\x4a\x94\xd4\x4c\x4c\x98\xe8\x58\x58\xb0\x4a\xcf\xcf\x85"
+            b"\x6b\xd0\xd0\xbb\x2a\xef\xef\xc5\xe5\xaa\xaa\x4f\x16\xfb\xfb\xed\xc5\x43\x43\x86\xd7\x4d\x4d\x9a\x55\x33\x33\x66\x94\x85\x85\x11"
+            b"\xcf\x45\x45\x8a\x10\xf9\xf9\xe9\x06\x02\x02\x04\x81\x7f\x7f\xfe\xf0\x50\x50\xa0\x44\x3c\x3c\x78\xba\x9f\x9f\x25\xe3\xa8\xa8\x4b"
+            b"\xf3\x51\x51\xa2\xfe\xa3\xa3\x5d\xc0\x40\x40\x80\x8a\x8f\x8f\x05\xad\x92\x92\x3f\xbc\x9d\x9d\x21\x48\x38\x38\x70\x04\xf5\xf5\xf1"
+            b"\xdf\xbc\xbc\x63\xc1\xb6\xb6\x77\x75\xda\xda\xaf\x63\x21\x21\x42\x30\x10\x10\x20\x1a\xff\xff\xe5\x0e\xf3\xf3\xfd\x6d\xd2\xd2\xbf"
+            b"\x4c\xcd\xcd\x81\x14\x0c\x0c\x18\x35\x13\x13\x26\x2f\xec\xec\xc3\xe1\x5f\x5f\xbe\xa2\x97\x97\x35\xcc\x44\x44\x88\x39\x17\x17\x2e"
+            b"\x57\xc4\xc4\x93\xf2\xa7\xa7\x55\x82\x7e\x7e\xfc\x47\x3d\x3d\x7a\xac\x64\x64\xc8\xe7\x5d\x5d\xba\x2b\x19\x19\x32\x95\x73\x73\xe6"
+            b"\xa0\x60\x60\xc0\x98\x81\x81\x19\xd1\x4f\x4f\x9e\x7f\xdc\xdc\xa3\x66\x22\x22\x44\x7e\x2a\x2a\x54\xab\x90\x90\x3b\x83\x88\x88\x0b"
+            b"\xca\x46\x46\x8c\x29\xee\xee\xc7\xd3\xb8\xb8\x6b\x3c\x14\x14\x28\x79\xde\xde\xa7\xe2\x5e\x5e\xbc\x1d\x0b\x0b\x16\x76\xdb\xdb\xad"
+            b"\x3b\xe0\xe0\xdb\x56\x32\x32\x64\x4e\x3a\x3a\x74\x1e\x0a\x0a\x14\xdb\x49\x49\x92\x0a\x06\x06\x0c\x6c\x24\x24\x48\xe4\x5c\x5c\xb8"
+            b"\x5d\xc2\xc2\x9f\x6e\xd3\xd3\xbd\xef\xac\xac\x43\xa6\x62\x62\xc4\xa8\x91\x91\x39\xa4\x95\x95\x31\x37\xe4\xe4\xd3\x8b\x79\x79\xf2"
+            b"\x32\xe7\xe7\xd5\x43\xc8\xc8\x8b\x59\x37\x37\x6e\xb7\x6d\x6d\xda\x8c\x8d\x8d\x01\x64\xd5\xd5\xb1\xd2\x4e\x4e\x9c\xe0\xa9\xa9\x49"
+            b"\xb4\x6c\x6c\xd8\xfa\x56\x56\xac\x07\xf4\xf4\xf3\x25\xea\xea\xcf\xaf\x65\x65\xca\x8e\x7a\x7a\xf4\xe9\xae\xae\x47\x18\x08\x08\x10"
+            b"\xd5\xba\xba\x6f\x88\x78\x78\xf0\x6f\x25\x25\x4a\x72\x2e\x2e\x5c\x24\x1c\x1c\x38\xf1\xa6\xa6\x57\xc7\xb4\xb4\x73\x51\xc6\xc6\x97"
+            b"\x23\xe8\xe8\xcb\x7c\xdd\xdd\xa1\x9c\x74\x74\xe8\x21\x1f\x1f\x3e\xdd\x4b\x4b\x96\xdc\xbd\xbd\x61\x86\x8b\x8b\x0d\x85\x8a\x8a\x0f"
+            b"\x90\x70\x70\xe0\x42\x3e\x3e\x7c\xc4\xb5\xb5\x71\xaa\x66\x66\xcc\xd8\x48\x48\x90\x05\x03\x03\x06\x01\xf6\xf6\xf7\x12\x0e\x0e\x1c"
+            b"\xa3\x61\x61\xc2\x5f\x35\x35\x6a\xf9\x57\x57\xae\xd0\xb9\xb9\x69\x91\x86\x86\x17\x58\xc1\xc1\x99\x27\x1d\x1d\x3a\xb9\x9e\x9e\x27"
+            b"\x38\xe1\xe1\xd9\x13\xf8\xf8\xeb\xb3\x98\x98\x2b\x33\x11\x11\x22\xbb\x69\x69\xd2\x70\xd9\xd9\xa9\x89\x8e\x8e\x07\xa7\x94\x94\x33"
+            b"\xb6\x9b\x9b\x2d\x22\x1e\x1e\x3c\x92\x87\x87\x15\x20\xe9\xe9\xc9\x49\xce\xce\x87\xff\x55\x55\xaa\x78\x28\x28\x50\x7a\xdf\xdf\xa5"
+            b"\x8f\x8c\x8c\x03\xf8\xa1\xa1\x59\x80\x89\x89\x09\x17\x0d\x0d\x1a\xda\xbf\xbf\x65\x31\xe6\xe6\xd7\xc6\x42\x42\x84\xb8\x68\x68\xd0"
+            b"\xc3\x41\x41\x82\xb0\x99\x99\x29\x77\x2d\x2d\x5a\x11\x0f\x0f\x1e\xcb\xb0\xb0\x7b\xfc\x54\x54\xa8\xd6\xbb\xbb\x6d\x3a\x16\x16\x2c"
+        )),
+        _u32((
+            b"\x63\x63\xc6\xa5\x7c\x7c\xf8\x84\x77\x77\xee\x99\x7b\x7b\xf6\x8d\xf2\xf2\xff\x0d\x6b\x6b\xd6\xbd\x6f\x6f\xde\xb1\xc5\xc5\x91\x54"
+            b"\x30\x30\x60\x50\x01\x01\x02\x03\x67\x67\xce\xa9\x2b\x2b\x56\x7d\xfe\xfe\xe7\x19\xd7\xd7\xb5\x62\xab\xab\x4d\xe6\x76\x76\xec\x9a"
+            b"\xca\xca\x8f\x45\x82\x82\x1f\x9d\xc9\xc9\x89\x40\x7d\x7d\xfa\x87\xfa\xfa\xef\x15\x59\x59\xb2\xeb\x47\x47\x8e\xc9\xf0\xf0\xfb\x0b"
+            b"\xad\xad\x41\xec\xd4\xd4\xb3\x67\xa2\xa2\x5f\xfd\xaf\xaf\x45\xea\x9c\x9c\x23\xbf\xa4\xa4\x53\xf7\x72\x72\xe4\x96\xc0\xc0\x9b\x5b"
+            b"\xb7\xb7\x75\xc2\xfd\xfd\xe1\x1c\x93\x93\x3d\xae\x26\x26\x4c\x6a\x36\x36\x6c\x5a\x3f\x3f\x7e\x41\xf7\xf7\xf5\x02\xcc\xcc\x83\x4f"
+            b"\x34\x34\x68\x5c\xa5\xa5\x51\xf4\xe5\xe5\xd1\x34\xf1\xf1\xf9\x08\x71\x71\xe2\x93\xd8\xd8\xab\x73\x31\x31\x62\x53\x15\x15\x2a\x3f"
+            b"\x04\x04\x08\x0c\xc7\xc7\x95\x52\x23\x23\x46\x65\xc3\xc3\x9d\x5e\x18\x18\x30\x28\x96\x96\x37\xa1\x05\x05\x0a\x0f\x9a\x9a\x2f\xb5"
+            b"\x07\x07\x0e\x09\x12\x12\x24\x36\x80\x80\x1b\x9b\xe2\xe2\xdf\x3d\xeb\xeb\xcd\x26\x27\x27\x4e\x69\xb2\xb2\x7f\xcd\x75\x75\xea\x9f"
+            b"\x09\x09\x12\x1b\x83\x83\x1d\x9e\x2c\x2c\x58\x74\x1a\x1a\x34\x2e\x1b\x1b\x36\x2d\x6e\x6e\xdc\xb2\x5a\x5a\xb4\xee\xa0\xa0\x5b\xfb"
+            b"\x52\x52\xa4\xf6\x3b\x3b\x76\x4d\xd6\xd6\xb7\x61\xb3\xb3\x7d\xce\x29\x29\x52\x7b\xe3\xe3\xdd\x3e\x2f\x2f\x5e\x71\x84\x84\x13\x97"
+            b"\x53\x53\xa6\xf5\xd1\xd1\xb9\x68\x00\x00\x00\x00\xed\xed\xc1\x2c\x20\x20\x40\x60\xfc\xfc\xe3\x1f\xb1\xb1\x79\xc8\x5b\x5b\xb6\xed"
+            b"\x6a\x6a\xd4\xbe\xcb\xcb\x8d\x46\xbe\xbe\x67\xd9\x39\x39\x72\x4b\x4a\x4a\x94\xde\x4c\x4c\x98\xd4\x58\x58\xb0\xe8\xcf\xcf\x85\x4a"
+            b"\xd0\xd0\xbb\x6b\xef\xef\xc5\x2a\xaa\xaa\x4f\xe5\xfb\xfb\xed\x16\x43\x43\x86\xc5\x4d\x4d\x9a\xd7\x33\x33\x66\x55\x85\x85\x11\x94"
+            b"\x45\x45\x8a\xcf\xf9\xf9\xe9\x10\x02\x02\x04\x06\x7f\x7f\xfe\x81\x50\x50\xa0\xf0\x3c\x3c\x78\x44\x9f\x9f\x25\xba\xa8\xa8\x4b\xe3"
+            b"\x51\x51\xa2\xf3\xa3\xa3\x5d\xfe\x40\x40\x80\xc0\x8f\x8f\x05\x8a\x92\x92\x3f\xad\x9d\x9d\x21\xbc\x38\x38\x70\x48\xf5\xf5\xf1\x04"
+            b"\xbc\xbc\x63\xdf\xb6\xb6\x77\xc1\xda\xda\xaf\x75\x21\x21\x42\x63\x10\x10\x20\x30\xff\xff\xe5\x1a\xf3\xf3\xfd\x0e\xd2\xd2\xbf\x6d"
+            b"\xcd\xcd\x81\x4c\x0c\x0c\x18\x14\x13\x13\x26\x35\xec\xec\xc3\x2f\x5f\x5f\xbe\xe1\x97\x97\x35\xa2\x44\x44\x88\xcc\x17\x17\x2e\x39"
+            b"\xc4\xc4\x93\x57\xa7\xa7\x55\xf2\x7e\x7e\xfc\x82\x3d\x3d\x7a\x47\x64\x64\xc8\xac\x5d\x5d\xba\xe7\x19\x19\x32\x2b\x73\x73\xe6\x95"
+            b"\x60\x60\xc0\xa0\x81\x81\x19\x98\x4f\x4f\x9e\xd1\xdc\xdc\xa3\x7f\x22\x22\x44\x66\x2a\x2a\x54\x7e\x90\x90\x3b\xab\x88\x88\x0b\x83"
+            b"\x46\x46\x8c\xca\xee\xee\xc7\x29\xb8\xb8\x6b\xd3\x14\x14\x28\x3c\xde\xde\xa7\x79\x5e\x5e\xbc\xe2\x0b\x0b\x16\x1d\xdb\xdb\xad\x76"
+            b"\xe0\xe0\xdb\x3b\x32\x32\x64\x56\x3a\x3a\x74\x4e\x0a\x0a\x14\x1e\x49\x49\x92\xdb\x06\x06\x0c\x0a\x24\x24\x48\x6c\x5c\x5c\xb8\xe4"
+            b"\xc2\xc2\x9f\x5d\xd3\xd3\xbd\x6e\xac\xac\x43\xef\x62\x62\xc4\xa6\x91\x91\x39\xa8\x95\x95\x31\xa4\xe4\xe4\xd3\x37\x79\x79\xf2\x8b"
+            b"\xe7\xe7\xd5\x32\xc8\xc8\x8b\x43\x37\x37\x6e\x59\x6d\x6d\xda\xb7\x8d\x8d\x01\x8c\xd5\xd5\xb1\x64\x4e\x4e\x9c\xd2\xa9\xa9\x49\xe0"
+            b"\x6c\x6c\xd8\xb4\x56\x56\xac\xfa\xf4\xf4\xf3\x07\xea\xea\xcf\x25\x65\x65\xca\xaf\x7a\x7a\xf4\x8e\xae\xae\x47\xe9\x08\x08\x10\x18"
+            b"\xba\xba\x6f\xd5\x78\x78\xf0\x88\x25\x25\x4a\x6f\x2e\x2e\x5c\x72\x1c\x1c\x38\x24\xa6\xa6\x57\xf1\xb4\xb4\x73\xc7\xc6\xc6\x97\x51"
+            b"\xe8\xe8\xcb\x23\xdd\xdd\xa1\x7c\x74\x74\xe8\x9c\x1f\x1f\x3e\x21\x4b\x4b\x96\xdd\xbd\xbd\x61\xdc\x8b\x8b\x0d\x86\x8a\x8a\x0f\x85"
+            b"\x70\x70\xe0\x90\x3e\x3e\x7c\x42\xb5\xb5\x71\xc4\x66\x66\xcc\xaa\x48\x48\x90\xd8\x03\x03\x06\x05\xf6\xf6\xf7\x01\x0e\x0e\x1c\x12"
+            b"\x61\x61\xc2\xa3\x35\x35\x6a\x5f\x57\x57\xae\xf9\xb9\xb9\x69\xd0\x86\x86\x17\x91\xc1\xc1\x99\x58\x1d\x1d\x3a\x27\x9e\x9e\x27\xb9"
+            b"\xe1\xe1\xd9\x38\xf8\xf8\xeb\x13\x98\x98\x2b\xb3\x11\x11\x22\x33\x69\x69\xd2\xbb\xd9\xd9\xa9\x70\x8e\x8e\x07\x89\x94\x94\x33\xa7"
+            b"\x9b\x9b\x2d\xb6\x1e\x1e\x3c\x22\x87\x87\x15\x92\xe9\xe9\xc9\x20\xce\xce\x87\x49\x55\x55\xaa\xff\x28\x28\x50\x78\xdf\xdf\xa5\x7a"
+            b"\x8c\x8c\x03\x8f\xa1\xa1\x59\xf8\x89\x89\x09\x80\x0d\x0d\x1a\x17\xbf\xbf\x65\xda\xe6\xe6\xd7\x31\x42\x42\x84\xc6\x68\x68\xd0\xb8"
+            b"\x41\x41\x82\xc3\x99\x99\x29\xb0\x2d\x2d\x5a\x77\x0f\x0f\x1e\x11\xb0\xb0\x7b\xcb\x54\x54\xa8\xfc\xbb\xbb\x6d\xd6\x16\x16\x2c\x3a"
+        )),
+        _u32((
+            b"\x63\xc6\xa5\x63\x7c\xf8\x84\x7c\x77\xee\x99\x77\x7b\xf6\x8d\x7b\xf2\xff\x0d\xf2\x6b\xd6\xbd\x6b\x6f\xde\xb1\x6f\xc5\x91\x54\xc5"
+            b"\x30\x60\x50\x30\x01\x02\x03\x01\x67\xce\xa9\x67\x2b\x56\x7d\x2b\xfe\xe7\x19\xfe\xd7\xb5\x62\xd7\xab\x4d\xe6\xab\x76\xec\x9a\x76"
+            b"\xca\x8f\x45\xca\x82\x1f\x9d\x82\xc9\x89\x40\xc9\x7d\xfa\x87\x7d\xfa\xef\x15\xfa\x59\xb2\xeb\x59\x47\x8e\xc9\x47\xf0\xfb\x0b\xf0"
+            b"\xad\x41\xec\xad\xd4\xb3\x67\xd4\xa2\x5f\xfd\xa2\xaf\x45\xea\xaf\x9c\x23\xbf\x9c\xa4\x53\xf7\xa4\x72\xe4\x96\x72\xc0\x9b\x5b\xc0"
+            b"\xb7\x75\xc2\xb7\xfd\xe1\x1c\xfd\x93\x3d\xae\x93\x26\x4c\x6a\x26\x36\x6c\x5a\x36\x3f\x7e\x41\x3f\xf7\xf5\x02\xf7\xcc\x83\x4f\xcc"
+            b"\x34\x68\x5c\x34\xa5\x51\xf4\xa5\xe5\xd1\x34\xe5\xf1\xf9\x08\xf1\x71\xe2\x93\x71\xd8\xab\x73\xd8\x31\x62\x53\x31\x15\x2a\x3f\x15"
+            b"\x04\x08\x0c\x04\xc7\x95\x52\xc7\x23\x46\x65\x23\xc3\x9d\x5e\xc3\x18\x30\x28\x18\x96\x37\xa1\x96\x05\x0a\x0f\x05\x9a\x2f\xb5\x9a"
+            b"\x07\x0e\x09\x07\x12\x24\x36\x12\x80\x1b\x9b\x80\xe2\xdf\x3d\xe2\xeb\xcd\x26\xeb\x27\x4e\x69\x27\xb2\x7f\xcd\xb2\x75\xea\x9f\x75"
+            b"\x09\x12\x1b\x09\x83\x1d\x9e\x83\x2c\x58\x74\x2c\x1a\x34\x2e\x1a\x1b\x36\x2d\x1b\x6e\xdc\xb2\x6e\x5a\xb4\xee\x5a\xa0\x5b\xfb\xa0"
+            b"\x52\xa4\xf6\x52\x3b\x76\x4d\x3b\xd6\xb7\x61\xd6\xb3\x7d\xce\xb3\x29\x52\x7b\x29\xe3\xdd\x3e\xe3\x2f\x5e\x71\x2f\x84\x13\x97\x84"
+            b"\x53\xa6\xf5\x53\xd1\xb9\x68\xd1\x00\x00\x00\x00\xed\xc1\x2c\xed\x20\x40\x60\x20\xfc\xe3\x1f\xfc\xb1\x79\xc8\xb1\x5b\xb6\xed\x5b"
+            b"\x6a\xd4\xbe\x6a\xcb\x8d\x46\xcb\xbe\x67\xd9\xbe\x39\x72\x4b\x39\x4a\x94\xde\x4a\x4c\x98\xd4\x4c\x58\xb0\xe8\x58\xcf\x85\x4a\xcf"
+            b"\xd0\xbb\x6b\xd0\xef\xc5\x2a\xef\xaa\x4f\xe5\xaa\xfb\xed\x16\xfb\x43\x86\xc5\x43\x4d\x9a\xd7\x4d\x33\x66\x55\x33\x85\x11\x94\x85"
+            b"\x45\x8a\xcf\x45\xf9\xe9\x10\xf9\x02\x04\x06\x02\x7f\xfe\x81\x7f\x50\xa0\xf0\x50\x3c\x78\x44\x3c\x9f\x25\xba\x9f\xa8\x4b\xe3\xa8"
+            b"\x51\xa2\xf3\x51\xa3\x5d\xfe\xa3\x40\x80\xc0\x40\x8f\x05\x8a\x8f\x92\x3f\xad\x92\x9d\x21\xbc\x9d\x38\x70\x48\x38\xf5\xf1\x04\xf5"
+            b"\xbc\x63\xdf\xbc\xb6\x77\xc1\xb6\xda\xaf\x75\xda\x21\x42\x63\x21\x10\x20\x30\x10\xff\xe5\x1a\xff\xf3\xfd\x0e\xf3\xd2\xbf\x6d\xd2"
+            b"\xcd\x81\x4c\xcd\x0c\x18\x14\x0c\x13\x26\x35\x13\xec\xc3\x2f\xec\x5f\xbe\xe1\x5f\x97\x35\xa2\x97\x44\x88\xcc\x44\x17\x2e\x39\x17"
+            b"\xc4\x93\x57\xc4\xa7\x55\xf2\xa7\x7e\xfc\x82\x7e\x3d\x7a\x47\x3d\x64\xc8\xac\x64\x5d\xba\xe7\x5d\x19\x32\x2b\x19\x73\xe6\x95\x73"
+            b"\x60\xc0\xa0\x60\x81\x19\x98\x81\x4f\x9e\xd1\x4f\xdc\xa3\x7f\xdc\x22\x44\x66\x22\x2a\x54\x7e\x2a\x90\x3b\xab\x90\x88\x0b\x83\x88"
+            b"\x46\x8c\xca\x46\xee\xc7\x29\xee\xb8\x6b\xd3\xb8\x14\x28\x3c\x14\xde\xa7\x79\xde\x5e\xbc\xe2\x5e\x0b\x16\x1d\x0b\xdb\xad\x76\xdb"
+            b"\xe0\xdb\x3b\xe0\x32\x64\x56\x32\x3a\x74\x4e\x3a\x0a\x14\x1e\x0a\x49\x92\xdb\x49\x06\x0c\x0a\x06\x24\x48\x6c\x24\x5c\xb8\xe4\x5c"
+            b"\xc2\x9f\x5d\xc2\xd3\xbd\x6e\xd3\xac\x43\xef\xac\x62\xc4\xa6\x62\x91\x39\xa8\x91\x95\x31\xa4\x95\xe4\xd3\x37\xe4\x79\xf2\x8b\x79"
+            b"\xe7\xd5\x32\xe7\xc8\x8b\x43\xc8\x37\x6e\x59\x37\x6d\xda\xb7\x6d\x8d\x01\x8c\x8d\xd5\xb1\x64\xd5\x4e\x9c\xd2\x4e\xa9\x49\xe0\xa9"
+            b"\x6c\xd8\xb4\x6c\x56\xac\xfa\x56\xf4\xf3\x07\xf4\xea\xcf\x25\xea\x65\xca\xaf\x65\x7a\xf4\x8e\x7a\xae\x47\xe9\xae\x08\x10\x18\x08"
+            b"\xba\x6f\xd5\xba\x78\xf0\x88\x78\x25\x4a\x6f\x25\x2e\x5c\x72\x2e\x1c\x38\x24\x1c\xa6\x57\xf1\xa6\xb4\x73\xc7\xb4\xc6\x97\x51\xc6"
+            b"\xe8\xcb\x23\xe8\xdd\xa1\x7c\xdd\x74\xe8\x9c\x74\x1f\x3e\x21\x1f\x4b\x96\xdd\x4b\xbd\x61\xdc\xbd\x8b\x0d\x86\x8b\x8a\x0f\x85\x8a"
+            b"\x70\xe0\x90\x70\x3e\x7c\x42\x3e\xb5\x71\xc4\xb5\x66\xcc\xaa\x66\x48\x90\xd8\x48\x03\x06\x05\x03\xf6\xf7\x01\xf6\x0e\x1c\x12\x0e"
+            b"\x61\xc2\xa3\x61\x35\x6a\x5f\x35\x57\xae\xf9\x57\xb9\x69\xd0\xb9\x86\x17\x91\x86\xc1\x99\x58\xc1\x1d\x3a\x27\x1d\x9e\x27\xb9\x9e"
+            b"\xe1\xd9\x38\xe1\xf8\xeb\x13\xf8\x98\x2b\xb3\x98\x11\x22\x33\x11\x69\xd2\xbb\x69\xd9\xa9\x70\xd9\x8e\x07\x89\x8e\x94\x33\xa7\x94"
+            b"\x9b\x2d\xb6\x9b\x1e\x3c\x22\x1e\x87\x15\x92\x87\xe9\xc9\x20\xe9\xce\x87\x49\xce\x55\xaa\xff\x55\x28\x50\x78\x28\xdf\xa5\x7a\xdf"
+            b"\x8c\x03\x8f\x8c\xa1\x59\xf8\xa1\x89\x09\x80\x89\x0d\x1a\x17\x0d\xbf\x65\xda\xbf\xe6\xd7\x31\xe6\x42\x84\xc6\x42\x68\xd0\xb8\x68"
+            b"\x41\x82\xc3\x41\x99\x29\xb0\x99\x2d\x5a\x77\x2d\x0f\x1e\x11\x0f\xb0\x7b\xcb\xb0\x54\xa8\xfc\x54\xbb\x6d\xd6\xbb\x16\x2c\x3a\x16"
+        )),
+        _u32((
+            b"\xc6\xa5\x63\x63\xf8\x84\x7c\x7c\xee\x99\x77\x77\xf6\x8d\x7b\x7b\xff\x0d\xf2\xf2\xd6\xbd\x6b\x6b\xde\xb1\x6f\x6f\x91\x54\xc5\xc5"
+            b"\x60\x50\x30\x30\x02\x03\x01\x01\xce\xa9\x67\x67\x56\x7d\x2b\x2b\xe7\x19\xfe\xfe\xb5\x62\xd7\xd7\x4d\xe6\xab\xab\xec\x9a\x76\x76"
+            b"\x8f\x45\xca\xca\x1f\x9d\x82\x82\x89\x40\xc9\xc9\xfa\x87\x7d\x7d\xef\x15\xfa\xfa\xb2\xeb\x59\x59\x8e\xc9\x47\x47\xfb\x0b\xf0\xf0"
+            b"\x41\xec\xad\xad\xb3\x67\xd4\xd4\x5f\xfd\xa2\xa2\x45\xea\xaf\xaf\x23\xbf\x9c\x9c\x53\xf7\xa4\xa4\xe4\x96\x72\x72\x9b\x5b\xc0\xc0"
+            b"\x75\xc2\xb7\xb7\xe1\x1c\xfd\xfd\x3d\xae\x93\x93\x4c\x6a\x26\x26\x6c\x5a\x36\x36\x7e\x41\x3f\x3f\xf5\x02\xf7\xf7\x83\x4f\xcc\xcc"
+            b"\x68\x5c\x34\x34\x51\xf4\xa5\xa5\xd1\x34\xe5\xe5\xf9\x08\xf1\xf1\xe2\x93\x71\x71\xab\x73\xd8\xd8\x62\x53\x31\x31\x2a\x3f\x15\x15"
+            b"\x08\x0c\x04\x04\x95\x52\xc7\xc7\x46\x65\x23\x23\x9d\x5e\xc3\xc3\x30\x28\x18\x18\x37\xa1\x96\x96\x0a\x0f\x05\x05\x2f\xb5\x9a\x9a"
+            b"\x0e\x09\x07\x07\x24\x36\x12\x12\x1b\x9b\x80\x80\xdf\x3d\xe2\xe2\xcd\x26\xeb\xeb\x4e\x69\x27\x27\x7f\xcd\xb2\xb2\xea\x9f\x75\x75"
+            b"\x12\x1b\x09\x09\x1d\x9e\x83\x83\x58\x74\x2c\x2c\x34\x2e\x1a\x1a\x36\x2d\x1b\x1b\xdc\xb2\x6e\x6e\xb4\xee\x5a\x5a\x5b\xfb\xa0\xa0"
+            b"\xa4\xf6\x52\x52\x76\x4d\x3b\x3b\xb7\x61\xd6\xd6\x7d\xce\xb3\xb3\x52\x7b\x29\x29\xdd\x3e\xe3\xe3\x5e\x71\x2f\x2f\x13\x97\x84\x84"
+            b"\xa6\xf5\x53\x53\xb9\x68\xd1\xd1\x00\x00\x00\x00\xc1\x2c\xed\xed\x40\x60\x20\x20\xe3\x1f\xfc\xfc\x79\xc8\xb1\xb1\xb6\xed\x5b\x5b"
+            b"\xd4\xbe\x6a\x6a\x8d\x46\xcb\xcb\x67\xd9\xbe\xbe\x72\x4b\x39\x39\x94\xde\x4a\x4a\x98\xd4\x4c\x4c\xb0\xe8\x58\x58\x85\x4a\xcf\xcf"
+            b"\xbb\x6b\xd0\xd0\xc5\x2a\xef\xef\x4f\xe5\xaa\xaa\xed\x16\xfb\xfb\x86\xc5\x43\x43\x9a\xd7\x4d\x4d\x66\x55\x33\x33\x11\x94\x85\x85"
+            b"\x8a\xcf\x45\x45\xe9\x10\xf9\xf9\x04\x06\x02\x02\xfe\x81\x7f\x7f\xa0\xf0\x50\x50\x78\x44\x3c\x3c\x25\xba\x9f\x9f\x4b\xe3\xa8\xa8"
+            b"\xa2\xf3\x51\x51\x5d\xfe\xa3\xa3\x80\xc0\x40\x40\x05\x8a\x8f\x8f\x3f\xad\x92\x92\x21\xbc\x9d\x9d\x70\x48\x38\x38\xf1\x04\xf5\xf5"
+            b"\x63\xdf\xbc\xbc\x77\xc1\xb6\xb6\xaf\x75\xda\xda\x42\x63\x21\x21\x20\x30\x10\x10\xe5\x1a\xff\xff\xfd\x0e\xf3\xf3\xbf\x6d\xd2\xd2"
+            b"\x81\x4c\xcd\xcd\x18\x14\x0c\x0c\x26\x35\x13\x13\xc3\x2f\xec\xec\xbe\xe1\x5f\x5f\x35\xa2\x97\x97\x88\xcc\x44\x44\x2e\x39\x17\x17"
+            b"\x93\x57\xc4\xc4\x55\xf2\xa7\xa7\xfc\x82\x7e\x7e\x7a\x47\x3d\x3d\xc8\xac\x64\x64\xba\xe7\x5d\x5d\x32\x2b\x19\x19\xe6\x95\x73\x73"
+            b"\xc0\xa0\x60\x60\x19\x98\x81\x81\x9e\xd1\x4f\x4f\xa3\x7f\xdc\xdc\x44\x66\x22\x22\x54\x7e\x2a\x2a\x3b\xab\x90\x90\x0b\x83\x88\x88"
+            b"\x8c\xca\x46\x46\xc7\x29\xee\xee\x6b\xd3\xb8\xb8\x28\x3c\x14\x14\xa7\x79\xde\xde\xbc\xe2\x5e\x5e\x16\x1d\x0b\x0b\xad\x76\xdb\xdb"
+            b"\xdb\x3b\xe0\xe0\x64\x56\x32\x32\x74\x4e\x3a\x3a\x14\x1e\x0a\x0a\x92\xdb\x49\x49\x0c\x0a\x06\x06\x48\x6c\x24\x24\xb8\xe4\x5c\x5c"
+            b"\x9f\x5d\xc2\xc2\xbd\x6e\xd3\xd3\x43\xef\xac\xac\xc4\xa6\x62\x62\x39\xa8\x91\x91\x31\xa4\x95\x95\xd3\x37\xe4\xe4\xf2\x8b\x79\x79"
+            b"\xd5\x32\xe7\xe7\x8b\x43\xc8\xc8\x6e\x59\x37\x37\xda\xb7\x6d\x6d\x01\x8c\x8d\x8d\xb1\x64\xd5\xd5\x9c\xd2\x4e\x4e\x49\xe0\xa9\xa9"
+            b"\xd8\xb4\x6c\x6c\xac\xfa\x56\x56\xf3\x07\xf4\xf4\xcf\x25\xea\xea\xca\xaf\x65\x65\xf4\x8e\x7a\x7a\x47\xe9\xae\xae\x10\x18\x08\x08"
+            b"\x6f\xd5\xba\xba\xf0\x88\x78\x78\x4a\x6f\x25\x25\x5c\x72\x2e\x2e\x38\x24\x1c\x1c\x57\xf1\xa6\xa6\x73\xc7\xb4\xb4\x97\x51\xc6\xc6"
+            b"\xcb\x23\xe8\xe8\xa1\x7c\xdd\xdd\xe8\x9c\x74\x74\x3e\x21\x1f\x1f\x96\xdd\x4b\x4b\x61\xdc\xbd\xbd\x0d\x86\x8b\x8b\x0f\x85\x8a\x8a"
+            b"\xe0\x90\x70\x70\x7c\x42\x3e\x3e\x71\xc4\xb5\xb5\xcc\xaa\x66\x66\x90\xd8\x48\x48\x06\x05\x03\x03\xf7\x01\xf6\xf6\x1c\x12\x0e\x0e"
+            b"\xc2\xa3\x61\x61\x6a\x5f\x35\x35\xae\xf9\x57\x57\x69\xd0\xb9\xb9\x17\x91\x86\x86\x99\x58\xc1\xc1\x3a\x27\x1d\x1d\x27\xb9\x9e\x9e"
+            b"\xd9\x38\xe1\xe1\xeb\x13\xf8\xf8\x2b\xb3\x98\x98\x22\x33\x11\x11\xd2\xbb\x69\x69\xa9\x70\xd9\xd9\x07\x89\x8e\x8e\x33\xa7\x94\x94"
+            b"\x2d\xb6\x9b\x9b\x3c\x22\x1e\x1e\x15\x92\x87\x87\xc9\x20\xe9\xe9\x87\x49\xce\xce\xaa\xff\x55\x55\x50\x78\x28\x28\xa5\x7a\xdf\xdf"
+            b"\x03\x8f\x8c\x8c\x59\xf8\xa1\xa1\x09\x80\x89\x89\x1a\x17\x0d\x0d\x65\xda\xbf\xbf\xd7\x31\xe6\xe6\x84\xc6\x42\x42\xd0\xb8\x68\x68"
+            b"\x82\xc3\x41\x41\x29\xb0\x99\x99\x5a\x77\x2d\x2d\x1e\x11\x0f\x0f\x7b\xcb\xb0\xb0\xa8\xfc\x54\x54\x6d\xd6\xbb\xbb\x2c\x3a\x16\x16"
+        )),
+        ]
+
+RIJNDAEL_SBOX = (
+        b"\x63\x7c\x77\x7b\xf2\x6b\x6f\xc5\x30\x01\x67\x2b\xfe\xd7\xab\x76\xca\x82\xc9\x7d\xfa\x59\x47\xf0\xad\xd4\xa2\xaf\x9c\xa4\x72\xc0"
+        b"\xb7\xfd\x93\x26\x36\x3f\xf7\xcc\x34\xa5\xe5\xf1\x71\xd8\x31\x15\x04\xc7\x23\xc3\x18\x96\x05\x9a\x07\x12\x80\xe2\xeb\x27\xb2\x75"
+        b"\x09\x83\x2c\x1a\x1b\x6e\x5a\xa0\x52\x3b\xd6\xb3\x29\xe3\x2f\x84\x53\xd1\x00\xed\x20\xfc\xb1\x5b\x6a\xcb\xbe\x39\x4a\x4c\x58\xcf"
+        b"\xd0\xef\xaa\xfb\x43\x4d\x33\x85\x45\xf9\x02\x7f\x50\x3c\x9f\xa8\x51\xa3\x40\x8f\x92\x9d\x38\xf5\xbc\xb6\xda\x21\x10\xff\xf3\xd2"
+        b"\xcd\x0c\x13\xec\x5f\x97\x44\x17\xc4\xa7\x7e\x3d\x64\x5d\x19\x73\x60\x81\x4f\xdc\x22\x2a\x90\x88\x46\xee\xb8\x14\xde\x5e\x0b\xdb"
+        b"\xe0\x32\x3a\x0a\x49\x06\x24\x5c\xc2\xd3\xac\x62\x91\x95\xe4\x79\xe7\xc8\x37\x6d\x8d\xd5\x4e\xa9\x6c\x56\xf4\xea\x65\x7a\xae\x08"
+        b"\xba\x78\x25\x2e\x1c\xa6\xb4\xc6\xe8\xdd\x74\x1f\x4b\xbd\x8b\x8a\x70\x3e\xb5\x66\x48\x03\xf6\x0e\x61\x35\x57\xb9\x86\xc1\x1d\x9e"
+        b"\xe1\xf8\x98\x11\x69\xd9\x8e\x94\x9b\x1e\x87\xe9\xce\x55\x28\xdf\x8c\xa1\x89\x0d\xbf\xe6\x42\x68\x41\x99\x2d\x0f\xb0\x54\xbb\x16"
+    )
+
+RIJNDAEL_UT = [
+        _u32((
+            b"\x00\x00\x00\x00\x0b\x0d\x09\x0e\x16\x1a\x12\x1c\x1d\x17\x1b\x12\x2c\x34\x24\x38\x27\x39\x2d\x36\x3a\x2e\x36\x24\x31\x23\x3f\x2a"
+            b"\x58\x68\x48\x70\x53\x65\x41\x7e\x4e\x72\x5a\x6c\x45\x7f\x53\x62\x74\x5c\x6c\x48\x7f\x51\x65\x46\x62\x46\x7e\x54\x69\x4b\x77\x5a"
+            b"\xb0\xd0\x90\xe0\xbb\xdd\x99\xee\xa6\xca\x82\xfc\xad\xc7\x8b\xf2\x9c\xe4\xb4\xd8\x97\xe9\xbd\xd6\x8a\xfe\xa6\xc4\x81\xf3\xaf\xca"
+            b"\xe8\xb8\xd8\x90\xe3\xb5\xd1\x9e\xfe\xa2\xca\x8c\xf5\xaf\xc3\x82\xc4\x8c\xfc\xa8\xcf\x81\xf5\xa6\xd2\x96\xee\xb4\xd9\x9b\xe7\xba"
+            b"\x7b\xbb\x3b\xdb\x70\xb6\x32\xd5\x6d\xa1\x29\xc7\x66\xac\x20\xc9\x57\x8f\x1f\xe3\x5c\x82\x16\xed\x41\x95\x0d\xff\x4a\x98\x04\xf1"
+            b"\x23\xd3\x73\xab\x28\xde\x7a\xa5\x35\xc9\x61\xb7\x3e\xc4\x68\xb9\x0f\xe7\x57\x93\x04\xea\x5e\x9d\x19\xfd\x45\x8f\x12\xf0\x4c\x81"
+            b"\xcb\x6b\xab\x3b\xc0\x66\xa2\x35\xdd\x71\xb9\x27\xd6\x7c\xb0\x29\xe7\x5f\x8f\x03\xec\x52\x86\x0d\xf1\x45\x9d\x1f\xfa\x48\x94\x11"
+            b"\x93\x03\xe3\x4b\x98\x0e\xea\x45\x85\x19\xf1\x57\x8e\x14\xf8\x59\xbf\x37\xc7\x73\xb4\x3a\xce\x7d\xa9\x2d\xd5\x6f\xa2\x20\xdc\x61"
+            b"\xf6\x6d\x76\xad\xfd\x60\x7f\xa3\xe0\x77\x64\xb1\xeb\x7a\x6d\xbf\xda\x59\x52\x95\xd1\x54\x5b\x9b\xcc\x43\x40\x89\xc7\x4e\x49\x87"
+            b"\xae\x05\x3e\xdd\xa5\x08\x37\xd3\xb8\x1f\x2c\xc1\xb3\x12\x25\xcf\x82\x31\x1a\xe5\x89\x3c\x13\xeb\x94\x2b\x08\xf9\x9f\x26\x01\xf7"
+            b"\x46\xbd\xe6\x4d\x4d\xb0\xef\x43\x50\xa7\xf4\x51\x5b\xaa\xfd\x5f\x6a\x89\xc2\x75\x61\x84\xcb\x7b\x7c\x93\xd0\x69\x77\x9e\xd9\x67"
+            b"\x1e\xd5\xae\x3d\x15\xd8\xa7\x33\x08\xcf\xbc\x21\x03\xc2\xb5\x2f\x32\xe1\x8a\x05\x39\xec\x83\x0b\x24\xfb\x98\x19\x2f\xf6\x91\x17"
+            b"\x8d\xd6\x4d\x76\x86\xdb\x44\x78\x9b\xcc\x5f\x6a\x90\xc1\x56\x64\xa1\xe2\x69\x4e\xaa\xef\x60\x40\xb7\xf8\x7b\x52\xbc\xf5\x72\x5c"
+            b"\xd5\xbe\x05\x06\xde\xb3\x0c\x08\xc3\xa4\x17\x1a\xc8\xa9\x1e\x14\xf9\x8a\x21\x3e\xf2\x87\x28\x30\xef\x90\x33\x22\xe4\x9d\x3a\x2c"
+            b"\x3d\x06\xdd\x96\x36\x0b\xd4\x98\x2b\x1c\xcf\x8a\x20\x11\xc6\x84\x11\x32\xf9\xae\x1a\x3f\xf0\xa0\x07\x28\xeb\xb2\x0c\x25\xe2\xbc"
+            b"\x65\x6e\x95\xe6\x6e\x63\x9c\xe8\x73\x74\x87\xfa\x78\x79\x8e\xf4\x49\x5a\xb1\xde\x42\x57\xb8\xd0\x5f\x40\xa3\xc2\x54\x4d\xaa\xcc"
+            b"\xf7\xda\xec\x41\xfc\xd7\xe5\x4f\xe1\xc0\xfe\x5d\xea\xcd\xf7\x53\xdb\xee\xc8\x79\xd0\xe3\xc1\x77\xcd\xf4\xda\x65\xc6\xf9\xd3\x6b"
+            b"\xaf\xb2\xa4\x31\xa4\xbf\xad\x3f\xb9\xa8\xb6\x2d\xb2\xa5\xbf\x23\x83\x86\x80\x09\x88\x8b\x89\x07\x95\x9c\x92\x15\x9e\x91\x9b\x1b"
+            b"\x47\x0a\x7c\xa1\x4c\x07\x75\xaf\x51\x10\x6e\xbd\x5a\x1d\x67\xb3\x6b\x3e\x58\x99\x60\x33\x51\x97\x7d\x24\x4a\x85\x76\x29\x43\x8b"
+            b"\x1f\x62\x34\xd1\x14\x6f\x3d\xdf\x09\x78\x26\xcd\x02\x75\x2f\xc3\x33\x56\x10\xe9\x38\x5b\x19\xe7\x25\x4c\x02\xf5\x2e\x41\x0b\xfb"
+            b"\x8c\x61\xd7\x9a\x87\x6c\xde\x94\x9a\x7b\xc5\x86\x91\x76\xcc\x88\xa0\x55\xf3\xa2\xab\x58\xfa\xac\xb6\x4f\xe1\xbe\xbd\x42\xe8\xb0"
+            b"\xd4\x09\x9f\xea\xdf\x04\x96\xe4\xc2\x13\x8d\xf6\xc9\x1e\x84\xf8\xf8\x3d\xbb\xd2\xf3\x30\xb2\xdc\xee\x27\xa9\xce\xe5\x2a\xa0\xc0"
+            b"\x3c\xb1\x47\x7a\x37\xbc\x4e\x74\x2a\xab\x55\x66\x21\xa6\x5c\x68\x10\x85\x63\x42\x1b\x88\x6a\x4c\x06\x9f\x71\x5e\x0d\x92\x78\x50"
+            b"\x64\xd9\x0f\x0a\x6f\xd4\x06\x04\x72\xc3\x1d\x16\x79\xce\x14\x18\x48\xed\x2b\x32\x43\xe0\x22\x3c\x5e\xf7\x39\x2e\x55\xfa\x30\x20"
+            b"\x01\xb7\x9a\xec\x0a\xba\x93\xe2\x17\xad\x88\xf0\x1c\xa0\x81\xfe\x2d\x83\xbe\xd4\x26\x8e\xb7\xda\x3b\x99\xac\xc8\x30\x94\xa5\xc6"
+            b"\x59\xdf\xd2\x9c\x52\xd2\xdb\x92\x4f\xc5\xc0\x80\x44\xc8\xc9\x8e\x75\xeb\xf6\xa4\x7e\xe6\xff\xaa\x63\xf1\xe4\xb8\x68\xfc\xed\xb6"
+            b"\xb1\x67\x0a\x0c\xba\x6a\x03\x02\xa7\x7d\x18\x10\xac\x70\x11\x1e\x9d\x53\x2e\x34\x96\x5e\x27\x3a\x8b\x49\x3c\x28\x80\x44\x35\x26"
+            b"\xe9\x0f\x42\x7c\xe2\x02\x4b\x72\xff\x15\x50\x60\xf4\x18\x59\x6e\xc5\x3b\x66\x44\xce\x36\x6f\x4a\xd3\x21\x74\x58\xd8\x2c\x7d\x56"
+            b"\x7a\x0c\xa1\x37\x71\x01\xa8\x39\x6c\x16\xb3\x2b\x67\x1b\xba\x25\x56\x38\x85\x0f\x5d\x35\x8c\x01\x40\x22\x97\x13\x4b\x2f\x9e\x1d"
+            b"\x22\x64\xe9\x47\x29\x69\xe0\x49\x34\x7e\xfb\x5b\x3f\x73\xf2\x55\x0e\x50\xcd\x7f\x05\x5d\xc4\x71\x18\x4a\xdf\x63\x13\x47\xd6\x6d"
+            b"\xca\xdc\x31\xd7\xc1\xd1\x38\xd9\xdc\xc6\x23\xcb\xd7\xcb\x2a\xc5\xe6\xe8\x15\xef\xed\xe5\x1c\xe1\xf0\xf2\x07\xf3\xfb\xff\x0e\xfd"
+            b"\x92\xb4\x79\xa7\x99\xb9\x70\xa9\x84\xae\x6b\xbb\x8f\xa3\x62\xb5\xbe\x80\x5d\x9f\xb5\x8d\x54\x91\xa8\x9a\x4f\x83\xa3\x97\x46\x8d"
+        )),
+        _u32((
+            b"\x00\x00\x00\x00\x0d\x09\x0e\x0b\x1a\x12\x1c\x16\x17\x1b\x12\x1d\x34\x24\x38\x2c\x39\x2d\x36\x27\x2e\x36\x24\x3a\x23\x3f\x2a\x31"
+            b"\x68\x48\x70\x58\x65\x41\x7e\x53\x72\x5a\x6c\x4e\x7f\x53\x62\x45\x5c\x6c\x48\x74\x51\x65\x46\x7f\x46\x7e\x54\x62\x4b\x77\x5a\x69"
+            b"\xd0\x90\xe0\xb0\xdd\x99\xee\xbb\xca\x82\xfc\xa6\xc7\x8b\xf2\xad\xe4\xb4\xd8\x9c\xe9\xbd\xd6\x97\xfe\xa6\xc4\x8a\xf3\xaf\xca\x81"
+            b"\xb8\xd8\x90\xe8\xb5\xd1\x9e\xe3\xa2\xca\x8c\xfe\xaf\xc3\x82\xf5\x8c\xfc\xa8\xc4\x81\xf5\xa6\xcf\x96\xee\xb4\xd2\x9b\xe7\xba\xd9"
+            b"\xbb\x3b\xdb\x7b\xb6\x32\xd5\x70\xa1\x29\xc7\x6d\xac\x20\xc9\x66\x8f\x1f\xe3\x57\x82\x16\xed\x5c\x95\x0d\xff\x41\x98\x04\xf1\x4a"
+            b"\xd3\x73\xab\x23\xde\x7a\xa5\x28\xc9\x61\xb7\x35\xc4\x68\xb9\x3e\xe7\x57\x93\x0f\xea\x5e\x9d\x04\xfd\x45\x8f\x19\xf0\x4c\x81\x12"
+            b"\x6b\xab\x3b\xcb\x66\xa2\x35\xc0\x71\xb9\x27\xdd\x7c\xb0\x29\xd6\x5f\x8f\x03\xe7\x52\x86\x0d\xec\x45\x9d\x1f\xf1\x48\x94\x11\xfa"
+            b"\x03\xe3\x4b\x93\x0e\xea\x45\x98\x19\xf1\x57\x85\x14\xf8\x59\x8e\x37\xc7\x73\xbf\x3a\xce\x7d\xb4\x2d\xd5\x6f\xa9\x20\xdc\x61\xa2"
+            b"\x6d\x76\xad\xf6\x60\x7f\xa3\xfd\x77\x64\xb1\xe0\x7a\x6d\xbf\xeb\x59\x52\x95\xda\x54\x5b\x9b\xd1\x43\x40\x89\xcc\x4e\x49\x87\xc7"
+            b"\x05\x3e\xdd\xae\x08\x37\xd3\xa5\x1f\x2c\xc1\xb8\x12\x25\xcf\xb3\x31\x1a\xe5\x82\x3c\x13\xeb\x89\x2b\x08\xf9\x94\x26\x01\xf7\x9f"
+            b"\xbd\xe6\x4d\x46\xb0\xef\x43\x4d\xa7\xf4\x51\x50\xaa\xfd\x5f\x5b\x89\xc2\x75\x6a\x84\xcb\x7b\x61\x93\xd0\x69\x7c\x9e\xd9\x67\x77"
+            b"\xd5\xae\x3d\x1e\xd8\xa7\x33\x15\xcf\xbc\x21\x08\xc2\xb5\x2f\x03\xe1\x8a\x05\x32\xec\x83\x0b\x39\xfb\x98\x19\x24\xf6\x91\x17\x2f"
+            b"\xd6\x4d\x76\x8d\xdb\x44\x78\x86\xcc\x5f\x6a\x9b\xc1\x56\x64\x90\xe2\x69\x4e\xa1\xef\x60\x40\xaa\xf8\x7b\x52\xb7\xf5\x72\x5c\xbc"
+            b"\xbe\x05\x06\xd5\xb3\x0c\x08\xde\xa4\x17\x1a\xc3\xa9\x1e\x14\xc8\x8a\x21\x3e\xf9\x87\x28\x30\xf2\x90\x33\x22\xef\x9d\x3a\x2c\xe4"
+            b"\x06\xdd\x96\x3d\x0b\xd4\x98\x36\x1c\xcf\x8a\x2b\x11\xc6\x84\x20\x32\xf9\xae\x11\x3f\xf0\xa0\x1a\x28\xeb\xb2\x07\x25\xe2\xbc\x0c"
+            b"\x6e\x95\xe6\x65\x63\x9c\xe8\x6e\x74\x87\xfa\x73\x79\x8e\xf4\x78\x5a\xb1\xde\x49\x57\xb8\xd0\x42\x40\xa3\xc2\x5f\x4d\xaa\xcc\x54"
+            b"\xda\xec\x41\xf7\xd7\xe5\x4f\xfc\xc0\xfe\x5d\xe1\xcd\xf7\x53\xea\xee\xc8\x79\xdb\xe3\xc1\x77\xd0\xf4\xda\x65\xcd\xf9\xd3\x6b\xc6"
+            b"\xb2\xa4\x31\xaf\xbf\xad\x3f\xa4\xa8\xb6\x2d\xb9\xa5\xbf\x23\xb2\x86\x80\x09\x83\x8b\x89\x07\x88\x9c\x92\x15\x95\x91\x9b\x1b\x9e"
+            b"\x0a\x7c\xa1\x47\x07\x75\xaf\x4c\x10\x6e\xbd\x51\x1d\x67\xb3\x5a\x3e\x58\x99\x6b\x33\x51\x97\x60\x24\x4a\x85\x7d\x29\x43\x8b\x76"
+            b"\x62\x34\xd1\x1f\x6f\x3d\xdf\x14\x78\x26\xcd\x09\x75\x2f\xc3\x02\x56\x10\xe9\x33\x5b\x19\xe7\x38\x4c\x02\xf5\x25\x41\x0b\xfb\x2e"
+            b"\x61\xd7\x9a\x8c\x6c\xde\x94\x87\x7b\xc5\x86\x9a\x76\xcc\x88\x91\x55\xf3\xa2\xa0\x58\xfa\xac\xab\x4f\xe1\xbe\xb6\x42\xe8\xb0\xbd"
+            b"\x09\x9f\xea\xd4\x04\x96\xe4\xdf\x13\x8d\xf6\xc2\x1e\x84\xf8\xc9\x3d\xbb\xd2\xf8\x30\xb2\xdc\xf3\x27\xa9\xce\xee\x2a\xa0\xc0\xe5"
+            b"\xb1\x47\x7a\x3c\xbc\x4e\x74\x37\xab\x55\x66\x2a\xa6\x5c\x68\x21\x85\x63\x42\x10\x88\x6a\x4c\x1b\x9f\x71\x5e\x06\x92\x78\x50\x0d"
+            b"\xd9\x0f\x0a\x64\xd4\x06\x04\x6f\xc3\x1d\x16\x72\xce\x14\x18\x79\xed\x2b\x32\x48\xe0\x22\x3c\x43\xf7\x39\x2e\x5e\xfa\x30\x20\x55"
+            b"\xb7\x9a\xec\x01\xba\x93\xe2\x0a\xad\x88\xf0\x17\xa0\x81\xfe\x1c\x83\xbe\xd4\x2d\x8e\xb7\xda\x26\x99\xac\xc8\x3b\x94\xa5\xc6\x30"
+            b"\xdf\xd2\x9c\x59\xd2\xdb\x92\x52\xc5\xc0\x80\x4f\xc8\xc9\x8e\x44\xeb\xf6\xa4\x75\xe6\xff\xaa\x7e\xf1\xe4\xb8\x63\xfc\xed\xb6\x68"
+            b"\x67\x0a\x0c\xb1\x6a\x03\x02\xba\x7d\x18\x10\xa7\x70\x11\x1e\xac\x53\x2e\x34\x9d\x5e\x27\x3a\x96\x49\x3c\x28\x8b\x44\x35\x26\x80"
+            b"\x0f\x42\x7c\xe9\x02\x4b\x72\xe2\x15\x50\x60\xff\x18\x59\x6e\xf4\x3b\x66\x44\xc5\x36\x6f\x4a\xce\x21\x74\x58\xd3\x2c\x7d\x56\xd8"
+            b"\x0c\xa1\x37\x7a\x01\xa8\x39\x71\x16\xb3\x2b\x6c\x1b\xba\x25\x67\x38\x85\x0f\x56\x35\x8c\x01\x5d\x22\x97\x13\x40\x2f\x9e\x1d\x4b"
+            b"\x64\xe9\x47\x22\x69\xe0\x49\x29\x7e\xfb\x5b\x34\x73\xf2\x55\x3f\x50\xcd\x7f\x0e\x5d\xc4\x71\x05\x4a\xdf\x63\x18\x47\xd6\x6d\x13"
+            b"\xdc\x31\xd7\xca\xd1\x38\xd9\xc1\xc6\x23\xcb\xdc\xcb\x2a\xc5\xd7\xe8\x15\xef\xe6\xe5\x1c\xe1\xed\xf2\x07\xf3\xf0\xff\x0e\xfd\xfb"
+            b"\xb4\x79\xa7\x92\xb9\x70\xa9\x99\xae\x6b\xbb\x84\xa3\x62\xb5\x8f\x80\x5d\x9f\xbe\x8d\x54\x91\xb5\x9a\x4f\x83\xa8\x97\x46\x8d\xa3"
+        )),
+        _u32((
+            b"\x00\x00\x00\x00\x09\x0e\x0b\x0d\x12\x1c\x16\x1a\x1b\x12\x1d\x17\x24\x38\x2c\x34\x2d\x36\x27\x39\x36\x24\x3a\x2e\x3f\x2a\x31\x23"
+            b"\x48\x70\x58\x68\x41\x7e\x53\x65\x5a\x6c\x4e\x72\x53\x62\x45\x7f\x6c\x48\x74\x5c\x65\x46\x7f\x51\x7e\x54\x62\x46\x77\x5a\x69\x4b"
+            b"\x90\xe0\xb0\xd0\x99\xee\xbb\xdd\x82\xfc\xa6\xca\x8b\xf2\xad\xc7\xb4\xd8\x9c\xe4\xbd\xd6\x97\xe9\xa6\xc4\x8a\xfe\xaf\xca\x81\xf3"
+            b"\xd8\x90\xe8\xb8\xd1\x9e\xe3\xb5\xca\x8c\xfe\xa2\xc3\x82\xf5\xaf\xfc\xa8\xc4\x8c\xf5\xa6\xcf\x81\xee\xb4\xd2\x96\xe7\xba\xd9\x9b"
+            b"\x3b\xdb\x7b\xbb\x32\xd5\x70\xb6\x29\xc7\x6d\xa1\x20\xc9\x66\xac\x1f\xe3\x57\x8f\x16\xed\x5c\x82\x0d\xff\x41\x95\x04\xf1\x4a\x98"
+            b"\x73\xab\x23\xd3\x7a\xa5\x28\xde\x61\xb7\x35\xc9\x68\xb9\x3e\xc4\x57\x93\x0f\xe7\x5e\x9d\x04\xea\x45\x8f\x19\xfd\x4c\x81\x12\xf0"
+            b"\xab\x3b\xcb\x6b\xa2\x35\xc0\x66\xb9\x27\xdd\x71\xb0\x29\xd6\x7c\x8f\x03\xe7\x5f\x86\x0d\xec\x52\x9d\x1f\xf1\x45\x94\x11\xfa\x48"
+            b"\xe3\x4b\x93\x03\xea\x45\x98\x0e\xf1\x57\x85\x19\xf8\x59\x8e\x14\xc7\x73\xbf\x37\xce\x7d\xb4\x3a\xd5\x6f\xa9\x2d\xdc\x61\xa2\x20"
+            b"\x76\xad\xf6\x6d\x7f\xa3\xfd\x60\x64\xb1\xe0\x77\x6d\xbf\xeb\x7a\x52\x95\xda\x59\x5b\x9b\xd1\x54\x40\x89\xcc\x43\x49\x87\xc7\x4e"
+            b"\x3e\xdd\xae\x05\x37\xd3\xa5\x08\x2c\xc1\xb8\x1f\x25\xcf\xb3\x12\x1a\xe5\x82\x31\x13\xeb\x89\x3c\x08\xf9\x94\x2b\x01\xf7\x9f\x26"
+            b"\xe6\x4d\x46\xbd\xef\x43\x4d\xb0\xf4\x51\x50\xa7\xfd\x5f\x5b\xaa\xc2\x75\x6a\x89\xcb\x7b\x61\x84\xd0\x69\x7c\x93\xd9\x67\x77\x9e"
+            b"\xae\x3d\x1e\xd5\xa7\x33\x15\xd8\xbc\x21\x08\xcf\xb5\x2f\x03\xc2\x8a\x05\x32\xe1\x83\x0b\x39\xec\x98\x19\x24\xfb\x91\x17\x2f\xf6"
+            b"\x4d\x76\x8d\xd6\x44\x78\x86\xdb\x5f\x6a\x9b\xcc\x56\x64\x90\xc1\x69\x4e\xa1\xe2\x60\x40\xaa\xef\x7b\x52\xb7\xf8\x72\x5c\xbc\xf5"
+            b"\x05\x06\xd5\xbe\x0c\x08\xde\xb3\x17\x1a\xc3\xa4\x1e\x14\xc8\xa9\x21\x3e\xf9\x8a\x28\x30\xf2\x87\x33\x22\xef\x90\x3a\x2c\xe4\x9d"
+            b"\xdd\x96\x3d\x06\xd4\x98\x36\x0b\xcf\x8a\x2b\x1c\xc6\x84\x20\x11\xf9\xae\x11\x32\xf0\xa0\x1a\x3f\xeb\xb2\x07\x28\xe2\xbc\x0c\x25"
+            b"\x95\xe6\x65\x6e\x9c\xe8\x6e\x63\x87\xfa\x73\x74\x8e\xf4\x78\x79\xb1\xde\x49\x5a\xb8\xd0\x42\x57\xa3\xc2\x5f\x40\xaa\xcc\x54\x4d"
+            b"\xec\x41\xf7\xda\xe5\x4f\xfc\xd7\xfe\x5d\xe1\xc0\xf7\x53\xea\xcd\xc8\x79\xdb\xee\xc1\x77\xd0\xe3\xda\x65\xcd\xf4\xd3\x6b\xc6\xf9"
+            b"\xa4\x31\xaf\xb2\xad\x3f\xa4\xbf\xb6\x2d\xb9\xa8\xbf\x23\xb2\xa5\x80\x09\x83\x86\x89\x07\x88\x8b\x92\x15\x95\x9c\x9b\x1b\x9e\x91"
+            b"\x7c\xa1\x47\x0a\x75\xaf\x4c\x07\x6e\xbd\x51\x10\x67\xb3\x5a\x1d\x58\x99\x6b\x3e\x51\x97\x60\x33\x4a\x85\x7d\x24\x43\x8b\x76\x29"
+            b"\x34\xd1\x1f\x62\x3d\xdf\x14\x6f\x26\xcd\x09\x78\x2f\xc3\x02\x75\x10\xe9\x33\x56\x19\xe7\x38\x5b\x02\xf5\x25\x4c\x0b\xfb\x2e\x41"
+            b"\xd7\x9a\x8c\x61\xde\x94\x87\x6c\xc5\x86\x9a\x7b\xcc\x88\x91\x76\xf3\xa2\xa0\x55\xfa\xac\xab\x58\xe1\xbe\xb6\x4f\xe8\xb0\xbd\x42"
+            b"\x9f\xea\xd4\x09\x96\xe4\xdf\x04\x8d\xf6\xc2\x13\x84\xf8\xc9\x1e\xbb\xd2\xf8\x3d\xb2\xdc\xf3\x30\xa9\xce\xee\x27\xa0\xc0\xe5\x2a"
+            b"\x47\x7a\x3c\xb1\x4e\x74\x37\xbc\x55\x66\x2a\xab\x5c\x68\x21\xa6\x63\x42\x10\x85\x6a\x4c\x1b\x88\x71\x5e\x06\x9f\x78\x50\x0d\x92"
+            b"\x0f\x0a\x64\xd9\x06\x04\x6f\xd4\x1d\x16\x72\xc3\x14\x18\x79\xce\x2b\x32\x48\xed\x22\x3c\x43\xe0\x39\x2e\x5e\xf7\x30\x20\x55\xfa"
+            b"\x9a\xec\x01\xb7\x93\xe2\x0a\xba\x88\xf0\x17\xad\x81\xfe\x1c\xa0\xbe\xd4\x2d\x83\xb7\xda\x26\x8e\xac\xc8\x3b\x99\xa5\xc6\x30\x94"
+            b"\xd2\x9c\x59\xdf\xdb\x92\x52\xd2\xc0\x80\x4f\xc5\xc9\x8e\x44\xc8\xf6\xa4\x75\xeb\xff\xaa\x7e\xe6\xe4\xb8\x63\xf1\xed\xb6\x68\xfc"
+            b"\x0a\x0c\xb1\x67\x03\x02\xba\x6a\x18\x10\xa7\x7d\x11\x1e\xac\x70\x2e\x34\x9d\x53\x27\x3a\x96\x5e\x3c\x28\x8b\x49\x35\x26\x80\x44"
+            b"\x42\x7c\xe9\x0f\x4b\x72\xe2\x02\x50\x60\xff\x15\x59\x6e\xf4\x18\x66\x44\xc5\x3b\x6f\x4a\xce\x36\x74\x58\xd3\x21\x7d\x56\xd8\x2c"
+            b"\xa1\x37\x7a\x0c\xa8\x39\x71\x01\xb3\x2b\x6c\x16\xba\x25\x67\x1b\x85\x0f\x56\x38\x8c\x01\x5d\x35\x97\x13\x40\x22\x9e\x1d\x4b\x2f"
+            b"\xe9\x47\x22\x64\xe0\x49\x29\x69\xfb\x5b\x34\x7e\xf2\x55\x3f\x73\xcd\x7f\x0e\x50\xc4\x71\x05\x5d\xdf\x63\x18\x4a\xd6\x6d\x13\x47"
+            b"\x31\xd7\xca\xdc\x38\xd9\xc1\xd1\x23\xcb\xdc\xc6\x2a\xc5\xd7\xcb\x15\xef\xe6\xe8\x1c\xe1\xed\xe5\x07\xf3\xf0\xf2\x0e\xfd\xfb\xff"
+            b"\x79\xa7\x92\xb4\x70\xa9\x99\xb9\x6b\xbb\x84\xae\x62\xb5\x8f\xa3\x5d\x9f\xbe\x80\x54\x91\xb5\x8d\x4f\x83\xa8\x9a\x46\x8d\xa3\x97"
+        )),
+        _u32((
+            b"\x00\x00\x00\x00\x0e\x0b\x0d\x09\x1c\x16\x1a\x12\x12\x1d\x17\x1b\x38\x2c\x34\x24\x36\x27\x39\x2d\x24\x3a\x2e\x36\x2a\x31\x23\x3f"
+            b"\x70\x58\x68\x48\x7e\x53\x65\x41\x6c\x4e\x72\x5a\x62\x45\x7f\x53\x48\x74\x5c\x6c\x46\x7f\x51\x65\x54\x62\x46\x7e\x5a\x69\x4b\x77"
+            b"\xe0\xb0\xd0\x90\xee\xbb\xdd\x99\xfc\xa6\xca\x82\xf2\xad\xc7\x8b\xd8\x9c\xe4\xb4\xd6\x97\xe9\xbd\xc4\x8a\xfe\xa6\xca\x81\xf3\xaf"
+            b"\x90\xe8\xb8\xd8\x9e\xe3\xb5\xd1\x8c\xfe\xa2\xca\x82\xf5\xaf\xc3\xa8\xc4\x8c\xfc\xa6\xcf\x81\xf5\xb4\xd2\x96\xee\xba\xd9\x9b\xe7"
+            b"\xdb\x7b\xbb\x3b\xd5\x70\xb6\x32\xc7\x6d\xa1\x29\xc9\x66\xac\x20\xe3\x57\x8f\x1f\xed\x5c\x82\x16\xff\x41\x95\x0d\xf1\x4a\x98\x04"
+            b"\xab\x23\xd3\x73\xa5\x28\xde\x7a\xb7\x35\xc9\x61\xb9\x3e\xc4\x68\x93\x0f\xe7\x57\x9d\x04\xea\x5e\x8f\x19\xfd\x45\x81\x12\xf0\x4c"
+            b"\x3b\xcb\x6b\xab\x35\xc0\x66\xa2\x27\xdd\x71\xb9\x29\xd6\x7c\xb0\x03\xe7\x5f\x8f\x0d\xec\x52\x86\x1f\xf1\x45\x9d\x11\xfa\x48\x94"
+            b"\x4b\x93\x03\xe3\x45\x98\x0e\xea\x57\x85\x19\xf1\x59\x8e\x14\xf8\x73\xbf\x37\xc7\x7d\xb4\x3a\xce\x6f\xa9\x2d\xd5\x61\xa2\x20\xdc"
+            b"\xad\xf6\x6d\x76\xa3\xfd\x60\x7f\xb1\xe0\x77\x64\xbf\xeb\x7a\x6d\x95\xda\x59\x52\x9b\xd1\x54\x5b\x89\xcc\x43\x40\x87\xc7\x4e\x49"
+            b"\xdd\xae\x05\x3e\xd3\xa5\x08\x37\xc1\xb8\x1f\x2c\xcf\xb3\x12\x25\xe5\x82\x31\x1a\xeb\x89\x3c\x13\xf9\x94\x2b\x08\xf7\x9f\x26\x01"
+            b"\x4d\x46\xbd\xe6\x43\x4d\xb0\xef\x51\x50\xa7\xf4\x5f\x5b\xaa\xfd\x75\x6a\x89\xc2\x7b\x61\x84\xcb\x69\x7c\x93\xd0\x67\x77\x9e\xd9"
+            b"\x3d\x1e\xd5\xae\x33\x15\xd8\xa7\x21\x08\xcf\xbc\x2f\x03\xc2\xb5\x05\x32\xe1\x8a\x0b\x39\xec\x83\x19\x24\xfb\x98\x17\x2f\xf6\x91"
+            b"\x76\x8d\xd6\x4d\x78\x86\xdb\x44\x6a\x9b\xcc\x5f\x64\x90\xc1\x56\x4e\xa1\xe2\x69\x40\xaa\xef\x60\x52\xb7\xf8\x7b\x5c\xbc\xf5\x72"
+            b"\x06\xd5\xbe\x05\x08\xde\xb3\x0c\x1a\xc3\xa4\x17\x14\xc8\xa9\x1e\x3e\xf9\x8a\x21\x30\xf2\x87\x28\x22\xef\x90\x33\x2c\xe4\x9d\x3a"
+            b"\x96\x3d\x06\xdd\x98\x36\x0b\xd4\x8a\x2b\x1c\xcf\x84\x20\x11\xc6\xae\x11\x32\xf9\xa0\x1a\x3f\xf0\xb2\x07\x28\xeb\xbc\x0c\x25\xe2"
+            b"\xe6\x65\x6e\x95\xe8\x6e\x63\x9c\xfa\x73\x74\x87\xf4\x78\x79\x8e\xde\x49\x5a\xb1\xd0\x42\x57\xb8\xc2\x5f\x40\xa3\xcc\x54\x4d\xaa"
+            b"\x41\xf7\xda\xec\x4f\xfc\xd7\xe5\x5d\xe1\xc0\xfe\x53\xea\xcd\xf7\x79\xdb\xee\xc8\x77\xd0\xe3\xc1\x65\xcd\xf4\xda\x6b\xc6\xf9\xd3"
+            b"\x31\xaf\xb2\xa4\x3f\xa4\xbf\xad\x2d\xb9\xa8\xb6\x23\xb2\xa5\xbf\x09\x83\x86\x80\x07\x88\x8b\x89\x15\x95\x9c\x92\x1b\x9e\x91\x9b"
+            b"\xa1\x47\x0a\x7c\xaf\x4c\x07\x75\xbd\x51\x10\x6e\xb3\x5a\x1d\x67\x99\x6b\x3e\x58\x97\x60\x33\x51\x85\x7d\x24\x4a\x8b\x76\x29\x43"
+            b"\xd1\x1f\x62\x34\xdf\x14\x6f\x3d\xcd\x09\x78\x26\xc3\x02\x75\x2f\xe9\x33\x56\x10\xe7\x38\x5b\x19\xf5\x25\x4c\x02\xfb\x2e\x41\x0b"
+            b"\x9a\x8c\x61\xd7\x94\x87\x6c\xde\x86\x9a\x7b\xc5\x88\x91\x76\xcc\xa2\xa0\x55\xf3\xac\xab\x58\xfa\xbe\xb6\x4f\xe1\xb0\xbd\x42\xe8"
+            b"\xea\xd4\x09\x9f\xe4\xdf\x04\x96\xf6\xc2\x13\x8d\xf8\xc9\x1e\x84\xd2\xf8\x3d\xbb\xdc\xf3\x30\xb2\xce\xee\x27\xa9\xc0\xe5\x2a\xa0"
+            b"\x7a\x3c\xb1\x47\x74\x37\xbc\x4e\x66\x2a\xab\x55\x68\x21\xa6\x5c\x42\x10\x85\x63\x4c\x1b\x88\x6a\x5e\x06\x9f\x71\x50\x0d\x92\x78"
+            b"\x0a\x64\xd9\x0f\x04\x6f\xd4\x06\x16\x72\xc3\x1d\x18\x79\xce\x14\x32\x48\xed\x2b\x3c\x43\xe0\x22\x2e\x5e\xf7\x39\x20\x55\xfa\x30"
+            b"\xec\x01\xb7\x9a\xe2\x0a\xba\x93\xf0\x17\xad\x88\xfe\x1c\xa0\x81\xd4\x2d\x83\xbe\xda\x26\x8e\xb7\xc8\x3b\x99\xac\xc6\x30\x94\xa5"
+            b"\x9c\x59\xdf\xd2\x92\x52\xd2\xdb\x80\x4f\xc5\xc0\x8e\x44\xc8\xc9\xa4\x75\xeb\xf6\xaa\x7e\xe6\xff\xb8\x63\xf1\xe4\xb6\x68\xfc\xed"
+            b"\x0c\xb1\x67\x0a\x02\xba\x6a\x03\x10\xa7\x7d\x18\x1e\xac\x70\x11\x34\x9d\x53\x2e\x3a\x96\x5e\x27\x28\x8b\x49\x3c\x26\x80\x44\x35"
+            b"\x7c\xe9\x0f\x42\x72\xe2\x02\x4b\x60\xff\x15\x50\x6e\xf4\x18\x59\x44\xc5\x3b\x66\x4a\xce\x36\x6f\x58\xd3\x21\x74\x56\xd8\x2c\x7d"
+            b"\x37\x7a\x0c\xa1\x39\x71\x01\xa8\x2b\x6c\x16\xb3\x25\x67\x1b\xba\x0f\x56\x38\x85\x01\x5d\x35\x8c\x13\x40\x22\x97\x1d\x4b\x2f\x9e"
+            b"\x47\x22\x64\xe9\x49\x29\x69\xe0\x5b\x34\x7e\xfb\x55\x3f\x73\xf2\x7f\x0e\x50\xcd\x71\x05\x5d\xc4\x63\x18\x4a\xdf\x6d\x13\x47\xd6"
+            b"\xd7\xca\xdc\x31\xd9\xc1\xd1\x38\xcb\xdc\xc6\x23\xc5\xd7\xcb\x2a\xef\xe6\xe8\x15\xe1\xed\xe5\x1c\xf3\xf0\xf2\x07\xfd\xfb\xff\x0e"
+            b"\xa7\x92\xb4\x79\xa9\x99\xb9\x70\xbb\x84\xae\x6b\xb5\x8f\xa3\x62\x9f\xbe\x80\x5d\x91\xb5\x8d\x54\x83\xa8\x9a\x4f\x8d\xa3\x97\x46"
+        )),
+        ]
+
+TWOFISH_MDS = [
+        _u32((
+            b"\x75\x32\xbc\xbc\xf3\x21\xec\xec\xc6\x43\x20\x20\xf4\xc9\xb3\xb3\xdb\x03\xda\xda\x7b\x8b\x02\x02\xfb\x2b\xe2\xe2\xc8\xfa\x9e\x9e"
+            b"\x4a\xec\xc9\xc9\xd3\x09\xd4\xd4\xe6\x6b\x18\x18\x6b\x9f\x1e\x1e\x45\x0e\x98\x98\x7d\x38\xb2\xb2\xe8\xd2\xa6\xa6\x4b\xb7\x26\x26"
+            b"\xd6\x57\x3c\x3c\x32\x8a\x93\x93\xd8\xee\x82\x82\xfd\x98\x52\x52\x37\xd4\x7b\x7b\x71\x37\xbb\xbb\xf1\x97\x5b\x5b\xe1\x83\x47\x47"
+            b"\x30\x3c\x24\x24\x0f\xe2\x51\x51\xf8\xc6\xba\xba\x1b\xf3\x4a\x4a\x87\x48\xbf\xbf\xfa\x70\x0d\x0d\x06\xb3\xb0\xb0\x3f\xde\x75\x75"
+            b"\x5e\xfd\xd2\xd2\xba\x20\x7d\x7d\xae\x31\x66\x66\x5b\xa3\x3a\x3a\x8a\x1c\x59\x59\x00\x00\x00\x00\xbc\x93\xcd\xcd\x9d\xe0\x1a\x1a"
+            b"\x6d\x2c\xae\xae\xc1\xab\x7f\x7f\xb1\xc7\x2b\x2b\x0e\xb9\xbe\xbe\x80\xa0\xe0\xe0\x5d\x10\x8a\x8a\xd2\x52\x3b\x3b\xd5\xba\x64\x64"
+            b"\xa0\x88\xd8\xd8\x84\xa5\xe7\xe7\x07\xe8\x5f\x5f\x14\x11\x1b\x1b\xb5\xc2\x2c\x2c\x90\xb4\xfc\xfc\x2c\x27\x31\x31\xa3\x65\x80\x80"
+            b"\xb2\x2a\x73\x73\x73\x81\x0c\x0c\x4c\x5f\x79\x79\x54\x41\x6b\x6b\x92\x02\x4b\x4b\x74\x69\x53\x53\x36\x8f\x94\x94\x51\x1f\x83\x83"
+            b"\x38\x36\x2a\x2a\xb0\x9c\xc4\xc4\xbd\xc8\x22\x22\x5a\xf8\xd5\xd5\xfc\xc3\xbd\xbd\x60\x78\x48\x48\x62\xce\xff\xff\x96\x07\x4c\x4c"
+            b"\x6c\x77\x41\x41\x42\xe6\xc7\xc7\xf7\x24\xeb\xeb\x10\x14\x1c\x1c\x7c\x63\x5d\x5d\x28\x22\x36\x36\x27\xc0\x67\x67\x8c\xaf\xe9\xe9"
+            b"\x13\xf9\x44\x44\x95\xea\x14\x14\x9c\xbb\xf5\xf5\xc7\x18\xcf\xcf\x24\x2d\x3f\x3f\x46\xe3\xc0\xc0\x3b\xdb\x72\x72\x70\x6c\x54\x54"
+            b"\xca\x4c\x29\x29\xe3\x35\xf0\xf0\x85\xfe\x08\x08\xcb\x17\xc6\xc6\x11\x4f\xf3\xf3\xd0\xe4\x8c\x8c\x93\x59\xa4\xa4\xb8\x96\xca\xca"
+            b"\xa6\x3b\x68\x68\x83\x4d\xb8\xb8\x20\x28\x38\x38\xff\x2e\xe5\xe5\x9f\x56\xad\xad\x77\x84\x0b\x0b\xc3\x1d\xc8\xc8\xcc\xff\x99\x99"
+            b"\x03\xed\x58\x58\x6f\x9a\x19\x19\x08\x0a\x0e\x0e\xbf\x7e\x95\x95\x40\x50\x70\x70\xe7\x30\xf7\xf7\x2b\xcf\x6e\x6e\xe2\x6e\x1f\x1f"
+            b"\x79\x3d\xb5\xb5\x0c\x0f\x09\x09\xaa\x34\x61\x61\x82\x16\x57\x57\x41\x0b\x9f\x9f\x3a\x80\x9d\x9d\xea\x64\x11\x11\xb9\xcd\x25\x25"
+            b"\xe4\xdd\xaf\xaf\x9a\x08\x45\x45\xa4\x8d\xdf\xdf\x97\x5c\xa3\xa3\x7e\xd5\xea\xea\xda\x58\x35\x35\x7a\xd0\xed\xed\x17\xfc\x43\x43"
+            b"\x66\xcb\xf8\xf8\x94\xb1\xfb\xfb\xa1\xd3\x37\x37\x1d\x40\xfa\xfa\x3d\x68\xc2\xc2\xf0\xcc\xb4\xb4\xde\x5d\x32\x32\xb3\x71\x9c\x9c"
+            b"\x0b\xe7\x56\x56\x72\xda\xe3\xe3\xa7\x60\x87\x87\x1c\x1b\x15\x15\xef\x3a\xf9\xf9\xd1\xbf\x63\x63\x53\xa9\x34\x34\x3e\x85\x9a\x9a"
+            b"\x8f\x42\xb1\xb1\x33\xd1\x7c\x7c\x26\x9b\x88\x88\x5f\xa6\x3d\x3d\xec\xd7\xa1\xa1\x76\xdf\xe4\xe4\x2a\x94\x81\x81\x49\x01\x91\x91"
+            b"\x81\xfb\x0f\x0f\x88\xaa\xee\xee\xee\x61\x16\x16\x21\x73\xd7\xd7\xc4\xf5\x97\x97\x1a\xa8\xa5\xa5\xeb\x3f\xfe\xfe\xd9\xb5\x6d\x6d"
+            b"\xc5\xae\x78\x78\x39\x6d\xc5\xc5\x99\xe5\x1d\x1d\xcd\xa4\x76\x76\xad\xdc\x3e\x3e\x31\x67\xcb\xcb\x8b\x47\xb6\xb6\x01\x5b\xef\xef"
+            b"\x18\x1e\x12\x12\x23\xc5\x60\x60\xdd\xb0\x6a\x6a\x1f\xf6\x4d\x4d\x4e\xe9\xce\xce\x2d\x7c\xde\xde\xf9\x9d\x55\x55\x48\x5a\x7e\x7e"
+            b"\x4f\xb2\x21\x21\xf2\x7a\x03\x03\x65\x26\xa0\xa0\x8e\x19\x5e\x5e\x78\x66\x5a\x5a\x5c\x4b\x65\x65\x58\x4e\x62\x62\x19\x45\xfd\xfd"
+            b"\x8d\xf4\x06\x06\xe5\x86\x40\x40\x98\xbe\xf2\xf2\x57\xac\x33\x33\x67\x90\x17\x17\x7f\x8e\x05\x05\x05\x5e\xe8\xe8\x64\x7d\x4f\x4f"
+            b"\xaf\x6a\x89\x89\x63\x95\x10\x10\xb6\x2f\x74\x74\xfe\x75\x0a\x0a\xf5\x92\x5c\x5c\xb7\x74\x9b\x9b\x3c\x33\x2d\x2d\xa5\xd6\x30\x30"
+            b"\xce\x49\x2e\x2e\xe9\x89\x49\x49\x68\x72\x46\x46\x44\x55\x77\x77\xe0\xd8\xa8\xa8\x4d\x04\x96\x96\x43\xbd\x28\x28\x69\x29\xa9\xa9"
+            b"\x29\x79\xd9\xd9\x2e\x91\x86\x86\xac\x87\xd1\xd1\x15\x4a\xf4\xf4\x59\x15\x8d\x8d\xa8\x82\xd6\xd6\x0a\xbc\xb9\xb9\x9e\x0d\x42\x42"
+            b"\x6e\xc1\xf6\xf6\x47\xb8\x2f\x2f\xdf\x06\xdd\xdd\x34\x39\x23\x23\x35\x62\xcc\xcc\x6a\xc4\xf1\xf1\xcf\x12\xc1\xc1\xdc\xeb\x85\x85"
+            b"\x22\x9e\x8f\x8f\xc9\xa1\x71\x71\xc0\xf0\x90\x90\x9b\x53\xaa\xaa\x89\xf1\x01\x01\xd4\xe1\x8b\x8b\xed\x8c\x4e\x4e\xab\x6f\x8e\x8e"
+            b"\x12\xa2\xab\xab\xa2\x3e\x6f\x6f\x0d\x54\xe6\xe6\x52\xf2\xdb\xdb\xbb\x7b\x92\x92\x02\xb6\xb7\xb7\x2f\xca\x69\x69\xa9\xd9\x39\x39"
+            b"\xd7\x0c\xd3\xd3\x61\x23\xa7\xa7\x1e\xad\xa2\xa2\xb4\x99\xc3\xc3\x50\x44\x6c\x6c\x04\x05\x07\x07\xf6\x7f\x04\x04\xc2\x46\x27\x27"
+            b"\x16\xa7\xac\xac\x25\x76\xd0\xd0\x86\x13\x50\x50\x56\xf7\xdc\xdc\x55\x1a\x84\x84\x09\x51\xe1\xe1\xbe\x25\x7a\x7a\x91\xef\x13\x13"
+        )),
+        _u32((
+            b"\x39\x39\xd9\xa9\x17\x17\x90\x67\x9c\x9c\x71\xb3\xa6\xa6\xd2\xe8\x07\x07\x05\x04\x52\x52\x98\xfd\x80\x80\x65\xa3\xe4\xe4\xdf\x76"
+            b"\x45\x45\x08\x9a\x4b\x4b\x02\x92\xe0\xe0\xa0\x80\x5a\x5a\x66\x78\xaf\xaf\xdd\xe4\x6a\x6a\xb0\xdd\x63\x63\xbf\xd1\x2a\x2a\x36\x38"
+            b"\xe6\xe6\x54\x0d\x20\x20\x43\xc6\xcc\xcc\x62\x35\xf2\xf2\xbe\x98\x12\x12\x1e\x18\xeb\xeb\x24\xf7\xa1\xa1\xd7\xec\x41\x41\x77\x6c"
+            b"\x28\x28\xbd\x43\xbc\xbc\x32\x75\x7b\x7b\xd4\x37\x88\x88\x9b\x26\x0d\x0d\x70\xfa\x44\x44\xf9\x13\xfb\xfb\xb1\x94\x7e\x7e\x5a\x48"
+            b"\x03\x03\x7a\xf2\x8c\x8c\xe4\xd0\xb6\xb6\x47\x8b\x24\x24\x3c\x30\xe7\xe7\xa5\x84\x6b\x6b\x41\x54\xdd\xdd\x06\xdf\x60\x60\xc5\x23"
+            b"\xfd\xfd\x45\x19\x3a\x3a\xa3\x5b\xc2\xc2\x68\x3d\x8d\x8d\x15\x59\xec\xec\x21\xf3\x66\x66\x31\xae\x6f\x6f\x3e\xa2\x57\x57\x16\x82"
+            b"\x10\x10\x95\x63\xef\xef\x5b\x01\xb8\xb8\x4d\x83\x86\x86\x91\x2e\x6d\x6d\xb5\xd9\x83\x83\x1f\x51\xaa\xaa\x53\x9b\x5d\x5d\x63\x7c"
+            b"\x68\x68\x3b\xa6\xfe\xfe\x3f\xeb\x30\x30\xd6\xa5\x7a\x7a\x25\xbe\xac\xac\xa7\x16\x09\x09\x0f\x0c\xf0\xf0\x35\xe3\xa7\xa7\x23\x61"
+            b"\x90\x90\xf0\xc0\xe9\xe9\xaf\x8c\x9d\x9d\x80\x3a\x5c\x5c\x92\xf5\x0c\x0c\x81\x73\x31\x31\x27\x2c\xd0\xd0\x76\x25\x56\x56\xe7\x0b"
+            b"\x92\x92\x7b\xbb\xce\xce\xe9\x4e\x01\x01\xf1\x89\x1e\x1e\x9f\x6b\x34\x34\xa9\x53\xf1\xf1\xc4\x6a\xc3\xc3\x99\xb4\x5b\x5b\x97\xf1"
+            b"\x47\x47\x83\xe1\x18\x18\x6b\xe6\x22\x22\xc8\xbd\x98\x98\x0e\x45\x1f\x1f\x6e\xe2\xb3\xb3\xc9\xf4\x74\x74\x2f\xb6\xf8\xf8\xcb\x66"
+            b"\x99\x99\xff\xcc\x14\x14\xea\x95\x58\x58\xed\x03\xdc\xdc\xf7\x56\x8b\x8b\xe1\xd4\x15\x15\x1b\x1c\xa2\xa2\xad\x1e\xd3\xd3\x0c\xd7"
+            b"\xe2\xe2\x2b\xfb\xc8\xc8\x1d\xc3\x5e\x5e\x19\x8e\x2c\x2c\xc2\xb5\x49\x49\x89\xe9\xc1\xc1\x12\xcf\x95\x95\x7e\xbf\x7d\x7d\x20\xba"
+            b"\x11\x11\x64\xea\x0b\x0b\x84\x77\xc5\xc5\x6d\x39\x89\x89\x6a\xaf\x7c\x7c\xd1\x33\x71\x71\xa1\xc9\xff\xff\xce\x62\xbb\xbb\x37\x71"
+            b"\x0f\x0f\xfb\x81\xb5\xb5\x3d\x79\xe1\xe1\x51\x09\x3e\x3e\xdc\xad\x3f\x3f\x2d\x24\x76\x76\xa4\xcd\x55\x55\x9d\xf9\x82\x82\xee\xd8"
+            b"\x40\x40\x86\xe5\x78\x78\xae\xc5\x25\x25\xcd\xb9\x96\x96\x04\x4d\x77\x77\x55\x44\x0e\x0e\x0a\x08\x50\x50\x13\x86\xf7\xf7\x30\xe7"
+            b"\x37\x37\xd3\xa1\xfa\xfa\x40\x1d\x61\x61\x34\xaa\x4e\x4e\x8c\xed\xb0\xb0\xb3\x06\x54\x54\x6c\x70\x73\x73\x2a\xb2\x3b\x3b\x52\xd2"
+            b"\x9f\x9f\x0b\x41\x02\x02\x8b\x7b\xd8\xd8\x88\xa0\xf3\xf3\x4f\x11\xcb\xcb\x67\x31\x27\x27\x46\xc2\x67\x67\xc0\x27\xfc\xfc\xb4\x90"
+            b"\x38\x38\x28\x20\x04\x04\x7f\xf6\x48\x48\x78\x60\xe5\xe5\x2e\xff\x4c\x4c\x07\x96\x65\x65\x4b\x5c\x2b\x2b\xc7\xb1\x8e\x8e\x6f\xab"
+            b"\x42\x42\x0d\x9e\xf5\xf5\xbb\x9c\xdb\xdb\xf2\x52\x4a\x4a\xf3\x1b\x3d\x3d\xa6\x5f\xa4\xa4\x59\x93\xb9\xb9\xbc\x0a\xf9\xf9\x3a\xef"
+            b"\x13\x13\xef\x91\x08\x08\xfe\x85\x91\x91\x01\x49\x16\x16\x61\xee\xde\xde\x7c\x2d\x21\x21\xb2\x4f\xb1\xb1\x42\x8f\x72\x72\xdb\x3b"
+            b"\x2f\x2f\xb8\x47\xbf\xbf\x48\x87\xae\xae\x2c\x6d\xc0\xc0\xe3\x46\x3c\x3c\x57\xd6\x9a\x9a\x85\x3e\xa9\xa9\x29\x69\x4f\x4f\x7d\x64"
+            b"\x81\x81\x94\x2a\x2e\x2e\x49\xce\xc6\xc6\x17\xcb\x69\x69\xca\x2f\xbd\xbd\xc3\xfc\xa3\xa3\x5c\x97\xe8\xe8\x5e\x05\xed\xed\xd0\x7a"
+            b"\xd1\xd1\x87\xac\x05\x05\x8e\x7f\x64\x64\xba\xd5\xa5\xa5\xa8\x1a\x26\x26\xb7\x4b\xbe\xbe\xb9\x0e\x87\x87\x60\xa7\xd5\xd5\xf8\x5a"
+            b"\x36\x36\x22\x28\x1b\x1b\x11\x14\x75\x75\xde\x3f\xd9\xd9\x79\x29\xee\xee\xaa\x88\x2d\x2d\x33\x3c\x79\x79\x5f\x4c\xb7\xb7\xb6\x02"
+            b"\xca\xca\x96\xb8\x35\x35\x58\xda\xc4\xc4\x9c\xb0\x43\x43\xfc\x17\x84\x84\x1a\x55\x4d\x4d\xf6\x1f\x59\x59\x1c\x8a\xb2\xb2\x38\x7d"
+            b"\x33\x33\xac\x57\xcf\xcf\x18\xc7\x06\x06\xf4\x8d\x53\x53\x69\x74\x9b\x9b\x74\xb7\x97\x97\xf5\xc4\xad\xad\x56\x9f\xe3\xe3\xda\x72"
+            b"\xea\xea\xd5\x7e\xf4\xf4\x4a\x15\x8f\x8f\x9e\x22\xab\xab\xa2\x12\x62\x62\x4e\x58\x5f\x5f\xe8\x07\x1d\x1d\xe5\x99\x23\x23\x39\x34"
+            b"\xf6\xf6\xc1\x6e\x6c\x6c\x44\x50\x32\x32\x5d\xde\x46\x46\x72\x68\xa0\xa0\x26\x65\xcd\xcd\x93\xbc\xda\xda\x03\xdb\xba\xba\xc6\xf8"
+            b"\x9e\x9e\xfa\xc8\xd6\xd6\x82\xa8\x6e\x6e\xcf\x2b\x70\x70\x50\x40\x85\x85\xeb\xdc\x0a\x0a\x75\xfe\x93\x93\x8a\x32\xdf\xdf\x8d\xa4"
+            b"\x29\x29\x4c\xca\x1c\x1c\x14\x10\xd7\xd7\x73\x21\xb4\xb4\xcc\xf0\xd4\xd4\x09\xd3\x8a\x8a\x10\x5d\x51\x51\xe2\x0f\x00\x00\x00\x00"
+            b"\x19\x19\x9a\x6f\x1a\x1a\xe0\x9d\x94\x94\x8f\x36\xc7\xc7\xe6\x42\xc9\xc9\xec\x4a\xd2\xd2\xfd\x5e\x7f\x7f\xab\xc1\xa8\xa8\xd8\xe0"
+        )),
+        _u32((
+            b"\x32\xbc\x75\xbc\x21\xec\xf3\xec\x43\x20\xc6\x20\xc9\xb3\xf4\xb3\x03\xda\xdb\xda\x8b\x02\x7b\x02\x2b\xe2\xfb\xe2\xfa\x9e\xc8\x9e"
+            b"\xec\xc9\x4a\xc9\x09\xd4\xd3\xd4\x6b\x18\xe6\x18\x9f\x1e\x6b\x1e\x0e\x98\x45\x98\x38\xb2\x7d\xb2\xd2\xa6\xe8\xa6\xb7\x26\x4b\x26"
+            b"\x57\x3c\xd6\x3c\x8a\x93\x32\x93\xee\x82\xd8\x82\x98\x52\xfd\x52\xd4\x7b\x37\x7b\x37\xbb\x71\xbb\x97\x5b\xf1\x5b\x83\x47\xe1\x47"
+            b"\x3c\x24\x30\x24\xe2\x51\x0f\x51\xc6\xba\xf8\xba\xf3\x4a\x1b\x4a\x48\xbf\x87\xbf\x70\x0d\xfa\x0d\xb3\xb0\x06\xb0\xde\x75\x3f\x75"
+            b"\xfd\xd2\x5e\xd2\x20\x7d\xba\x7d\x31\x66\xae\x66\xa3\x3a\x5b\x3a\x1c\x59\x8a\x59\x00\x00\x00\x00\x93\xcd\xbc\xcd\xe0\x1a\x9d\x1a"
+            b"\x2c\xae\x6d\xae\xab\x7f\xc1\x7f\xc7\x2b\xb1\x2b\xb9\xbe\x0e\xbe\xa0\xe0\x80\xe0\x10\x8a\x5d\x8a\x52\x3b\xd2\x3b\xba\x64\xd5\x64"
+            b"\x88\xd8\xa0\xd8\xa5\xe7\x84\xe7\xe8\x5f\x07\x5f\x11\x1b\x14\x1b\xc2\x2c\xb5\x2c\xb4\xfc\x90\xfc\x27\x31\x2c\x31\x65\x80\xa3\x80"
+            b"\x2a\x73\xb2\x73\x81\x0c\x73\x0c\x5f\x79\x4c\x79\x41\x6b\x54\x6b\x02\x4b\x92\x4b\x69\x53\x74\x53\x8f\x94\x36\x94\x1f\x83\x51\x83"
+            b"\x36\x2a\x38\x2a\x9c\xc4\xb0\xc4\xc8\x22\xbd\x22\xf8\xd5\x5a\xd5\xc3\xbd\xfc\xbd\x78\x48\x60\x48\xce\xff\x62\xff\x07\x4c\x96\x4c"
+            b"\x77\x41\x6c\x41\xe6\xc7\x42\xc7\x24\xeb\xf7\xeb\x14\x1c\x10\x1c\x63\x5d\x7c\x5d\x22\x36\x28\x36\xc0\x67\x27\x67\xaf\xe9\x8c\xe9"
+            b"\xf9\x44\x13\x44\xea\x14\x95\x14\xbb\xf5\x9c\xf5\x18\xcf\xc7\xcf\x2d\x3f\x24\x3f\xe3\xc0\x46\xc0\xdb\x72\x3b\x72\x6c\x54\x70\x54"
+            b"\x4c\x29\xca\x29\x35\xf0\xe3\xf0\xfe\x08\x85\x08\x17\xc6\xcb\xc6\x4f\xf3\x11\xf3\xe4\x8c\xd0\x8c\x59\xa4\x93\xa4\x96\xca\xb8\xca"
+            b"\x3b\x68\xa6\x68\x4d\xb8\x83\xb8\x28\x38\x20\x38\x2e\xe5\xff\xe5\x56\xad\x9f\xad\x84\x0b\x77\x0b\x1d\xc8\xc3\xc8\xff\x99\xcc\x99"
+            b"\xed\x58\x03\x58\x9a\x19\x6f\x19\x0a\x0e\x08\x0e\x7e\x95\xbf\x95\x50\x70\x40\x70\x30\xf7\xe7\xf7\xcf\x6e\x2b\x6e\x6e\x1f\xe2\x1f"
+            b"\x3d\xb5\x79\xb5\x0f\x09\x0c\x09\x34\x61\xaa\x61\x16\x57\x82\x57\x0b\x9f\x41\x9f\x80\x9d\x3a\x9d\x64\x11\xea\x11\xcd\x25\xb9\x25"
+            b"\xdd\xaf\xe4\xaf\x08\x45\x9a\x45\x8d\xdf\xa4\xdf\x5c\xa3\x97\xa3\xd5\xea\x7e\xea\x58\x35\xda\x35\xd0\xed\x7a\xed\xfc\x43\x17\x43"
+            b"\xcb\xf8\x66\xf8\xb1\xfb\x94\xfb\xd3\x37\xa1\x37\x40\xfa\x1d\xfa\x68\xc2\x3d\xc2\xcc\xb4\xf0\xb4\x5d\x32\xde\x32\x71\x9c\xb3\x9c"
+            b"\xe7\x56\x0b\x56\xda\xe3\x72\xe3\x60\x87\xa7\x87\x1b\x15\x1c\x15\x3a\xf9\xef\xf9\xbf\x63\xd1\x63\xa9\x34\x53\x34\x85\x9a\x3e\x9a"
+            b"\x42\xb1\x8f\xb1\xd1\x7c\x33\x7c\x9b\x88\x26\x88\xa6\x3d\x5f\x3d\xd7\xa1\xec\xa1\xdf\xe4\x76\xe4\x94\x81\x2a\x81\x01\x91\x49\x91"
+            b"\xfb\x0f\x81\x0f\xaa\xee\x88\xee\x61\x16\xee\x16\x73\xd7\x21\xd7\xf5\x97\xc4\x97\xa8\xa5\x1a\xa5\x3f\xfe\xeb\xfe\xb5\x6d\xd9\x6d"
+            b"\xae\x78\xc5\x78\x6d\xc5\x39\xc5\xe5\x1d\x99\x1d\xa4\x76\xcd\x76\xdc\x3e\xad\x3e\x67\xcb\x31\xcb\x47\xb6\x8b\xb6\x5b\xef\x01\xef"
+            b"\x1e\x12\x18\x12\xc5\x60\x23\x60\xb0\x6a\xdd\x6a\xf6\x4d\x1f\x4d\xe9\xce\x4e\xce\x7c\xde\x2d\xde\x9d\x55\xf9\x55\x5a\x7e\x48\x7e"
+            b"\xb2\x21\x4f\x21\x7a\x03\xf2\x03\x26\xa0\x65\xa0\x19\x5e\x8e\x5e\x66\x5a\x78\x5a\x4b\x65\x5c\x65\x4e\x62\x58\x62\x45\xfd\x19\xfd"
+            b"\xf4\x06\x8d\x06\x86\x40\xe5\x40\xbe\xf2\x98\xf2\xac\x33\x57\x33\x90\x17\x67\x17\x8e\x05\x7f\x05\x5e\xe8\x05\xe8\x7d\x4f\x64\x4f"
+            b"\x6a\x89\xaf\x89\x95\x10\x63\x10\x2f\x74\xb6\x74\x75\x0a\xfe\x0a\x92\x5c\xf5\x5c\x74\x9b\xb7\x9b\x33\x2d\x3c\x2d\xd6\x30\xa5\x30"
+            b"\x49\x2e\xce\x2e\x89\x49\xe9\x49\x72\x46\x68\x46\x55\x77\x44\x77\xd8\xa8\xe0\xa8\x04\x96\x4d\x96\xbd\x28\x43\x28\x29\xa9\x69\xa9"
+            b"\x79\xd9\x29\xd9\x91\x86\x2e\x86\x87\xd1\xac\xd1\x4a\xf4\x15\xf4\x15\x8d\x59\x8d\x82\xd6\xa8\xd6\xbc\xb9\x0a\xb9\x0d\x42\x9e\x42"
+            b"\xc1\xf6\x6e\xf6\xb8\x2f\x47\x2f\x06\xdd\xdf\xdd\x39\x23\x34\x23\x62\xcc\x35\xcc\xc4\xf1\x6a\xf1\x12\xc1\xcf\xc1\xeb\x85\xdc\x85"
+            b"\x9e\x8f\x22\x8f\xa1\x71\xc9\x71\xf0\x90\xc0\x90\x53\xaa\x9b\xaa\xf1\x01\x89\x01\xe1\x8b\xd4\x8b\x8c\x4e\xed\x4e\x6f\x8e\xab\x8e"
+            b"\xa2\xab\x12\xab\x3e\x6f\xa2\x6f\x54\xe6\x0d\xe6\xf2\xdb\x52\xdb\x7b\x92\xbb\x92\xb6\xb7\x02\xb7\xca\x69\x2f\x69\xd9\x39\xa9\x39"
+            b"\x0c\xd3\xd7\xd3\x23\xa7\x61\xa7\xad\xa2\x1e\xa2\x99\xc3\xb4\xc3\x44\x6c\x50\x6c\x05\x07\x04\x07\x7f\x04\xf6\x04\x46\x27\xc2\x27"
+            b"\xa7\xac\x16\xac\x76\xd0\x25\xd0\x13\x50\x86\x50\xf7\xdc\x56\xdc\x1a\x84\x55\x84\x51\xe1\x09\xe1\x25\x7a\xbe\x7a\xef\x13\x91\x13"
+        )),
+        _u32((
+            b"\xd9\xa9\x39\xd9\x90\x67\x17\x90\x71\xb3\x9c\x71\xd2\xe8\xa6\xd2\x05\x04\x07\x05\x98\xfd\x52\x98\x65\xa3\x80\x65\xdf\x76\xe4\xdf"
+            b"\x08\x9a\x45\x08\x02\x92\x4b\x02\xa0\x80\xe0\xa0\x66\x78\x5a\x66\xdd\xe4\xaf\xdd\xb0\xdd\x6a\xb0\xbf\xd1\x63\xbf\x36\x38\x2a\x36"
+            b"\x54\x0d\xe6\x54\x43\xc6\x20\x43\x62\x35\xcc\x62\xbe\x98\xf2\xbe\x1e\x18\x12\x1e\x24\xf7\xeb\x24\xd7\xec\xa1\xd7\x77\x6c\x41\x77"
+            b"\xbd\x43\x28\xbd\x32\x75\xbc\x32\xd4\x37\x7b\xd4\x9b\x26\x88\x9b\x70\xfa\x0d\x70\xf9\x13\x44\xf9\xb1\x94\xfb\xb1\x5a\x48\x7e\x5a"
+            b"\x7a\xf2\x03\x7a\xe4\xd0\x8c\xe4\x47\x8b\xb6\x47\x3c\x30\x24\x3c\xa5\x84\xe7\xa5\x41\x54\x6b\x41\x06\xdf\xdd\x06\xc5\x23\x60\xc5"
+            b"\x45\x19\xfd\x45\xa3\x5b\x3a\xa3\x68\x3d\xc2\x68\x15\x59\x8d\x15\x21\xf3\xec\x21\x31\xae\x66\x31\x3e\xa2\x6f\x3e\x16\x82\x57\x16"
+            b"\x95\x63\x10\x95\x5b\x01\xef\x5b\x4d\x83\xb8\x4d\x91\x2e\x86\x91\xb5\xd9\x6d\xb5\x1f\x51\x83\x1f\x53\x9b\xaa\x53\x63\x7c\x5d\x63"
+            b"\x3b\xa6\x68\x3b\x3f\xeb\xfe\x3f\xd6\xa5\x30\xd6\x25\xbe\x7a\x25\xa7\x16\xac\xa7\x0f\x0c\x09\x0f\x35\xe3\xf0\x35\x23\x61\xa7\x23"
+            b"\xf0\xc0\x90\xf0\xaf\x8c\xe9\xaf\x80\x3a\x9d\x80\x92\xf5\x5c\x92\x81\x73\x0c\x81\x27\x2c\x31\x27\x76\x25\xd0\x76\xe7\x0b\x56\xe7"
+            b"\x7b\xbb\x92\x7b\xe9\x4e\xce\xe9\xf1\x89\x01\xf1\x9f\x6b\x1e\x9f\xa9\x53\x34\xa9\xc4\x6a\xf1\xc4\x99\xb4\xc3\x99\x97\xf1\x5b\x97"
+            b"\x83\xe1\x47\x83\x6b\xe6\x18\x6b\xc8\xbd\x22\xc8\x0e\x45\x98\x0e\x6e\xe2\x1f\x6e\xc9\xf4\xb3\xc9\x2f\xb6\x74\x2f\xcb\x66\xf8\xcb"
+            b"\xff\xcc\x99\xff\xea\x95\x14\xea\xed\x03\x58\xed\xf7\x56\xdc\xf7\xe1\xd4\x8b\xe1\x1b\x1c\x15\x1b\xad\x1e\xa2\xad\x0c\xd7\xd3\x0c"
+            b"\x2b\xfb\xe2\x2b\x1d\xc3\xc8\x1d\x19\x8e\x5e\x19\xc2\xb5\x2c\xc2\x89\xe9\x49\x89\x12\xcf\xc1\x12\x7e\xbf\x95\x7e\x20\xba\x7d\x20"
+            b"\x64\xea\x11\x64\x84\x77\x0b\x84\x6d\x39\xc5\x6d\x6a\xaf\x89\x6a\xd1\x33\x7c\xd1\xa1\xc9\x71\xa1\xce\x62\xff\xce\x37\x71\xbb\x37"
+            b"\xfb\x81\x0f\xfb\x3d\x79\xb5\x3d\x51\x09\xe1\x51\xdc\xad\x3e\xdc\x2d\x24\x3f\x2d\xa4\xcd\x76\xa4\x9d\xf9\x55\x9d\xee\xd8\x82\xee"
+            b"\x86\xe5\x40\x86\xae\xc5\x78\xae\xcd\xb9\x25\xcd\x04\x4d\x96\x04\x55\x44\x77\x55\x0a\x08\x0e\x0a\x13\x86\x50\x13\x30\xe7\xf7\x30"
+            b"\xd3\xa1\x37\xd3\x40\x1d\xfa\x40\x34\xaa\x61\x34\x8c\xed\x4e\x8c\xb3\x06\xb0\xb3\x6c\x70\x54\x6c\x2a\xb2\x73\x2a\x52\xd2\x3b\x52"
+            b"\x0b\x41\x9f\x0b\x8b\x7b\x02\x8b\x88\xa0\xd8\x88\x4f\x11\xf3\x4f\x67\x31\xcb\x67\x46\xc2\x27\x46\xc0\x27\x67\xc0\xb4\x90\xfc\xb4"
+            b"\x28\x20\x38\x28\x7f\xf6\x04\x7f\x78\x60\x48\x78\x2e\xff\xe5\x2e\x07\x96\x4c\x07\x4b\x5c\x65\x4b\xc7\xb1\x2b\xc7\x6f\xab\x8e\x6f"
+            b"\x0d\x9e\x42\x0d\xbb\x9c\xf5\xbb\xf2\x52\xdb\xf2\xf3\x1b\x4a\xf3\xa6\x5f\x3d\xa6\x59\x93\xa4\x59\xbc\x0a\xb9\xbc\x3a\xef\xf9\x3a"
+            b"\xef\x91\x13\xef\xfe\x85\x08\xfe\x01\x49\x91\x01\x61\xee\x16\x61\x7c\x2d\xde\x7c\xb2\x4f\x21\xb2\x42\x8f\xb1\x42\xdb\x3b\x72\xdb"
+            b"\xb8\x47\x2f\xb8\x48\x87\xbf\x48\x2c\x6d\xae\x2c\xe3\x46\xc0\xe3\x57\xd6\x3c\x57\x85\x3e\x9a\x85\x29\x69\xa9\x29\x7d\x64\x4f\x7d"
+            b"\x94\x2a\x81\x94\x49\xce\x2e\x49\x17\xcb\xc6\x17\xca\x2f\x69\xca\xc3\xfc\xbd\xc3\x5c\x97\xa3\x5c\x5e\x05\xe8\x5e\xd0\x7a\xed\xd0"
+            b"\x87\xac\xd1\x87\x8e\x7f\x05\x8e\xba\xd5\x64\xba\xa8\x1a\xa5\xa8\xb7\x4b\x26\xb7\xb9\x0e\xbe\xb9\x60\xa7\x87\x60\xf8\x5a\xd5\xf8"
+            b"\x22\x28\x36\x22\x11\x14\x1b\x11\xde\x3f\x75\xde\x79\x29\xd9\x79\xaa\x88\xee\xaa\x33\x3c\x2d\x33\x5f\x4c\x79\x5f\xb6\x02\xb7\xb6"
+            b"\x96\xb8\xca\x96\x58\xda\x35\x58\x9c\xb0\xc4\x9c\xfc\x17\x43\xfc\x1a\x55\x84\x1a\xf6\x1f\x4d\xf6\x1c\x8a\x59\x1c\x38\x7d\xb2\x38"
+            b"\xac\x57\x33\xac\x18\xc7\xcf\x18\xf4\x8d\x06\xf4\x69\x74\x53\x69\x74\xb7\x9b\x74\xf5\xc4\x97\xf5\x56\x9f\xad\x56\xda\x72\xe3\xda"
+            b"\xd5\x7e\xea\xd5\x4a\x15\xf4\x4a\x9e\x22\x8f\x9e\xa2\x12\xab\xa2\x4e\x58\x62\x4e\xe8\x07\x5f\xe8\xe5\x99\x1d\xe5\x39\x34\x23\x39"
+            b"\xc1\x6e\xf6\xc1\x44\x50\x6c\x44\x5d\xde\x32\x5d\x72\x68\x46\x72\x26\x65\xa0\x26\x93\xbc\xcd\x93\x03\xdb\xda\x03\xc6\xf8\xba\xc6"
+            b"\xfa\xc8\x9e\xfa\x82\xa8\xd6\x82\xcf\x2b\x6e\xcf\x50\x40\x70\x50\xeb\xdc\x85\xeb\x75\xfe\x0a\x75\x8a\x32\x93\x8a\x8d\xa4\xdf\x8d"
+            b"\x4c\xca\x29\x4c\x14\x10\x1c\x14\x73\x21\xd7\x73\xcc\xf0\xb4\xcc\x09\xd3\xd4\x09\x10\x5d\x8a\x10\xe2\x0f\x51\xe2\x00\x00\x00\x00"
+            b"\x9a\x6f\x19\x9a\xe0\x9d\x1a\xe0\x8f\x36\x94\x8f\xe6\x42\xc7\xe6\xec\x4a\xc9\xec\xfd\x5e\xd2\xfd\xab\xc1\x7f\xab\xd8\xe0\xa8\xd8"
+        )),
+        ]
+
+TWOFISH_Q = [
+        (
+            b"\xa9\x67\xb3\xe8\x04\xfd\xa3\x76\x9a\x92\x80\x78\xe4\xdd\xd1\x38\x0d\xc6\x35\x98\x18\xf7\xec\x6c\x43\x75\x37\x26\xfa\x13\x94\x48"
+            b"\xf2\xd0\x8b\x30\x84\x54\xdf\x23\x19\x5b\x3d\x59\xf3\xae\xa2\x82\x63\x01\x83\x2e\xd9\x51\x9b\x7c\xa6\xeb\xa5\xbe\x16\x0c\xe3\x61"
+            b"\xc0\x8c\x3a\xf5\x73\x2c\x25\x0b\xbb\x4e\x89\x6b\x53\x6a\xb4\xf1\xe1\xe6\xbd\x45\xe2\xf4\xb6\x66\xcc\x95\x03\x56\xd4\x1c\x1e\xd7"
+            b"\xfb\xc3\x8e\xb5\xe9\xcf\xbf\xba\xea\x77\x39\xaf\x33\xc9\x62\x71\x81\x79\x09\xad\x24\xcd\xf9\xd8\xe5\xc5\xb9\x4d\x44\x08\x86\xe7"
+            b"\xa1\x1d\xaa\xed\x06\x70\xb2\xd2\x41\x7b\xa0\x11\x31\xc2\x27\x90\x20\xf6\x60\xff\x96\x5c\xb1\xab\x9e\x9c\x52\x1b\x5f\x93\x0a\xef"
+            b"\x91\x85\x49\xee\x2d\x4f\x8f\x3b\x47\x87\x6d\x46\xd6\x3e\x69\x64\x2a\xce\xcb\x2f\xfc\x97\x05\x7a\xac\x7f\xd5\x1a\x4b\x0e\xa7\x5a"
+            b"\x28\x14\x3f\x29\x88\x3c\x4c\x02\xb8\xda\xb0\x17\x55\x1f\x8a\x7d\x57\xc7\x8d\x74\xb7\xc4\x9f\x72\x7e\x15\x22\x12\x58\x07\x99\x34"
+            b"\x6e\x50\xde\x68\x65\xbc\xdb\xf8\xc8\xa8\x2b\x40\xdc\xfe\x32\xa4\xca\x10\x21\xf0\xd3\x5d\x0f\x00\x6f\x9d\x36\x42\x4a\x5e\xc1\xe0"
+        ),
+        (
+            b"\x75\xf3\xc6\xf4\xdb\x7b\xfb\xc8\x4a\xd3\xe6\x6b\x45\x7d\xe8\x4b\xd6\x32\xd8\xfd\x37\x71\xf1\xe1\x30\x0f\xf8\x1b\x87\xfa\x06\x3f"
+            b"\x5e\xba\xae\x5b\x8a\x00\xbc\x9d\x6d\xc1\xb1\x0e\x80\x5d\xd2\xd5\xa0\x84\x07\x14\xb5\x90\x2c\xa3\xb2\x73\x4c\x54\x92\x74\x36\x51"
+            b"\x38\xb0\xbd\x5a\xfc\x60\x62\x96\x6c\x42\xf7\x10\x7c\x28\x27\x8c\x13\x95\x9c\xc7\x24\x46\x3b\x70\xca\xe3\x85\xcb\x11\xd0\x93\xb8"
+            b"\xa6\x83\x20\xff\x9f\x77\xc3\xcc\x03\x6f\x08\xbf\x40\xe7\x2b\xe2\x79\x0c\xaa\x82\x41\x3a\xea\xb9\xe4\x9a\xa4\x97\x7e\xda\x7a\x17"
+            b"\x66\x94\xa1\x1d\x3d\xf0\xde\xb3\x0b\x72\xa7\x1c\xef\xd1\x53\x3e\x8f\x33\x26\x5f\xec\x76\x2a\x49\x81\x88\xee\x21\xc4\x1a\xeb\xd9"
+            b"\xc5\x39\x99\xcd\xad\x31\x8b\x01\x18\x23\xdd\x1f\x4e\x2d\xf9\x48\x4f\xf2\x65\x8e\x78\x5c\x58\x19\x8d\xe5\x98\x57\x67\x7f\x05\x64"
+            b"\xaf\x63\xb6\xfe\xf5\xb7\x3c\xa5\xce\xe9\x68\x44\xe0\x4d\x43\x69\x29\x2e\xac\x15\x59\xa8\x0a\x9e\x6e\x47\xdf\x34\x35\x6a\xcf\xdc"
+            b"\x22\xc9\xc0\x9b\x89\xd4\xed\xab\x12\xa2\x0d\x52\xbb\x02\x2f\xa9\xd7\x61\x1e\xb4\x50\x04\xf6\xc2\x16\x25\x86\x56\x55\x09\xbe\x91"
+        ),
+        ]
@@ -0,0 +1,267 @@
+#!/usr/bin/env python
+
+import argparse
+import concurrent.futures
+import json
+import os
+import stat
+import sys
+import time
+
+import sha3_fast
+
+class TreeHashError(Exception):
+    pass
+
+# Bytes read per readinto(), the buffer is allocated once per process
+CHUNK_SZ = 1 << 20
+
+# Files modified this recently when the scan starts are hashed but not cached: a later write within the same
+# mtime tick would leave size and mtime unchanged
+RACY_NS = 2 * (10 ** 9)
+
+_buffer = None
+
+def hash_file(path, chunk_sz=CHUNK_SZ):
+    global _buffer
+
+    if (_buffer is None) or (len(_buffer) != chunk_sz):
+        _buffer = bytearray(chunk_sz)
+    view = memoryview(_buffer)
+
+    ctx = sha3_fast.SHA3(256)
+    with open(path, "rb", buffering=0) as f:
+        while True:
+            n = f.readinto(_buffer)
+            if not n:
+                break
+            # A view, SHA3.update() slices what it is given
+            ctx.update(view[:n])
+
+    return ctx.finish()
+
+def _hash(path, chunk_sz):
+    # (digest, None), or (None, error message) when the file cannot be read, e.g. it vanished since the walk
+    try:
+        return (hash_file(path, chunk_sz), None)
+    except OSError as e:
+        return (None, e.strerror or str(e))
+
+def _relative(path, root):
+    return os.path.relpath(path, root).replace(os.sep, "/")
+
+def _walk(root, errors):
+    # Regular files under root as (relative path with / separators, stat), symbolic links are not followed.
+    # Entries that cannot be listed or stat()ed are appended to errors as (path, message).
+    pending = [ root ]
+    while pending:
+        directory = pending.pop()
+        try:
+            with os.scandir(directory) as entries:
+                entries = list(entries)
+        except OSError as e:
+            errors.append((_relative(directory, root), e.strerror or str(e)))
+            continue
+
+        for entry in entries:
+            try:
+                st = entry.stat(follow_symlinks=False)
+            except OSError as e:
+                errors.append((_relative(entry.path, root), e.strerror or str(e)))
+                continue
+
+            if stat.S_ISDIR(st.st_mode):
+                pending.append(entry.path)
+            elif stat.S_ISREG(st.st_mode):
+                yield (_relative(entry.path, root), st)
+
+def _key(st):
+    return "%d:%d:%d:%d" % (st.st_dev, st.st_ino, st.st_size, st.st_mtime_ns)
+
+def _load(cache_path):
+    try:
+        with open(cache_path) as f:
+            cache = json.load(f)
+    except FileNotFoundError:
+        return { }
+    except ValueError:
+        raise TreeHashError("Cache file is corrupted")
+
+    # Another version or layout: start over
+    if (not isinstance(cache, dict)) or (cache.get("version") != 1) or (not isinstance(cache.get("entries"), dict)):
+        return { }
+    return cache["entries"]
+
+def _store(cache_path, entries):
+    # Written aside then renamed, an interrupted scan leaves the previous cache in place
+    tmp = cache_path + ".tmp"
+    with open(tmp, "w") as f:
+        json.dump({ "version" : 1, "entries" : entries }, f, sort_keys=True)
+    os.replace(tmp, cache_path)
+
+def scan(root, cache_path=None, workers=1, chunk_sz=CHUNK_SZ):
+    # Returns (manifest, digest, stats). The manifest lists (path, SHA3-256) sorted by path, the digest is
+    # SHA3-256 of its text form. Files whose (device, inode, size, mtime) are in the cache are not read.
+    # Files that cannot be read are left out of the manifest and listed in stats["errors"].
+    start = time.time_ns()
+    cached = _load(cache_path) if cache_path else { }
+
+    errors = [ ]
+    files = sorted(_walk(root, errors))
+    digests = { }
+    todo = [ ]
+    for (path, st) in files:
+        key = _key(st)
+        if key in cached:
+            digests[path] = bytes.fromhex(cached[key])
+        else:
+            todo.append(path)
+
+    paths = [ os.path.join(root, *path.split("/")) for path in todo ]
+    if workers > 1:
+        with concurrent.futures.ProcessPoolExecutor(workers) as pool:
+            results = list(pool.map(_hash, paths, [ chunk_sz ] * len(paths), chunksize=16))
+    else:
+        results = [ _hash(path, chunk_sz) for path in paths ]
+
+    for (path, (digest, error)) in zip(todo, results):
+        if error is None:
+            digests[path] = digest
+        else:
+            errors.append((path, error))
+
+    files = [ (path, st) for (path, st) in files if path in digests ]
+
+    if cache_path:
+        # Only the files seen by this scan are kept
+        entries = { }
+        for (path, st) in files:
+            if st.st_mtime_ns < start - RACY_NS:
+                entries[_key(st)] = digests[path].hex()
+        _store(cache_path, entries)
+
+    manifest = [ (path, digests[path]) for (path, st) in files ]
+
+    ctx = sha3_fast.SHA3(256)
+    ctx.update(format_manifest(manifest).encode())
+
+    hashed = set(todo)
+    stats = {
+            "files" : len(files),
+            "hashed" : len([ path for (path, st) in files if path in hashed ]),
+            "hashed_bytes" : sum([ st.st_size for (path, st) in files if path in hashed ]),
+            "errors" : sorted(errors),
+            }
+
+    return (manifest, ctx.finish(), stats)
+
+def format_manifest(manifest):
+    # One "digest  path" line per file, as sha3sum prints them
+    return "".join([ "%s  %s\n" % (digest.hex(), path) for (path, digest) in manifest ])
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="pycrypto-treehash", description="SHA3-256 manifest of a directory tree")
+    parser.add_argument("root", help="directory to hash")
+    parser.add_argument("-c", "--cache", help="cache file of the digests, keyed by device, inode, size and mtime")
+    parser.add_argument("-w", "--workers", type=int, default=os.cpu_count() or 1, help="worker processes, 1 to run inline")
+    parser.add_argument("--chunk-size", type=int, default=CHUNK_SZ, help="bytes read at once")
+    parser.add_argument("-m", "--manifest", action="store_true", help="print the manifest before its digest")
+    parser.add_argument("-q", "--quiet", action="store_true", help="do not report the statistics")
+    args = parser.parse_args(argv)
+
+    if not os.path.isdir(args.root):
+        print("pycrypto-treehash: not a directory: " + args.root, file=sys.stderr)
+        return 1
+
+    t = time.perf_counter_ns()
+    try:
+        (manifest, digest, stats) = scan(args.root, args.cache, max(1, args.workers), args.chunk_size)
+    except TreeHashError as e:
+        print("pycrypto-treehash: " + str(e), file=sys.stderr)
+        return 1
+    elapsed = (time.perf_counter_ns() - t) / (10 ** 9)
+
+    if args.manifest:
+        sys.stdout.write(format_manifest(manifest))
+    print(digest.hex())
+
+    # The scan goes on past unreadable files, they are reported and the exit status is 1
+    for (path, error) in stats["errors"]:
+        print("pycrypto-treehash: %s: %s" % (path, error), file=sys.stderr)
+
+    if not args.quiet:
+        print("pycrypto-treehash: %d files, %d hashed (%d bytes), %d errors in %.3f s" % (stats["files"], stats["hashed"], stats["hashed_bytes"], len(stats["errors"]), elapsed), file=sys.stderr)
+
+    return 1 if stats["errors"] else 0
+
+if __name__ == "__main__":
+    # python treehash.py ROOT ... runs the command line, without arguments the self-test
+    if len(sys.argv) > 1:
+        exit(main())
+
+    import hashlib
+    import shutil
+    import tempfile
+
+    tmp = tempfile.mkdtemp()
+    try:
+        root = os.path.join(tmp, "root")
+        cache_path = os.path.join(tmp, "cache.json")
+        contents = { "a.bin" : os.urandom(3000), "empty" : b"", "sub/b.bin" : os.urandom(100), "sub/deep/c.bin" : os.urandom(5000) }
+
+        # Old enough for the cache
+        old = time.time_ns() - 10 * RACY_NS
+        for (path, data) in contents.items():
+            full = os.path.join(root, *path.split("/"))
+            os.makedirs(os.path.dirname(full), exist_ok=True)
+            with open(full, "wb") as f:
+                f.write(data)
+            os.utime(full, ns=(old, old))
+
+        start = time.time_ns()
+
+        # Digests against hashlib, the first scan reads everything, by 1 KiB chunks
+        (manifest, digest, stats) = scan(root, cache_path, 1, 1 << 10)
+        res_test = (manifest == sorted([ (path, hashlib.sha3_256(data).digest()) for (path, data) in contents.items() ]))
+        res_test = res_test and (digest == hashlib.sha3_256(format_manifest(manifest).encode()).digest())
+        res_test = res_test and (stats["hashed"] == 4) and (stats["hashed_bytes"] == sum([ len(d) for d in contents.values() ])) and (not stats["errors"])
+
+        # Nothing changed: no byte read
+        res_test = res_test and (scan(root, cache_path) == (manifest, digest, { "files" : 4, "hashed" : 0, "hashed_bytes" : 0, "errors" : [ ] }))
+
+        # One file rewritten: only that one is read again
+        full = os.path.join(root, "sub", "b.bin")
+        with open(full, "wb") as f:
+            f.write(b"changed")
+        os.utime(full, ns=(old + 1, old + 1))
+        (manifest, digest, stats) = scan(root, cache_path)
+        res_test = res_test and (stats["hashed"] == 1) and (stats["hashed_bytes"] == 7) and (dict(manifest)["sub/b.bin"] == hashlib.sha3_256(b"changed").digest())
+
+        # A file vanishing between the walk and its hashing is reported, the others still are hashed
+        with open(os.path.join(root, "gone"), "wb") as f:
+            f.write(b"x")
+        original = hash_file
+        def hash_file(path, chunk_sz=CHUNK_SZ):
+            if path.endswith("gone"):
+                os.unlink(path)
+            return original(path, chunk_sz)
+        (manifest, digest, stats) = scan(root, cache_path)
+        hash_file = original
+        res_test = res_test and ([ path for (path, error) in stats["errors"] ] == [ "gone" ]) and (len(manifest) == 4)
+
+        # Caches of another layout are ignored
+        for cache in [ { "version" : 1 }, { "version" : 2, "entries" : { } }, [ ] ]:
+            with open(cache_path, "w") as f:
+                json.dump(cache, f)
+            res_test = res_test and (scan(root, cache_path)[2]["hashed"] == 4)
+
+        end = time.time_ns()
+        elapsed_time = (end - start) / (10 ** 9)
+    finally:
+        shutil.rmtree(tmp)
+
+    # Check tests
+    print("Test: ", res_test)
+    print("Time: ", elapsed_time, "s")
+
+    exit(0)
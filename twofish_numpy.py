@@ -0,0 +1,182 @@
+#!/usr/bin/env python
+
+import os
+import time
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+from twofish_fast import Twofish, TwofishError
+
+class TwofishNumpy:
+    # Number of blocks processed per batch, bounds the size of the temporaries
+    _BATCH = 1 << 16
+
+    def __init__(self, ctx, use_numpy=True):
+        self._ctx = ctx
+        self.use_numpy = use_numpy and (numpy is not None)
+
+        if numpy is not None:
+            self._K = numpy.array(ctx._K, dtype=numpy.uint32)
+            self._sm = numpy.array([ [ Twofish._MDS[i][y] for y in ctx._s[i] ] for i in range(4) ], dtype=numpy.uint32)
+
+    def encrypt_ecb(self, data, padding=True):
+        if not self.use_numpy:
+            return self._ctx.encrypt_ecb(data, padding)
+
+        if padding:
+            data = Twofish._pad(data)
+        elif len(data) % 16:
+            raise TwofishError("Data length must be a multiple of 16 bytes")
+
+        out = bytearray(len(data))
+        src = numpy.frombuffer(data, dtype="<u4").reshape(-1, 4)
+        dst = numpy.frombuffer(out, dtype="<u4").reshape(-1, 4)
+
+        for i in range(0, len(src), TwofishNumpy._BATCH):
+            dst[i:i+TwofishNumpy._BATCH] = self._encrypt_words(src[i:i+TwofishNumpy._BATCH])
+
+        return out
+
+    def decrypt_ecb(self, data, padding=True):
+        if not self.use_numpy:
+            return self._ctx.decrypt_ecb(data, padding)
+
+        if len(data) % 16:
+            raise TwofishError("Data length must be a multiple of 16 bytes")
+
+        out = bytearray(len(data))
+        src = numpy.frombuffer(data, dtype="<u4").reshape(-1, 4)
+        dst = numpy.frombuffer(out, dtype="<u4").reshape(-1, 4)
+
+        for i in range(0, len(src), TwofishNumpy._BATCH):
+            dst[i:i+TwofishNumpy._BATCH] = self._decrypt_words(src[i:i+TwofishNumpy._BATCH])
+
+        # Release the views on out so that the padding can be stripped in place
+        del src, dst
+
+        if padding:
+            Twofish._unpad(out)
+
+        return out
+
+    def encrypt_ctr(self, counter, data):
+        if not self.use_numpy:
+            return self._ctx.encrypt_ctr(counter, data)
+
+        if len(counter) != 16:
+            raise TwofishError("Counter length must be 16 bytes")
+
+        out = bytearray(len(data))
+        src = numpy.frombuffer(data, dtype=numpy.uint8)
+        dst = numpy.frombuffer(out, dtype=numpy.uint8)
+
+        (hi, lo) = (int.from_bytes(counter[:8], byteorder="big"), int.from_bytes(counter[8:], byteorder="big"))
+        batch_sz = 16 * TwofishNumpy._BATCH
+
+        for i in range(0, len(data), batch_sz):
+            n = min(batch_sz, len(data) - i)
+            ks = self._encrypt_words(TwofishNumpy._counters(hi, lo, (n + 15) // 16))
+            dst[i:i+n] = src[i:i+n] ^ ks.astype("<u4", copy=False).view(numpy.uint8).reshape(-1)[:n]
+
+            # Advance the 128 bits counter past this batch
+            ctr = ((((hi << 64) | lo) + TwofishNumpy._BATCH)) & 0xffffffffffffffffffffffffffffffff
+            (hi, lo) = (ctr >> 64, ctr & 0xffffffffffffffff)
+
+        return out
+
+    decrypt_ctr = encrypt_ctr
+
+    def _encrypt_words(self, P):
+        K = self._K
+        (S0, S1, S2, S3) = self._sm
+
+        # Input whitening
+        (R0, R1, R2, R3) = (P[:, 0] ^ K[0], P[:, 1] ^ K[1], P[:, 2] ^ K[2], P[:, 3] ^ K[3])
+
+        # 16 Rounds
+        for r in range(8, 40, 4):
+            T0 = S0[R0 & 0xff] ^ S1[(R0 >> 8) & 0xff] ^ S2[(R0 >> 16) & 0xff] ^ S3[R0 >> 24]
+            T1 = S0[R1 >> 24] ^ S1[R1 & 0xff] ^ S2[(R1 >> 8) & 0xff] ^ S3[(R1 >> 16) & 0xff]
+            R2 = R2 ^ (T0 + T1 + K[r])
+            R2 = (R2 >> 1) | (R2 << 31)
+            R3 = ((R3 << 1) | (R3 >> 31)) ^ (T0 + T1 + T1 + K[r+1])
+
+            T0 = S0[R2 & 0xff] ^ S1[(R2 >> 8) & 0xff] ^ S2[(R2 >> 16) & 0xff] ^ S3[R2 >> 24]
+            T1 = S0[R3 >> 24] ^ S1[R3 & 0xff] ^ S2[(R3 >> 8) & 0xff] ^ S3[(R3 >> 16) & 0xff]
+            R0 = R0 ^ (T0 + T1 + K[r+2])
+            R0 = (R0 >> 1) | (R0 << 31)
+            R1 = ((R1 << 1) | (R1 >> 31)) ^ (T0 + T1 + T1 + K[r+3])
+
+        # Undo last swap and output whitening
+        return numpy.stack([ R2 ^ K[4], R3 ^ K[5], R0 ^ K[6], R1 ^ K[7] ], axis=1)
+
+    def _decrypt_words(self, C):
+        K = self._K
+        (S0, S1, S2, S3) = self._sm
+
+        # Reverse output whitening and do last swap
+        (R0, R1, R2, R3) = (C[:, 2] ^ K[6], C[:, 3] ^ K[7], C[:, 0] ^ K[4], C[:, 1] ^ K[5])
+
+        # Reverse 16 Rounds
+        for r in range(38, 8, -4):
+            T0 = S0[R2 & 0xff] ^ S1[(R2 >> 8) & 0xff] ^ S2[(R2 >> 16) & 0xff] ^ S3[R2 >> 24]
+            T1 = S0[R3 >> 24] ^ S1[R3 & 0xff] ^ S2[(R3 >> 8) & 0xff] ^ S3[(R3 >> 16) & 0xff]
+            R0 = ((R0 << 1) | (R0 >> 31)) ^ (T0 + T1 + K[r])
+            R1 = R1 ^ (T0 + T1 + T1 + K[r+1])
+            R1 = (R1 >> 1) | (R1 << 31)
+
+            T0 = S0[R0 & 0xff] ^ S1[(R0 >> 8) & 0xff] ^ S2[(R0 >> 16) & 0xff] ^ S3[R0 >> 24]
+            T1 = S0[R1 >> 24] ^ S1[R1 & 0xff] ^ S2[(R1 >> 8) & 0xff] ^ S3[(R1 >> 16) & 0xff]
+            R2 = ((R2 << 1) | (R2 >> 31)) ^ (T0 + T1 + K[r-2])
+            R3 = R3 ^ (T0 + T1 + T1 + K[r-1])
+            R3 = (R3 >> 1) | (R3 << 31)
+
+        # Reverse input whitening
+        return numpy.stack([ R0 ^ K[0], R1 ^ K[1], R2 ^ K[2], R3 ^ K[3] ], axis=1)
+
+    @staticmethod
+    def _counters(hi, lo, n):
+        # n consecutive 128 bits big endian counter blocks, as little endian words
+        ctr = numpy.empty((n, 2), dtype=">u8")
+        ctr[:, 1] = numpy.arange(n, dtype=numpy.uint64) + numpy.uint64(lo)
+        ctr[:, 0] = numpy.uint64(hi) + (ctr[:, 1] < numpy.uint64(lo))
+
+        return ctr.view("<u4")
+
+if __name__ == "__main__":
+    # Test vectors
+    key = b"\x01\x23\x45\x67\x89\xab\xcd\xef\xfe\xdc\xba\x98\x76\x54\x32\x10\x00\x11\x22\x33\x44\x55\x66\x77"
+    plain = b"\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00"
+    expected = b"\xcf\xd1\xd2\xe5\xa9\xbe\x9c\xdf\x50\x1f\x13\xb8\x92\xbd\x22\x48"
+
+    data = os.urandom(1 << 20)
+    counter = b"\xff" * 12 + os.urandom(4)
+
+    twofish_ctx = Twofish(key)
+    numpy_ctx = TwofishNumpy(twofish_ctx)
+
+    res_test = (numpy_ctx.encrypt_ecb(plain, padding=False) == expected)
+
+    # Perform encryption
+    start = time.time_ns()
+
+    cipher_ecb = numpy_ctx.encrypt_ecb(data, padding=False)
+    decipher_ecb = numpy_ctx.decrypt_ecb(cipher_ecb, padding=False)
+    cipher_ctr = numpy_ctx.encrypt_ctr(counter, data[:-5])
+
+    end = time.time_ns()
+    elapsed_time = (end - start) / (10 ** 9)
+
+    res_test = res_test and (decipher_ecb == data)
+    res_test = res_test and (cipher_ecb == twofish_ctx.encrypt_ecb(data, padding=False))
+    res_test = res_test and (cipher_ctr == twofish_ctx.encrypt_ctr(counter, data[:-5]))
+
+    # Check tests
+    print("NumPy version" if numpy_ctx.use_numpy else "Pure Python fallback")
+    print("Test: ", res_test)
+    print("Time: ", elapsed_time, "s")
+
+    exit(0)
@@ -62,7 +62,7 @@ class Twofish:
         S = [ 0 for i in range(k) ]
 
         for i in range(k):
-            s = Twofish._MultRS(key[i*8:(i+1)*8])
+            s = Twofish._MultRS(m[i*8:(i+1)*8])
             S[k-i-1] = s[0] + (s[1] << 8) + (s[2] << 16) + (s[3] << 24)
 
         # Expanded Key Words Kj
@@ -81,6 +81,36 @@ class Twofish:
         y = [ (X >> (8 * i)) & 0xff for i in range(4) ]
         k = len(L)
 
+        q = Twofish._Q()
+
+        # actual H function
+        if k >= 4:
+            y = [ q[1][y[0]], q[0][y[1]], q[0][y[2]], q[1][y[3]] ]
+            l = [ (L[3] >> (8*i)) & 0xff for i in range(4) ]
+            y = [ y[i] ^ l[i] for i in range(4) ]
+
+        if k >= 3:
+            y = [ q[1][y[0]], q[1][y[1]], q[0][y[2]], q[0][y[3]] ]
+            l = [ (L[2] >> (8*i)) & 0xff for i in range(4) ]
+            y = [ y[i] ^ l[i] for i in range(4) ]
+
+        y = [ q[0][y[0]], q[1][y[1]], q[0][y[2]], q[1][y[3]] ]
+        l = [ (L[1] >> (8*i)) & 0xff for i in range(4) ]
+        y = [ y[i] ^ l[i] for i in range(4) ]
+
+        y = [ q[0][y[0]], q[0][y[1]], q[1][y[2]], q[1][y[3]] ]
+        l = [ (L[0] >> (8*i)) & 0xff for i in range(4) ]
+        y = [ y[i] ^ l[i] for i in range(4) ]
+
+        y = [ q[1][y[0]], q[0][y[1]], q[1][y[2]], q[0][y[3]] ]
+
+        z = Twofish._MultMDS(y)
+        Z = z[0] + (z[1] << 8) + (z[2] << 16) + (z[3] << 24)
+
+        return Z
+
+    @staticmethod
+    def _Q():
         # Build q0 and q1
         q = [ [ 0 for i in range(256) ] for i in range(2) ]
         t = [
@@ -111,31 +141,7 @@ class Twofish:
                 (a4, b4) = (t[i][2][a3], t[i][3][b3])
                 q[i][x] = (b4 << 4) | a4
 
-        # actual H function
-        if k >= 4:
-            y = [ q[1][y[0]], q[0][y[1]], q[0][y[2]], q[1][y[3]] ]
-            l = [ (L[3] >> (8*i)) & 0xff for i in range(4) ]
-            y = [ y[i] ^ l[i] for i in range(4) ]
-
-        if k >= 3:
-            y = [ q[1][y[0]], q[1][y[1]], q[0][y[2]], q[0][y[3]] ]
-            l = [ (L[2] >> (8*i)) & 0xff for i in range(4) ]
-            y = [ y[i] ^ l[i] for i in range(4) ]
-
-        y = [ q[0][y[0]], q[1][y[1]], q[0][y[2]], q[1][y[3]] ]
-        l = [ (L[1] >> (8*i)) & 0xff for i in range(4) ]
-        y = [ y[i] ^ l[i] for i in range(4) ]
-
-        y = [ q[0][y[0]], q[0][y[1]], q[1][y[2]], q[1][y[3]] ]
-        l = [ (L[0] >> (8*i)) & 0xff for i in range(4) ]
-        y = [ y[i] ^ l[i] for i in range(4) ]
-
-        y = [ q[1][y[0]], q[0][y[1]], q[1][y[2]], q[0][y[3]] ]
-
-        z = Twofish._MultMDS(y)
-        Z = z[0] + (z[1] << 8) + (z[2] << 16) + (z[3] << 24)
-
-        return Z
+        return q
 
     @staticmethod
     def _MultMDS(y):
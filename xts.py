@@ -0,0 +1,209 @@
+#!/usr/bin/env python
+
+import collections
+import os
+import threading
+import time
+
+from rijndael_fast import Rijndael
+
+class XTSError(Exception):
+    pass
+
+# Sectors handed to a worker at once by the parallel form
+BATCH_SZ = 64
+
+class XTS:
+    # XTS-AES (IEEE 1619, SP 800-38E) over independent data units ("sectors"). The key is key1 || key2, key1
+    # encrypts the data and key2 the sector numbers. A sector is at least one block, a partial last block
+    # uses ciphertext stealing.
+    def __init__(self, key):
+        if not len(key) in [ 32, 64 ]:
+            raise XTSError("Key length should be 32 or 64 bytes")
+
+        # IEEE 1619-2018 and SP 800-38E: both halves must differ
+        if key[:len(key) // 2] == key[len(key) // 2:]:
+            raise XTSError("Key halves must not be equal")
+
+        self._key = bytes(key)
+        self._ctx = Rijndael(key[:len(key) // 2])
+        self._tweak_ctx = Rijndael(key[len(key) // 2:])
+
+    def encrypt_sector(self, sector, data):
+        return self._sectors([ (sector, data) ], False)[0]
+
+    def decrypt_sector(self, sector, data):
+        return self._sectors([ (sector, data) ], True)[0]
+
+    def encrypt_sectors(self, jobs, executor=None):
+        # Encrypt a list of (sector number, data) jobs, in any order. With a concurrent.futures executor,
+        # batches of BATCH_SZ sectors are spread over it.
+        return self._run(jobs, False, executor)
+
+    def decrypt_sectors(self, jobs, executor=None):
+        return self._run(jobs, True, executor)
+
+    def _run(self, jobs, decrypt, executor):
+        if executor is None:
+            return self._sectors(jobs, decrypt)
+
+        futures = [ executor.submit(_sectors, self._key, jobs[i:i+BATCH_SZ], decrypt) for i in range(0, len(jobs), BATCH_SZ) ]
+
+        out = [ ]
+        for future in futures:
+            out += future.result()
+        return out
+
+    def _sectors(self, jobs, decrypt):
+        # Every sector goes through the same three bulk steps: XOR with its tweaks, one ECB call over the
+        # whole batch, XOR again. Only the stolen blocks are handled one sector at a time afterwards.
+        for (sector, data) in jobs:
+            if len(data) < 16:
+                raise XTSError("Sector length must be at least 16 bytes")
+
+        # First tweak of every sector: the sector number, 128 bits little endian, encrypted with key2
+        numbers = b"".join([ sector.to_bytes(16, byteorder="little") for (sector, data) in jobs ])
+        firsts = bytearray(len(numbers))
+        self._tweak_ctx._encrypt_blocks(numbers, firsts)
+
+        masks = [ ]
+        stolen = [ ]
+        for (i, (sector, data)) in enumerate(jobs):
+            # Doubling chain in GF(2^128), tweaks as little endian integers
+            t = int.from_bytes(firsts[16*i:16*i+16], byteorder="little")
+            tweaks = [ ]
+            for j in range((len(data) + 15) // 16):
+                tweaks.append(t)
+                t = ((t << 1) & 0xffffffffffffffffffffffffffffffff) ^ (0x87 if (t >> 127) else 0)
+
+            # With stealing, decryption of the last full block uses the tweak of the partial one
+            if len(data) % 16:
+                stolen.append((i, tweaks[-2], tweaks[-1]))
+                if decrypt:
+                    tweaks[-2] = tweaks[-1]
+                del tweaks[-1]
+
+            masks.append(b"".join([ t.to_bytes(16, byteorder="little") for t in tweaks ]))
+
+        mask = int.from_bytes(b"".join(masks), byteorder="little")
+        data = b"".join([ data[:len(data) & ~0xf] for (sector, data) in jobs ])
+
+        buf = bytearray((int.from_bytes(data, byteorder="little") ^ mask).to_bytes(len(data), byteorder="little"))
+        if decrypt:
+            self._ctx._decrypt_blocks(buf, buf)
+        else:
+            self._ctx._encrypt_blocks(buf, buf)
+        buf = (int.from_bytes(buf, byteorder="little") ^ mask).to_bytes(len(data), byteorder="little")
+
+        out = [ ]
+        off = 0
+        for (sector, data) in jobs:
+            n = len(data) & ~0xf
+            out.append(bytearray(buf[off:off+n]))
+            off += n
+
+        for (i, t_last, t_part) in stolen:
+            data = jobs[i][1]
+            n = len(data) & ~0xf
+            tail = bytes(data[n:])
+
+            # The partial block takes the head of the last full one, which is then redone with the remainder
+            prev = out[i][n-16:]
+            block = tail + prev[len(tail):]
+            if decrypt:
+                block = self._block(block, t_last, True)
+            else:
+                block = self._block(block, t_part, False)
+            out[i][n-16:] = block
+            out[i] += prev[:len(tail)]
+
+        return [ bytes(o) for o in out ]
+
+    def _block(self, block, tweak, decrypt):
+        t = tweak.to_bytes(16, byteorder="little")
+        x = bytes([ a ^ b for (a, b) in zip(block, t) ])
+        x = self._ctx.decrypt(x) if decrypt else self._ctx.encrypt(x)
+        return bytes([ a ^ b for (a, b) in zip(x, t) ])
+
+# Bounded LRU of the contexts of this process, by key, for the workers of the parallel form
+cache_size = 64
+_contexts = collections.OrderedDict()
+_contexts_lock = threading.Lock()
+
+def _sectors(key, jobs, decrypt):
+    with _contexts_lock:
+        ctx = _contexts.get(key)
+        if ctx is not None:
+            _contexts.move_to_end(key)
+
+    if ctx is None:
+        ctx = XTS(key)
+        with _contexts_lock:
+            _contexts[key] = ctx
+            while len(_contexts) > cache_size:
+                _contexts.popitem(last=False)
+
+    return ctx._sectors(jobs, decrypt)
+
+if __name__ == "__main__":
+    import concurrent.futures
+
+    # IEEE 1619 vectors 2, 3 and 15 (ciphertext stealing), vector 1 has equal key halves
+    vectors = [
+            (bytes([ 0x11 ]) * 16 + bytes([ 0x22 ]) * 16, 0x3333333333, bytes([ 0x44 ]) * 32, "c454185e6a16936e39334038acef838bfb186fff7480adc4289382ecd6d394f0"),
+            (bytes.fromhex("fffefdfcfbfaf9f8f7f6f5f4f3f2f1f0") + bytes([ 0x22 ]) * 16, 0x3333333333, bytes([ 0x44 ]) * 32, "af85336b597afc1a900b2eb21ec949d292df4c047e0b21532186a5971a227a89"),
+            (bytes.fromhex("fffefdfcfbfaf9f8f7f6f5f4f3f2f1f0bfbebdbcbbbab9b8b7b6b5b4b3b2b1b0"), 0x123456789a, bytes(range(17)), "6c1625db4671522d3d7599601de7ca09ed"),
+            ]
+
+    start = time.time_ns()
+
+    res_test = True
+    for (key, sector, plain, expected) in vectors:
+        xts = XTS(key)
+        cipher = xts.encrypt_sector(sector, plain)
+        res_test = res_test and (cipher == bytes.fromhex(expected)) and (xts.decrypt_sector(sector, cipher) == plain)
+
+    # Equal key halves are refused, e.g. the key of vector 1
+    for key in [ bytes(32), bytes([ 0x5a ]) * 64 ]:
+        try:
+            XTS(key)
+            res_test = False
+        except XTSError:
+            pass
+
+    # A batch of sectors of mixed lengths against one sector at a time, then through a process pool
+    xts = XTS(os.urandom(64))
+    jobs = [ (int.from_bytes(os.urandom(8), byteorder="little"), os.urandom(n)) for n in [ 4096, 16, 17, 31, 512, 4096, 100 ] * 20 ]
+    ciphers = xts.encrypt_sectors(jobs)
+    res_test = res_test and (ciphers == [ xts.encrypt_sector(sector, data) for (sector, data) in jobs ])
+    res_test = res_test and (xts.decrypt_sectors([ (sector, c) for ((sector, data), c) in zip(jobs, ciphers) ]) == [ data for (sector, data) in jobs ])
+
+    with concurrent.futures.ProcessPoolExecutor(2) as executor:
+        res_test = res_test and (xts.encrypt_sectors(jobs, executor) == ciphers)
+
+    # The worker cache keeps the most recently used keys only
+    keys = [ os.urandom(32) for i in range(cache_size + 8) ]
+    for key in keys:
+        _sectors(key, jobs[:1], False)
+    _sectors(keys[8], jobs[:1], False)
+    res_test = res_test and (len(_contexts) == cache_size) and (list(_contexts)[-1] == keys[8]) and not (keys[7] in _contexts)
+
+    end = time.time_ns()
+    elapsed_time = (end - start) / (10 ** 9)
+
+    # Throughput on 4 KiB sectors at random positions
+    jobs = [ (int.from_bytes(os.urandom(6), byteorder="little"), os.urandom(4096)) for i in range(64) ]
+    t = time.perf_counter_ns()
+    for (sector, data) in jobs:
+        xts.encrypt_sector(sector, data)
+    single = (time.perf_counter_ns() - t) / (10 ** 9)
+    t = time.perf_counter_ns()
+    xts.encrypt_sectors(jobs)
+    batch = (time.perf_counter_ns() - t) / (10 ** 9)
+
+    # Check tests
+    print("Rates: one sector per call %.3f MB/s, batch %.3f MB/s" % ((len(jobs) / 256) / single, (len(jobs) / 256) / batch))
+    print("Test: ", res_test)
+    print("Time: ", elapsed_time, "s")
+
+    exit(0)